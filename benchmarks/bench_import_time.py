@@ -0,0 +1,96 @@
+"""
+Import-time regression benchmark for the CLI entry point.
+
+Imports ``src.main`` in fresh interpreters, reports the best and median wall
+time, the slowest modules from ``python -X importtime``, and fails if any heavy
+dependency (PyMuPDF, python-docx, pandas, BeautifulSoup, requests, the Google
+API client, crewai) is imported at startup or the import exceeds a budget.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 10] [--max-ms 150]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+root_path = Path(__file__).resolve().parent.parent
+
+# Top-level packages that must only be imported when the pipeline actually needs them
+HEAVY_MODULES = ['fitz', 'docx', 'pandas', 'bs4', 'requests', 'googleapiclient', 'google.oauth2', 'crewai']
+
+TIMED_IMPORT = (
+    "import json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "import src.main\n"
+    "elapsed = time.perf_counter() - start\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(json.dumps([elapsed, heavy]))\n"
+)
+
+
+def timed_import():
+    """Import src.main in a fresh interpreter; return (seconds, heavy modules loaded)"""
+    result = subprocess.run(
+        [sys.executable, '-c', TIMED_IMPORT.format(heavy=HEAVY_MODULES)],
+        cwd=root_path, capture_output=True, text=True, check=True
+    )
+    elapsed, heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return elapsed, heavy
+
+
+def slowest_imports(limit):
+    """Return the modules with the largest cumulative import time, from -X importtime"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import src.main'],
+        cwd=root_path, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        rows.append((int(cumulative_us), name.strip()))
+    rows.sort(reverse=True)
+    return [{'module': name, 'cumulative_ms': round(us / 1000, 2)} for us, name in rows[:limit]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='fail if the best import time exceeds this many milliseconds')
+    parser.add_argument('--top', type=int, default=10, help='number of slowest modules to list')
+    args = parser.parse_args()
+
+    samples = []
+    heavy = []
+    for _ in range(args.repeat):
+        elapsed, heavy = timed_import()
+        samples.append(elapsed)
+
+    results = {
+        'repeat': args.repeat,
+        'best_ms': round(min(samples) * 1000, 2),
+        'median_ms': round(statistics.median(samples) * 1000, 2),
+        'heavy_modules_loaded': heavy,
+        'slowest_imports': slowest_imports(args.top),
+    }
+    print(json.dumps(results, indent=2))
+
+    failures = []
+    if heavy:
+        failures.append(f"heavy modules imported at startup: {', '.join(heavy)}")
+    if args.max_ms is not None and results['best_ms'] > args.max_ms:
+        failures.append(f"import took {results['best_ms']}ms, budget is {args.max_ms}ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
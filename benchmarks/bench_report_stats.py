@@ -0,0 +1,134 @@
+"""
+Benchmark report aggregation on a synthetic candidate pool.
+
+Compares the shared single-pass ReportStatistics against recomputing the
+aggregates separately for each report format (as the JSON and Markdown
+reports used to do), then times a full report generation run.
+
+Usage:
+    python benchmarks/bench_report_stats.py [--candidates 100000] [--seed 42]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root and src directory to Python path for proper imports
+root_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(root_path))
+sys.path.insert(0, str(root_path / 'src'))
+
+from src.utils.report_stats import ReportStatistics
+from src.utils.report_generator import ReportGenerator
+
+SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'SQL', 'Docker',
+    'Kubernetes', 'AWS', 'Git', 'Machine Learning', 'TensorFlow', 'PyTorch', 'GraphQL', 'CI/CD'
+]
+LANGUAGES = ['Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C++', 'C#', 'Shell']
+TOPICS = ['api', 'machine-learning', 'devops', 'web-development', 'cli', 'security', 'data-science']
+
+
+def make_candidates(count, seed):
+    """Generate a deterministic synthetic candidate pool"""
+    rng = random.Random(seed)
+    candidates = []
+    for i in range(count):
+        candidate = {
+            'email': f'candidate{i}@example.com',
+            'skills': rng.sample(SKILLS, rng.randint(0, 8)),
+            'experience_years': rng.randint(0, 15),
+            'total_score': round(rng.uniform(0, 100), 2),
+            'skills_score': round(rng.uniform(0, 100), 2),
+            'github_score': round(rng.uniform(0, 100), 2),
+            'github_username': '',
+            'github_data': None
+        }
+        if rng.random() < 0.6:
+            candidate['github_username'] = f'user{i}'
+            candidate['github_data'] = {
+                'repo_stats': {
+                    'total_repos': rng.randint(0, 80),
+                    'total_stars': rng.randint(0, 500),
+                    'languages': {lang: rng.randint(1, 10) for lang in rng.sample(LANGUAGES, rng.randint(0, 4))},
+                    'topics': {topic: rng.randint(1, 5) for topic in rng.sample(TOPICS, rng.randint(0, 3))}
+                },
+                'contribution_stats': {'total_contributions': rng.randint(0, 300)}
+            }
+        candidates.append(candidate)
+    return candidates
+
+
+def per_report_aggregates(candidates):
+    """Recompute every aggregate with a separate walk, once per report format"""
+    for _ in ('json', 'markdown'):
+        github_candidates = [c for c in candidates if c.get('github_username')]
+        sum((c.get('github_data') or {}).get('repo_stats', {}).get('total_repos', 0) for c in github_candidates)
+        sum((c.get('github_data') or {}).get('contribution_stats', {}).get('total_contributions', 0) for c in github_candidates)
+        sum((c.get('github_data') or {}).get('repo_stats', {}).get('total_stars', 0) for c in github_candidates)
+        sum(c.get('total_score', 0) for c in candidates)
+        all_languages, all_topics, all_skills = {}, {}, {}
+        for c in github_candidates:
+            repo_stats = (c.get('github_data') or {}).get('repo_stats', {})
+            for lang, count in repo_stats.get('languages', {}).items():
+                all_languages[lang] = all_languages.get(lang, 0) + count
+        for c in github_candidates:
+            repo_stats = (c.get('github_data') or {}).get('repo_stats', {})
+            for topic, count in repo_stats.get('topics', {}).items():
+                all_topics[topic] = all_topics.get(topic, 0) + count
+        for c in candidates:
+            for skill in c.get('skills', []):
+                all_skills[skill] = all_skills.get(skill, 0) + 1
+
+
+def timed(func, repeat):
+    """Return the best wall time of several runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--candidates', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    candidates = make_candidates(args.candidates, args.seed)
+
+    results = {
+        'candidates': args.candidates,
+        'seed': args.seed,
+        'per_report_aggregates_s': timed(lambda: per_report_aggregates(candidates), args.repeat),
+        'shared_statistics_s': timed(lambda: ReportStatistics.from_candidates(candidates), args.repeat),
+    }
+
+    config = {'output': {'format': 'ndjson', 'top_candidates': 10}}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for output_format in ('json', 'ndjson'):
+                config['output']['format'] = output_format
+                generator = ReportGenerator(config)
+                results[f'generate_reports_{output_format}_s'] = timed(
+                    lambda: generator.generate_reports(candidates), args.repeat
+                )
+        finally:
+            os.chdir(cwd)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
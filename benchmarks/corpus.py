@@ -0,0 +1,243 @@
+"""
+Deterministic synthetic resume corpus for the benchmark suite.
+
+Generates PDF and DOCX resumes in three sizes, each with and without tables,
+plus the GitHub JSON and LinkedIn/portfolio HTML fixtures for every
+candidate. The same seed always produces the same documents, so results
+measured on different commits are comparable.
+
+Usage:
+    python benchmarks/corpus.py --output benchmarks/corpus [--seed 42] [--per-variant 5]
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import textwrap
+import zipfile
+from pathlib import Path
+
+# Add project root and src directory to Python path for proper imports
+root_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(root_path))
+sys.path.insert(0, str(root_path / 'src'))
+
+from src.utils.mock_services import COMPANIES, SKILLS, TITLES, TOPICS, fake_identity, write_fixtures
+
+# Bump when the generated documents change so old results are not compared against new ones
+CORPUS_VERSION = 1
+
+FORMATS = ('pdf', 'docx')
+# Number of positions listed in the experience section
+SIZES = {'small': 2, 'medium': 8, 'large': 32}
+# Every Nth candidate has no GitHub link, to exercise the no-GitHub scoring path
+NO_GITHUB_EVERY = 5
+
+SENTENCES = [
+    "Designed and shipped {topic} services used by {n} internal teams.",
+    "Led the migration of a legacy monolith to {skill} and {skill2}.",
+    "Reduced p95 latency by {n}% by profiling hot paths and caching results.",
+    "Mentored {n} engineers and ran the weekly architecture review.",
+    "Built data pipelines in {skill} processing {n} million events per day.",
+    "Automated deployments with {skill} and cut release time from days to hours.",
+    "Wrote the on-call runbooks and owned incident reviews for the {topic} platform.",
+    "Introduced contract tests between {skill} services and the {skill2} gateway.",
+]
+
+PAGE_WIDTH, PAGE_HEIGHT, MARGIN = 595, 842, 50
+FIXED_ZIP_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def resume_blocks(identity, size, tables, with_github, rng):
+    """Build the resume as a list of ('heading' | 'para' | 'table', value) blocks."""
+    username = identity['username']
+    contact = [identity['email'], f"linkedin.com/in/{username}"]
+    if with_github:
+        contact.insert(1, f"github.com/{username}")
+    blocks = [
+        ('heading', identity['name']),
+        ('para', ' | '.join(contact)),
+        ('heading', 'Summary'),
+        ('para', f"Engineer with {identity['experience_years']} years of experience building "
+                 f"{rng.choice(TOPICS)} systems."),
+        ('heading', 'Skills'),
+    ]
+    if tables:
+        rows = [['Skill', 'Level', 'Years']]
+        rows += [[skill, rng.choice(['Expert', 'Advanced', 'Intermediate']), str(rng.randint(1, 10))]
+                 for skill in identity['skills']]
+        blocks.append(('table', rows))
+    else:
+        blocks.append(('para', 'Skills: ' + ', '.join(identity['skills'])))
+
+    blocks.append(('heading', 'Experience'))
+    positions = [(rng.choice(TITLES), rng.choice(COMPANIES), 2023 - 2 * i) for i in range(SIZES[size])]
+    if tables:
+        rows = [['Company', 'Title', 'Period']]
+        rows += [[company, title, f"{year - 2} - {year}"] for title, company, year in positions]
+        blocks.append(('table', rows))
+    for title, company, year in positions:
+        blocks.append(('para', f"{title}, {company} ({year - 2} - {year})"))
+        sentences = []
+        for _ in range(rng.randint(4, 8)):
+            skill, skill2 = rng.sample(identity['skills'], 2)
+            sentences.append(rng.choice(SENTENCES).format(
+                topic=rng.choice(TOPICS), skill=skill, skill2=skill2, n=rng.randint(2, 90)))
+        blocks.append(('para', ' '.join(sentences)))
+
+    blocks.append(('heading', 'Education'))
+    blocks.append(('para', f"{identity['degree']} in Computer Science, {identity['school']}"))
+    return blocks
+
+
+def render_pdf(blocks):
+    import fitz
+
+    doc = fitz.open()
+    state = {'page': None, 'y': PAGE_HEIGHT}
+
+    def ensure_space(height):
+        if state['page'] is None or state['y'] + height > PAGE_HEIGHT - MARGIN:
+            state['page'] = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            state['y'] = MARGIN
+        return state['page']
+
+    for kind, value in blocks:
+        if kind == 'heading':
+            page = ensure_space(28)
+            state['y'] += 18
+            page.insert_text((MARGIN, state['y']), value, fontsize=13, fontname='hebo')
+            state['y'] += 8
+        elif kind == 'para':
+            for line in textwrap.wrap(value, 95):
+                page = ensure_space(13)
+                state['y'] += 13
+                page.insert_text((MARGIN, state['y']), line, fontsize=10, fontname='helv')
+            state['y'] += 4
+        else:
+            col_width = (PAGE_WIDTH - 2 * MARGIN) / len(value[0])
+            for row in value:
+                page = ensure_space(18)
+                top = state['y'] + 2
+                for col, cell in enumerate(row):
+                    rect = fitz.Rect(MARGIN + col * col_width, top, MARGIN + (col + 1) * col_width, top + 16)
+                    page.draw_rect(rect, color=(0, 0, 0), width=0.5)
+                    page.insert_text((rect.x0 + 3, rect.y1 - 4), cell, fontsize=9, fontname='helv')
+                state['y'] = top + 16
+            state['y'] += 6
+
+    doc.set_metadata({})
+    data = doc.tobytes(garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return data
+
+
+def render_docx(blocks):
+    import docx
+
+    document = docx.Document()
+    for kind, value in blocks:
+        if kind == 'heading':
+            document.add_heading(value, level=1)
+        elif kind == 'para':
+            document.add_paragraph(value)
+        else:
+            table = document.add_table(rows=len(value), cols=len(value[0]))
+            table.style = 'Table Grid'
+            for row, cells in zip(table.rows, value):
+                for cell, text in zip(row.cells, cells):
+                    cell.text = text
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return normalize_zip(buffer.getvalue())
+
+
+def normalize_zip(data):
+    """Rewrite a zip archive with fixed timestamps so identical content gives identical bytes."""
+    source = zipfile.ZipFile(io.BytesIO(data))
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            target.writestr(zipfile.ZipInfo(info.filename, FIXED_ZIP_TIME), source.read(info.filename),
+                            compress_type=zipfile.ZIP_DEFLATED)
+    return output.getvalue()
+
+
+def generate_corpus(output_dir, seed=42, per_variant=5):
+    """Generate resumes, fixtures and manifest.json into ``output_dir`` and return the manifest."""
+    resumes_dir = os.path.join(output_dir, 'resumes')
+    fixtures_dir = os.path.join(output_dir, 'fixtures')
+    for path in (resumes_dir, fixtures_dir):
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+
+    documents = []
+    index = 0
+    for file_format in FORMATS:
+        for size in SIZES:
+            for tables in (False, True):
+                for _ in range(per_variant):
+                    identity = fake_identity(seed, index)
+                    rng = random.Random(f"{seed}:resume:{index}")
+                    with_github = index % NO_GITHUB_EVERY != NO_GITHUB_EVERY - 1
+                    blocks = resume_blocks(identity, size, tables, with_github, rng)
+                    data = render_pdf(blocks) if file_format == 'pdf' else render_docx(blocks)
+
+                    filename = f"{index:04d}-{size}-{'tables' if tables else 'plain'}.{file_format}"
+                    with open(os.path.join(resumes_dir, filename), 'wb') as f:
+                        f.write(data)
+                    documents.append({
+                        'filename': filename,
+                        'format': file_format,
+                        'size': size,
+                        'tables': tables,
+                        'bytes': len(data),
+                        'email': identity['email'],
+                        'username': identity['username'],
+                        'github': with_github,
+                    })
+                    index += 1
+
+    write_fixtures(fixtures_dir, seed, [doc['username'] for doc in documents])
+    manifest = {
+        'corpus_version': CORPUS_VERSION,
+        'seed': seed,
+        'per_variant': per_variant,
+        'documents': documents,
+    }
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_corpus(output_dir, seed=42, per_variant=5):
+    """Return the manifest of an existing corpus, regenerating it if it was built differently."""
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if (manifest.get('corpus_version'), manifest.get('seed'), manifest.get('per_variant')) == \
+                (CORPUS_VERSION, seed, per_variant):
+            return manifest
+    return generate_corpus(output_dir, seed, per_variant)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default=str(root_path / 'benchmarks' / 'corpus'))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--per-variant', type=int, default=5,
+                        help='documents per format/size/tables combination')
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.output, args.seed, args.per_variant)
+    total_bytes = sum(doc['bytes'] for doc in manifest['documents'])
+    print(f"Generated {len(manifest['documents'])} resumes ({total_bytes / 1024:.0f} KiB) in {args.output}")
+
+
+if __name__ == '__main__':
+    main()
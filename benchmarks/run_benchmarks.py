@@ -0,0 +1,270 @@
+"""
+Throughput benchmarks on the synthetic resume corpus.
+
+Measures parsing, scoring, enrichment (GitHub, LinkedIn and skills
+verification against the local mock services) and report generation.
+Results are written as JSON tagged with the git commit and the corpus
+version, so runs on different commits can be compared with ``--compare``.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--seed 42] [--per-variant 5] [--compare results/<commit>.json]
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import toml
+
+# Add project root and src directory to Python path for proper imports
+root_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(root_path))
+sys.path.insert(0, str(root_path / 'src'))
+
+from benchmarks.corpus import load_corpus
+from src.agents.github_agent import GitHubAgent
+from src.agents.linkedin_agent import LinkedInAgent
+from src.agents.skills_verifier import SkillsVerifier
+from src.utils.error_handler import ErrorHandler
+from src.utils.metrics import PipelineMetrics
+from src.utils.mock_services import MockServiceServer
+from src.utils.parsers import ResumeParser
+from src.utils.profiling import ParseProfiler
+from src.utils.report_generator import ReportGenerator
+
+# Bump when stages are added or measured differently
+BENCHMARK_VERSION = 1
+
+
+class StubGitHubAuth:
+    """GitHubAuth stand-in; the mock services do not check credentials"""
+    def get_headers(self):
+        return {'Accept': 'application/vnd.github.v3+json'}
+
+
+def load_config():
+    """Load the same configuration files as the main pipeline"""
+    config_dir = root_path / 'src' / 'config'
+    criteria = toml.load(config_dir / 'criteria.toml')
+    api_config = toml.load(config_dir / 'api_config.toml')
+    return {**criteria, **api_config}
+
+
+def git_revision():
+    """Return (commit, dirty) for the working tree, or (None, None) outside git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root_path, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root_path,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return commit, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def bench_parse(metrics, corpus_dir, manifest, repeat):
+    """Parse every resume ``repeat`` times; returns the candidates from the last pass"""
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False))
+    documents = []
+    for doc in manifest['documents']:
+        with open(os.path.join(corpus_dir, 'resumes', doc['filename']), 'rb') as f:
+            documents.append((doc, f.read()))
+
+    candidates = []
+    for _ in range(repeat):
+        candidates = []
+        for doc, data in documents:
+            variant = f"parse.{doc['format']}.{doc['size']}.{'tables' if doc['tables'] else 'plain'}"
+            start = time.perf_counter()
+            result = parser.parse_resume(doc['filename'], io.BytesIO(data))
+            duration = time.perf_counter() - start
+            error = bool(result.get('error'))
+            metrics.record('parse', duration, items=1, nbytes=len(data), error=error)
+            metrics.record(variant, duration, items=1, nbytes=len(data), error=error)
+            if not error:
+                candidates.append(result)
+    return candidates
+
+
+def attach_github_usernames(candidates, manifest):
+    """Fill in GitHub usernames from the manifest so enrichment is measured independently of extraction"""
+    linked = {doc['filename']: doc['username'] for doc in manifest['documents'] if doc['github']}
+    for candidate in candidates:
+        if not candidate.get('github_username') and candidate['filename'] in linked:
+            candidate['github_username'] = linked[candidate['filename']]
+
+
+def load_github_fixture(fixtures_dir, username):
+    github_dir = os.path.join(fixtures_dir, 'github', username)
+    data = {}
+    for name in ('user', 'repos', 'events'):
+        with open(os.path.join(github_dir, f"{name}.json")) as f:
+            data[name] = json.load(f)
+    return data
+
+
+def bench_score(metrics, config, candidates, fixtures_dir, rounds):
+    """Score pre-enriched candidates ``rounds`` times without any network access"""
+    agent = GitHubAgent(config, StubGitHubAuth(), ErrorHandler(), metrics=PipelineMetrics())
+    github_data = {}
+    for candidate in candidates:
+        username = candidate.get('github_username')
+        if username and username not in github_data:
+            fixture = load_github_fixture(fixtures_dir, username)
+            github_data[username] = {
+                'contribution_stats': agent.logic.calculate_contribution_stats(fixture['events']),
+                'repo_stats': agent.logic.calculate_repo_stats(fixture['repos']),
+            }
+
+    pool = [dict(candidate) for candidate in candidates]
+    for _ in range(rounds):
+        with metrics.timer('score', items=len(pool)):
+            for candidate in pool:
+                candidate['github_score'] = agent.calculate_github_score(github_data.get(candidate.get('github_username')))
+                candidate['skills_score'] = agent.calculate_skills_score(candidate['skills'])
+                candidate['experience_score'] = agent.calculate_experience_score(candidate['experience_years'])
+                candidate['education_score'] = agent.calculate_education_score(candidate['education'])
+                agent.calculate_total_score(candidate)
+
+
+def bench_enrich(metrics, config, candidates, fixtures_dir, usernames):
+    """Enrich candidates against the mock services; returns the enriched candidates"""
+    error_handler = ErrorHandler()
+    with MockServiceServer(fixtures_dir=fixtures_dir) as server:
+        overrides = server.config_overrides()
+        enrich_config = dict(config)
+        for section, values in overrides.items():
+            enrich_config[section] = {**config.get(section, {}), **values}
+
+        github_agent = GitHubAgent(enrich_config, StubGitHubAuth(), error_handler, metrics=metrics)
+        linkedin_agent = LinkedInAgent(enrich_config, error_handler, metrics=metrics)
+        skills_verifier = SkillsVerifier(enrich_config, error_handler, metrics=metrics)
+
+        pool = [dict(candidate) for candidate in candidates]
+        for candidate in pool:
+            username = usernames[candidate['filename']]
+            candidate['linkedin_url'] = server.linkedin_url(username)
+            candidate['portfolio_url'] = server.portfolio_url(username)
+
+        with metrics.timer('enrich.github', items=len(pool)):
+            github_agent.enrich_candidates(pool)
+        with metrics.timer('enrich.linkedin', items=len(pool)):
+            for candidate in pool:
+                candidate['linkedin_data'] = linkedin_agent.get_public_profile(usernames[candidate['filename']])
+        with metrics.timer('enrich.verify', items=len(pool)):
+            for candidate in pool:
+                candidate['verification'] = skills_verifier.verify_skills(candidate)
+    return pool
+
+
+def bench_report(metrics, config, candidates, report_candidates):
+    """Generate each report format for a pool of ``report_candidates`` candidates"""
+    pool = []
+    for i in range(report_candidates):
+        candidate = dict(candidates[i % len(candidates)])
+        candidate['email'] = f"{i}-{candidate.get('email', '')}"
+        pool.append(candidate)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for output_format in ('json', 'ndjson', 'markdown'):
+                report_config = {**config, 'output': {**config.get('output', {}), 'format': output_format}}
+                report_config['output'].pop('columnar_format', None)
+                generator = ReportGenerator(report_config)
+                with metrics.timer(f'report.{output_format}', items=len(pool)):
+                    generator.generate_reports(pool)
+        finally:
+            os.chdir(cwd)
+
+
+def compare(baseline, current):
+    """Print per-stage throughput of ``current`` relative to ``baseline``"""
+    print(f"\nCompared with {(baseline.get('commit') or 'unknown')[:12]}:")
+    if baseline.get('corpus') != current.get('corpus'):
+        print("  warning: corpus differs, results are not directly comparable")
+    for stage, stats in current['stages'].items():
+        before = baseline.get('stages', {}).get(stage)
+        if not before or not stats['items_per_second'] or not before['items_per_second']:
+            continue
+        ratio = stats['items_per_second'] / before['items_per_second']
+        print(f"  {stage:<32} {before['items_per_second']:>12.1f} -> {stats['items_per_second']:>12.1f} items/s ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--corpus', default=str(root_path / 'benchmarks' / 'corpus'),
+                        help='corpus directory, generated if missing or built with other settings')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--per-variant', type=int, default=5,
+                        help='documents per format/size/tables combination')
+    parser.add_argument('--parse-repeat', type=int, default=3)
+    parser.add_argument('--score-rounds', type=int, default=200)
+    parser.add_argument('--report-candidates', type=int, default=10000)
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    args = parser.parse_args()
+
+    manifest = load_corpus(args.corpus, args.seed, args.per_variant)
+    fixtures_dir = os.path.join(args.corpus, 'fixtures')
+    usernames = {doc['filename']: doc['username'] for doc in manifest['documents']}
+    config = load_config()
+    metrics = PipelineMetrics()
+
+    candidates = bench_parse(metrics, args.corpus, manifest, args.parse_repeat)
+    if not candidates:
+        print("No resumes could be parsed; check that pymupdf and python-docx are installed")
+        sys.exit(1)
+    attach_github_usernames(candidates, manifest)
+    bench_score(metrics, config, candidates, fixtures_dir, args.score_rounds)
+    enriched = bench_enrich(metrics, config, candidates, fixtures_dir, usernames)
+    bench_report(metrics, config, enriched, args.report_candidates)
+
+    commit, dirty = git_revision()
+    results = {
+        'benchmark_version': BENCHMARK_VERSION,
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'corpus': {
+            'corpus_version': manifest['corpus_version'],
+            'seed': manifest['seed'],
+            'documents': len(manifest['documents']),
+            'bytes': sum(doc['bytes'] for doc in manifest['documents']),
+        },
+        'settings': {
+            'parse_repeat': args.parse_repeat,
+            'score_rounds': args.score_rounds,
+            'report_candidates': args.report_candidates,
+        },
+        'stages': metrics.summary()['stages'],
+    }
+
+    output = args.output or str(root_path / 'benchmarks' / 'results' / f"{(commit or 'unknown')[:12]}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    for stage, stats in results['stages'].items():
+        print(f"{stage:<32} {stats['calls']:>6} calls  p50 {stats['p50_seconds'] * 1000:>9.3f} ms  "
+              f"p95 {stats['p95_seconds'] * 1000:>9.3f} ms  {stats['items_per_second']:>12.1f} items/s")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,34 +1,52 @@
-from typing import Dict, Any, Optional, List
+import os
+import sqlite3
+from typing import Callable, Dict, Any, Optional, Iterator, List
 from src.utils.error_handler import ErrorHandler
-import base64
-import io
+from src.utils.metrics import PipelineMetrics
+from src.utils.logger import get_logger
+from src.utils.attachment_store import AttachmentStore
+from src.utils.blob_store import create_blob_store
+from src.utils.gmail_query import resolve_gmail_query, resolve_max_results
+
+RESUME_MIME_TYPES = {
+    '.pdf': {'application/pdf', 'application/x-pdf'},
+    '.docx': {'application/vnd.openxmlformats-officedocument.wordprocessingml.document'},
+}
+# Sent by some mail clients for any attachment; the extension decides
+GENERIC_MIME_TYPES = {'application/octet-stream'}
+
+PART_FIELDS = 'partId,filename,mimeType,body(size,attachmentId)'
+
+def parts_fields_mask(depth: int) -> str:
+    """Gmail ``fields`` mask selecting ``depth`` levels of nested parts without body data"""
+    mask = PART_FIELDS
+    for _ in range(depth - 1):
+        mask = f"{PART_FIELDS},parts({mask})"
+    return f"parts({mask})"
+
+# Headers and the part tree only; no inline body data is transferred
+MESSAGE_FIELDS = f"id,payload(headers(name,value),mimeType,{parts_fields_mask(4)})"
 
 class EmailAgent:
-    def __init__(self, gmail_service: Any, config: Dict[str, Any], error_handler: Optional[ErrorHandler] = None):
+    def __init__(self, gmail_service: Any, config: Dict[str, Any], error_handler: Optional[ErrorHandler] = None,
+                 metrics: Optional[PipelineMetrics] = None):
         self.gmail_service = gmail_service
         self.config = config
         self.error_handler = error_handler
+        self.metrics = metrics or PipelineMetrics()
+        self.attachment_store = AttachmentStore(config)
+        # Raw attachments are kept so they can be reparsed without Gmail
+        self.blob_store = create_blob_store(config)
+        self.logger = get_logger('email_agent')
+        self.query = resolve_gmail_query(config)
+        self.max_results = resolve_max_results(config)
 
     def fetch_attachments(self) -> List[Dict]:
         """Fetch resume attachments from received Gmail messages"""
         try:
-            # Modify query to only fetch received emails
-            base_query = self.config['gmail']['query']
-            received_query = f"{base_query} in:inbox -from:me"
-            max_results = self.config['gmail']['max_results']
-            
-            # Search for received emails with attachments
-            results = self.gmail_service.users().messages().list(
-                userId='me',
-                q=received_query,
-                maxResults=max_results
-            ).execute()
-            
-            messages = results.get('messages', [])
             attachments = []
-            
-            for message in messages:
-                message_attachments = self.process_message(message['id'])
+            for message_id in self.list_message_ids():
+                message_attachments = self.process_message(message_id)
                 attachments.extend(message_attachments)
             
             return attachments
@@ -37,39 +55,106 @@ class EmailAgent:
             self.error_handler.handle_gmail_error(e, {'action': 'fetch_attachments'})
             return []
 
+    def list_message_ids(self, seen: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """List IDs of received messages matching the configured query, newest first
+        
+        Without ``seen`` only the first page (``max_results`` messages) is
+        listed. With it, further pages are followed until a page whose messages
+        have all been seen, so more than a page of new mail between two polls
+        is not missed.
+        """
+        # Modify query to only fetch received emails
+        base_query = self.query
+        received_query = f"{base_query} in:inbox -from:me"
+        message_ids: List[str] = []
+        page_token = None
+        while True:
+            params = {'userId': 'me', 'q': received_query, 'maxResults': self.max_results}
+            if page_token:
+                params['pageToken'] = page_token
+            # Search for received emails with attachments
+            with self.metrics.timer('gmail.messages.list') as timer:
+                results = self.gmail_service.users().messages().list(**params).execute()
+                timer.items = len(results.get('messages', []))
+            page = [message['id'] for message in results.get('messages', [])]
+            message_ids.extend(page)
+            page_token = results.get('nextPageToken')
+            if seen is None or not page_token or all(seen(message_id) for message_id in page):
+                return message_ids
+
     def process_message(self, message_id: str) -> List[Dict]:
         """Process individual message for attachments"""
         try:
+            return self.fetch_message(message_id)
+        except Exception as e:
+            self.error_handler.handle_gmail_error(e, {'message_id': message_id})
+            return []
+
+    def fetch_message(self, message_id: str) -> List[Dict]:
+        """Download a message's resume attachments; Gmail errors are raised, not swallowed"""
+        attachments = []
+        for part in self.list_resume_parts(message_id):
+            attachment_data = self.fetch_attachment(message_id, part)
+            if attachment_data:
+                attachments.append({
+                    'filename': part['filename'],
+                    'content': attachment_data,
+                    'message_id': message_id
+                })
+        return attachments
+
+    def list_resume_parts(self, message_id: str) -> List[Dict]:
+        """Return the resume attachment parts of a received message without downloading them
+        
+        Only the headers and the part structure are requested: ``format='metadata'``
+        omits the parts, so the full format is used with a ``fields`` mask that
+        leaves out every body's data. Parts that are too large or have a MIME type
+        that does not match their extension are rejected here, before any
+        attachment bytes are transferred.
+        """
+        with self.metrics.timer('gmail.messages.get', items=1):
             message = self.gmail_service.users().messages().get(
                 userId='me',
-                id=message_id
+                id=message_id,
+                format='full',
+                fields=MESSAGE_FIELDS
             ).execute()
-            
-            # Skip if message is from the user
-            headers = message['payload']['headers']
-            from_header = next((h['value'] for h in headers if h['name'].lower() == 'from'), '')
-            if 'me' in from_header.lower():
-                return []
-            
-            attachments = []
-            payload = message['payload']
-            
-            if 'parts' in payload:
-                for part in payload['parts']:
-                    if part.get('filename') and self.is_resume_file(part['filename']):
-                        attachment_data = self.download_attachment(message_id, part)
-                        if attachment_data:
-                            attachments.append({
-                                'filename': part['filename'],
-                                'content': attachment_data,
-                                'message_id': message_id
-                            })
-            
-            return attachments
-            
-        except Exception as e:
-            self.error_handler.handle_gmail_error(e, {'message_id': message_id})
+        
+        # Skip if message is from the user
+        headers = message['payload'].get('headers', [])
+        from_header = next((h['value'] for h in headers if h['name'].lower() == 'from'), '')
+        if 'me' in from_header.lower():
             return []
+        
+        size_limit = self.config['gmail']['attachment_size_limit']
+        parts = []
+        for part in self.iter_parts(message['payload']):
+            filename = part.get('filename')
+            if not filename or not self.is_resume_file(filename):
+                continue
+            size = part.get('body', {}).get('size', 0)
+            if size > size_limit:
+                self.logger.debug("Skipping %s in %s: %d bytes exceeds the %d byte limit",
+                                  filename, message_id, size, size_limit)
+                continue
+            if not self.has_resume_mime_type(filename, part.get('mimeType', '')):
+                self.logger.debug("Skipping %s in %s: MIME type %s does not match its extension",
+                                  filename, message_id, part.get('mimeType'))
+                continue
+            parts.append(part)
+        return parts
+
+    def iter_parts(self, part: Dict) -> Iterator[Dict]:
+        """Walk a MIME part tree depth-first; attachments may sit inside nested multiparts"""
+        for child in part.get('parts', []):
+            yield child
+            yield from self.iter_parts(child)
+
+    def has_resume_mime_type(self, filename: str, mime_type: str) -> bool:
+        """Check that a part's declared MIME type fits its resume extension"""
+        extension = os.path.splitext(filename)[1].lower()
+        mime_type = mime_type.split(';', 1)[0].strip().lower()
+        return mime_type in RESUME_MIME_TYPES.get(extension, ()) or mime_type in GENERIC_MIME_TYPES
 
     def is_resume_file(self, filename: str) -> bool:
         """Check if file is a resume"""
@@ -79,22 +164,35 @@ class EmailAgent:
     def download_attachment(self, message_id: str, part: Dict) -> Any:
         """Download attachment content"""
         try:
-            attachment_id = part['body']['attachmentId']
+            return self.fetch_attachment(message_id, part)
+        except Exception as e:
+            self.error_handler.handle_gmail_error(e, {'attachment_id': part.get('body', {}).get('attachmentId')})
+            return None
+
+    def fetch_attachment(self, message_id: str, part: Dict) -> Any:
+        """Download attachment content, or None if it is over the size limit; Gmail errors are raised"""
+        attachment_id = part['body']['attachmentId']
+        with self.metrics.timer('gmail.attachments.get', items=1) as timer:
             attachment = self.gmail_service.users().messages().attachments().get(
                 userId='me',
                 messageId=message_id,
                 id=attachment_id
             ).execute()
             
-            data = attachment['data']
-            content = base64.urlsafe_b64decode(data)
-            
-            # Check file size
-            if len(content) > self.config['gmail']['attachment_size_limit']:
-                return None
-            
-            return io.BytesIO(content)
-            
-        except Exception as e:
-            self.error_handler.handle_gmail_error(e, {'attachment_id': attachment_id})
-            return None
\ No newline at end of file
+            # Large attachments are decoded into a temporary file instead of memory
+            content = self.attachment_store.from_base64(attachment['data'])
+            timer.bytes = content.size
+        
+        # Check file size
+        if content.size > self.config['gmail']['attachment_size_limit']:
+            content.release()
+            return None
+        
+        if self.blob_store is not None:
+            try:
+                self.blob_store.store_attachment(message_id, part['filename'], content)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning("Could not store attachment %s of message %s: %s",
+                                    part['filename'], message_id, e)
+        
+        return content
@@ -1,34 +1,59 @@
 # filepath: c:\Users\USER\resume-evaluator\src\agents\github_agent.py
-import requests
 import json
+import time
+from src.utils.criteria import CompiledCriteria
+from src.utils.metrics import PipelineMetrics
+from src.utils.scoring import CandidateScorer
+from src.utils.transport import create_transport
 
 class GitHubLogic:
     """GitHub API logic separate from CrewAI Agent"""
-    def __init__(self, auth, config, error_handler):
+    def __init__(self, auth, config, error_handler, metrics=None, transport=None):
         self.auth = auth
         self.config = config
         self.error_handler = error_handler
+        self.metrics = metrics or PipelineMetrics()
+        self.transport = transport or create_transport(config)
+        # username -> (fetched_at, profile); entries older than github.cache_ttl seconds are refetched
         self.cache = {}
+        self.cache_ttl = config.get('github', {}).get('cache_ttl') if isinstance(config, dict) else None
 
     def get_user_data(self, username):
         """Get GitHub user data"""
-        if username in self.cache:
-            return self.cache[username]
+        with self.metrics.timer('github.user_data', items=1) as timer:
+            entry = self.cache.get(username)
+            timer.cache_hit = entry is not None and (
+                self.cache_ttl is None or time.monotonic() - entry[0] < self.cache_ttl
+            )
+            if timer.cache_hit:
+                return entry[1]
+            return self.fetch_user_data(username)
+
+    def request(self, url):
+        """Issue a GitHub API GET request and record its timing"""
+        with self.metrics.timer('github.request', items=1) as timer:
+            response = self.transport.get(url, headers=self.auth.get_headers())
+            timer.bytes = len(response.content)
+            timer.error = response.status_code != 200
+            return response
+
+    def fetch_user_data(self, username):
+        """Fetch GitHub user data from the API and cache it"""
         try:
             user_url = f"{self.config['github']['api_url']}/users/{username}"
-            user_response = requests.get(user_url, headers=self.auth.get_headers())
+            user_response = self.request(user_url)
             if user_response.status_code != 200:
                 return None
             user_data = user_response.json()
             
             # Get repositories
             repos_url = f"{self.config['github']['api_url']}/users/{username}/repos"
-            repos_response = requests.get(repos_url, headers=self.auth.get_headers())
+            repos_response = self.request(repos_url)
             repos_data = repos_response.json() if repos_response.status_code == 200 else []
             
             # Get events (contributions)
             events_url = f"{self.config['github']['api_url']}/users/{username}/events"
-            events_response = requests.get(events_url, headers=self.auth.get_headers())
+            events_response = self.request(events_url)
             events_data = events_response.json() if events_response.status_code == 200 else []
             
             # Calculate contribution statistics
@@ -44,7 +69,7 @@ class GitHubLogic:
                 'contribution_stats': contribution_stats,
                 'repo_stats': self.calculate_repo_stats(repos_data)
             }
-            self.cache[username] = github_profile
+            self.cache[username] = (time.monotonic(), github_profile)
             return github_profile
         except Exception as e:
             self.error_handler.handle_github_error(e, {'username': username})
@@ -115,11 +140,15 @@ class GitHubLogic:
         return event_date > datetime.now() - timedelta(days=30)
 
 class GitHubAgent:
-    def __init__(self, config, github_auth, error_handler):
+    def __init__(self, config, github_auth, error_handler, criteria=None, metrics=None, transport=None):
         self.config = config
         self.github_auth = github_auth
         self.error_handler = error_handler
-        self.logic = GitHubLogic(github_auth, config, error_handler)
+        self.criteria = criteria or CompiledCriteria(config)
+        self.scorer = CandidateScorer(config, self.criteria)
+        self.metrics = metrics or PipelineMetrics()
+        self.transport = transport or create_transport(config)
+        self.logic = GitHubLogic(github_auth, config, error_handler, metrics=self.metrics, transport=self.transport)
 
     def enrich_candidates(self, candidates):
         """Enrich candidates with GitHub data"""
@@ -145,94 +174,20 @@ class GitHubAgent:
 
     def calculate_github_score(self, github_data):
         """Calculate GitHub contribution score"""
-        if not github_data:
-            return 0
-        
-        score = 0
-        contribution_stats = github_data.get('contribution_stats', {})
-        repo_stats = github_data.get('repo_stats', {})
-        
-        # Repository score (30 points)
-        total_repos = repo_stats.get('total_repos', 0)
-        min_repos = self.config.get('github', {}).get('min_repos', 3)
-        if total_repos >= min_repos:
-            score += 30
-        elif total_repos > 0:
-            score += (total_repos / min_repos) * 30
-        
-        # Contribution score (40 points)
-        total_contributions = contribution_stats.get('total_contributions', 0)
-        if total_contributions >= 50:
-            score += 40
-        elif total_contributions > 0:
-            score += (total_contributions / 50) * 40
-        
-        # Recent activity score (20 points)
-        recent_activity = contribution_stats.get('recent_activity', 0)
-        if recent_activity >= 10:
-            score += 20
-        elif recent_activity > 0:
-            score += (recent_activity / 10) * 20
-        
-        # Repository quality score (10 points)
-        total_stars = repo_stats.get('total_stars', 0)
-        if total_stars >= 100:
-            score += 10
-        elif total_stars > 0:
-            score += (total_stars / 100) * 10
-        
-        return min(score, 100)
+        return self.scorer.calculate_github_score(github_data)
 
     def calculate_skills_score(self, skills):
         """Calculate skills score based on criteria"""
-        if not skills:
-            return 0
-        required_skills = self.config['skills']['required']
-        preferred_skills = self.config['skills']['preferred']
-        bonus_skills = self.config['skills']['bonus']
-        score = 0
-        required_count = sum(1 for skill in required_skills if skill in skills)
-        preferred_count = sum(1 for skill in preferred_skills if skill in skills)
-        bonus_count = sum(1 for skill in bonus_skills if skill in skills)
-        # Scoring formula
-        score = (required_count / len(required_skills)) * 60
-        score += (preferred_count / len(preferred_skills)) * 30
-        score += min(bonus_count * 5, 10)
-        return min(score, 100)
+        return self.scorer.calculate_skills_score(skills)
 
     def calculate_experience_score(self, years):
         """Calculate experience score"""
-        if years < self.config['experience']['minimum_years']:
-            return 0
-        senior_threshold = self.config['experience']['senior_threshold']
-        if years >= senior_threshold:
-            return 100
-        return (years / senior_threshold) * 100
+        return self.scorer.calculate_experience_score(years)
 
     def calculate_education_score(self, education):
         """Calculate education score"""
-        if not education:
-            return 0
-        accepted_degrees = self.config['education']['accepted_degrees']
-        for degree in accepted_degrees:
-            if degree.lower() in education.lower():
-                return 100
-        return 50  # Partial credit for other education
+        return self.scorer.calculate_education_score(education)
 
     def calculate_total_score(self, candidate):
         """Calculate weighted total score"""
-        github_config = self.config.get('github', {})
-        experience_config = self.config.get('experience', {})
-        education_config = self.config.get('education', {})
-        skills_weight = 0.4  # Default for skills
-        experience_weight = experience_config.get('weight', 0.3)
-        education_weight = education_config.get('weight', 0.3)
-        github_weight = github_config.get('weight', 0.4)
-        total = (
-            candidate.get('skills_score', 0) * skills_weight +
-            candidate.get('experience_score', 0) * experience_weight +
-            candidate.get('education_score', 0) * education_weight +
-            candidate.get('github_score', 0) * github_weight
-        )
-        candidate['total_score'] = round(total, 2)
-        return candidate['total_score']
+        return self.scorer.calculate_total_score(candidate)
@@ -1,16 +1,26 @@
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from src.utils.error_handler import ErrorHandler
+from src.utils.metrics import PipelineMetrics
+from src.utils.transport import HttpTransport, create_transport
 import requests
-from bs4 import BeautifulSoup
 import re
 import time
 import logging
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 class LinkedInAgent:
-    def __init__(self, config: Dict[str, Any], error_handler: Optional[ErrorHandler] = None):
+    def __init__(self, config: Dict[str, Any], error_handler: Optional[ErrorHandler] = None,
+                 metrics: Optional[PipelineMetrics] = None, transport: Optional[HttpTransport] = None):
         self.config = config
         self.error_handler = error_handler
+        self.metrics = metrics or PipelineMetrics()
+        self.transport = transport or create_transport(config)
         self.logger = logging.getLogger(__name__)
+        self.base_url = config.get('linkedin', {}).get('base_url', 'https://www.linkedin.com').rstrip('/')
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -61,7 +71,7 @@ class LinkedInAgent:
         """Get public profile data from LinkedIn"""
         try:
             # Construct public profile URL
-            url = f"https://www.linkedin.com/in/{username}/"
+            url = f"{self.base_url}/in/{username}/"
             
             # Make request with retry logic
             max_retries = 3
@@ -69,7 +79,10 @@ class LinkedInAgent:
             
             for attempt in range(max_retries):
                 try:
-                    response = requests.get(url, headers=self.headers, timeout=10)
+                    with self.metrics.timer('linkedin.request', items=1) as timer:
+                        response = self.transport.get(url, headers=self.headers, timeout=10)
+                        timer.bytes = len(response.content)
+                        timer.error = response.status_code != 200
                     
                     if response.status_code == 200:
                         if self._is_private_profile(response.text):
@@ -83,6 +96,7 @@ class LinkedInAgent:
                                 }
                             }
                         
+                        from bs4 import BeautifulSoup
                         soup = BeautifulSoup(response.text, 'html.parser')
                         
                         # Extract basic information
@@ -324,35 +338,27 @@ class LinkedInAgent:
             
         return min(score, 100)
 
-    def get_linkedin_profile(self, email: str) -> Dict[str, Any]:
-        """Get LinkedIn profile data for a given email"""
+    def get_linkedin_profile(self, linkedin_url: str) -> Dict[str, Any]:
+        """Get LinkedIn profile data for a profile URL linked from the resume"""
+        empty = {'profile_url': None, 'profile_data': None, 'score': 0}
         try:
-            # Extract username from email
-            username = email.split('@')[0]
-            
+            username = self.extract_username(linkedin_url)
+            if not username:
+                self.logger.warning(f"Could not extract username from LinkedIn URL: {linkedin_url}")
+                return empty
+
             # Get profile data
             profile_data = self.get_public_profile(username)
             
             if profile_data and profile_data.get('validation', {}).get('profile_exists'):
                 return {
-                    'email': email,
-                    'profile_url': f'https://www.linkedin.com/in/{username}',
+                    'profile_url': f'{self.base_url}/in/{username}',
                     'profile_data': profile_data,
                     'score': profile_data.get('profile_score', 0)
                 }
             else:
-                return {
-                    'email': email,
-                    'profile_url': None,
-                    'profile_data': None,
-                    'score': 0
-                }
+                return empty
                 
         except Exception as e:
-            self.error_handler.handle_linkedin_error(e, email)
-            return {
-                'email': email,
-                'profile_url': None,
-                'profile_data': None,
-                'score': 0
-            } 
\ No newline at end of file
+            self.error_handler.handle_linkedin_error(e, linkedin_url)
+            return empty
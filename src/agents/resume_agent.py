@@ -1,4 +1,8 @@
 import toml
+from src.utils.criteria import CompiledCriteria
+from src.utils.metrics import PipelineMetrics
+from src.utils.logger import get_logger
+from src.utils.attachment_store import StoredAttachment
 
 class ResumeAgentLogic:
     """Resume parsing and evaluation logic separate from CrewAI Agent"""
@@ -9,23 +13,38 @@ class ResumeAgentLogic:
         self.criteria = config
 
 class ResumeAgent:
-    def __init__(self, parser, config, error_handler):
+    def __init__(self, parser, config, error_handler, criteria=None, metrics=None):
         self.parser = parser
         self.config = config
         self.error_handler = error_handler
+        self.criteria = criteria or CompiledCriteria(config)
+        self.metrics = metrics or PipelineMetrics()
+        self.logger = get_logger('resume_agent')
     
     def evaluate_candidates(self, attachments):
         """Evaluate candidates based on resume content"""
         candidates = []
         for attachment in attachments:
-            try:
-                result = self.parser.parse_resume(attachment['filename'], attachment['content'])
-                if result.get('error'):
-                    print(f"[DEBUG] Parsing error for {attachment['filename']}: {result['error']}")
-                candidates.append(result)
-            except Exception as e:
-                print(f"[DEBUG] Exception during parsing {attachment['filename']}: {e}")
-                candidates.append({'filename': attachment['filename'], 'error': str(e)})
+            with self.metrics.timer('parse.document', items=1) as timer:
+                content = attachment['content']
+                if isinstance(content, StoredAttachment):
+                    timer.bytes = content.size
+                else:
+                    timer.bytes = content.getbuffer().nbytes if hasattr(content, 'getbuffer') else 0
+                try:
+                    result = self.parser.parse_resume(attachment['filename'], content)
+                    if result.get('error'):
+                        timer.error = True
+                        self.logger.debug("Parsing error for %s: %s", attachment['filename'], result['error'])
+                    candidates.append(result)
+                except Exception as e:
+                    timer.error = True
+                    self.logger.debug("Exception during parsing %s: %s", attachment['filename'], e)
+                    candidates.append({'filename': attachment['filename'], 'error': str(e)})
+                finally:
+                    # Free the buffer (or delete the spill file) as soon as the document is parsed
+                    if isinstance(content, StoredAttachment):
+                        content.release()
         return candidates
     
     def process_resume(self, attachment):
@@ -41,6 +60,8 @@ class ResumeAgent:
                 'filename': attachment['filename'],
                 'email': parsed_data['email'],
                 'github_username': parsed_data['github_username'],
+                'linkedin_url': parsed_data.get('linkedin_url'),
+                'portfolio_url': parsed_data.get('portfolio_url'),
                 'skills': parsed_data['skills'],
                 'experience_years': parsed_data['experience_years'],
                 'education': parsed_data['education'],
@@ -57,20 +78,7 @@ class ResumeAgent:
     
     def calculate_skills_score(self, skills):
         """Calculate skills score based on criteria"""
-        if not skills:
-            return 0
-        required_skills = self.config['skills']['required']
-        preferred_skills = self.config['skills']['preferred']
-        bonus_skills = self.config['skills']['bonus']
-        score = 0
-        required_count = sum(1 for skill in required_skills if skill in skills)
-        preferred_count = sum(1 for skill in preferred_skills if skill in skills)
-        bonus_count = sum(1 for skill in bonus_skills if skill in skills)
-        # Scoring formula
-        score = (required_count / len(required_skills)) * 60
-        score += (preferred_count / len(preferred_skills)) * 30
-        score += min(bonus_count * 5, 10)
-        return min(score, 100)
+        return self.criteria.score_skills(skills)
     
     def calculate_experience_score(self, years):
         """Calculate experience score"""
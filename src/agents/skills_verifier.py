@@ -1,14 +1,20 @@
 from typing import Dict, Any, Optional, List
 from src.utils.error_handler import ErrorHandler
-import requests
+from src.utils.criteria import CompiledCriteria
+from src.utils.metrics import PipelineMetrics
+from src.utils.transport import HttpTransport, create_transport
 import re
 import logging
-from bs4 import BeautifulSoup
 
 class SkillsVerifier:
-    def __init__(self, config: Dict[str, Any], error_handler: Optional[ErrorHandler] = None):
+    def __init__(self, config: Dict[str, Any], error_handler: Optional[ErrorHandler] = None,
+                 criteria: Optional[CompiledCriteria] = None, metrics: Optional[PipelineMetrics] = None,
+                 transport: Optional[HttpTransport] = None):
         self.config = config
         self.error_handler = error_handler
+        self.criteria = criteria or CompiledCriteria(config)
+        self.metrics = metrics or PipelineMetrics()
+        self.transport = transport or create_transport(config)
         self.logger = logging.getLogger(__name__)
         self.skill_sources = {
             'github': self.verify_github_skills,
@@ -120,6 +126,14 @@ class SkillsVerifier:
             self.error_handler.handle_verification_error(e, {'source': 'portfolio'})
             return None
             
+    def fetch(self, source: str, url: str, headers: Dict[str, str]):
+        """GET a verification source URL and record its timing under verifier.<source>"""
+        with self.metrics.timer(f'verifier.{source}', items=1) as timer:
+            response = self.transport.get(url, headers=headers)
+            timer.bytes = len(response.content)
+            timer.error = response.status_code != 200
+            return response
+            
     def calculate_confidence(self, verified_skills: Dict) -> str:
         """Calculate confidence level based on verification sources"""
         if not verified_skills:
@@ -143,14 +157,14 @@ class SkillsVerifier:
             
             # Get user data
             user_url = f"{api_url}/users/{username}"
-            user_response = requests.get(user_url, headers=headers)
+            user_response = self.fetch('github', user_url, headers)
             if user_response.status_code != 200:
                 return None
             user_data = user_response.json()
             
             # Get repositories
             repos_url = f"{api_url}/users/{username}/repos"
-            repos_response = requests.get(repos_url, headers=headers)
+            repos_response = self.fetch('github', repos_url, headers)
             repos_data = repos_response.json() if repos_response.status_code == 200 else []
             
             return {
@@ -168,10 +182,11 @@ class SkillsVerifier:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(url, headers=headers)
+            response = self.fetch('linkedin', url, headers)
             if response.status_code != 200:
                 return None
                 
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
             skills_section = soup.find('section', {'id': 'skills-section'})
             
@@ -193,7 +208,7 @@ class SkillsVerifier:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(url, headers=headers)
+            response = self.fetch('portfolio', url, headers)
             if response.status_code != 200:
                 return None
                 
@@ -223,10 +238,7 @@ class SkillsVerifier:
         # Extract from repository descriptions
         for repo in github_data.get('repos', []):
             if repo.get('description'):
-                description = repo['description'].lower()
-                for skill in self.config['skills']['required'] + self.config['skills']['preferred'] + self.config['skills']['bonus']:
-                    if skill.lower() in description:
-                        skills.add(skill)
+                skills.update(self.criteria.find_in_text(repo['description']))
                         
         return list(skills)
         
@@ -237,6 +249,7 @@ class SkillsVerifier:
         if not linkedin_data or 'skills_section' not in linkedin_data:
             return list(skills)
             
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(linkedin_data['skills_section'], 'html.parser')
         skill_elements = soup.find_all('span', {'class': 'mr1 t-bold'})
         
@@ -254,75 +267,23 @@ class SkillsVerifier:
         if not portfolio_data or 'html' not in portfolio_data:
             return list(skills)
             
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(portfolio_data['html'], 'html.parser')
-        text = soup.get_text().lower()
+        text = soup.get_text()
         
         # Look for skills in the text
-        for skill in self.config['skills']['required'] + self.config['skills']['preferred'] + self.config['skills']['bonus']:
-            if skill.lower() in text:
-                skills.add(skill)
+        skills.update(self.criteria.find_in_text(text))
                 
         return list(skills)
         
     def calculate_github_skill_score(self, skills: List[str]) -> float:
         """Calculate skill verification score from GitHub"""
-        if not skills:
-            return 0.0
-            
-        score = 0
-        required_skills = self.config['skills']['required']
-        preferred_skills = self.config['skills']['preferred']
-        bonus_skills = self.config['skills']['bonus']
-        
-        # Calculate score based on skill categories
-        required_count = sum(1 for skill in required_skills if skill in skills)
-        preferred_count = sum(1 for skill in preferred_skills if skill in skills)
-        bonus_count = sum(1 for skill in bonus_skills if skill in skills)
-        
-        score = (required_count / len(required_skills)) * 60
-        score += (preferred_count / len(preferred_skills)) * 30
-        score += min(bonus_count * 5, 10)
-        
-        return min(score, 100)
+        return self.criteria.score_skills(skills)
         
     def calculate_linkedin_skill_score(self, skills: List[str]) -> float:
         """Calculate skill verification score from LinkedIn"""
-        if not skills:
-            return 0.0
-            
-        score = 0
-        required_skills = self.config['skills']['required']
-        preferred_skills = self.config['skills']['preferred']
-        bonus_skills = self.config['skills']['bonus']
-        
-        # Calculate score based on skill categories
-        required_count = sum(1 for skill in required_skills if skill in skills)
-        preferred_count = sum(1 for skill in preferred_skills if skill in skills)
-        bonus_count = sum(1 for skill in bonus_skills if skill in skills)
-        
-        score = (required_count / len(required_skills)) * 60
-        score += (preferred_count / len(preferred_skills)) * 30
-        score += min(bonus_count * 5, 10)
-        
-        return min(score, 100)
+        return self.criteria.score_skills(skills)
         
     def calculate_portfolio_skill_score(self, skills: List[str]) -> float:
         """Calculate skill verification score from portfolio"""
-        if not skills:
-            return 0.0
-            
-        score = 0
-        required_skills = self.config['skills']['required']
-        preferred_skills = self.config['skills']['preferred']
-        bonus_skills = self.config['skills']['bonus']
-        
-        # Calculate score based on skill categories
-        required_count = sum(1 for skill in required_skills if skill in skills)
-        preferred_count = sum(1 for skill in preferred_skills if skill in skills)
-        bonus_count = sum(1 for skill in bonus_skills if skill in skills)
-        
-        score = (required_count / len(required_skills)) * 60
-        score += (preferred_count / len(preferred_skills)) * 30
-        score += min(bonus_count * 5, 10)
-        
-        return min(score, 100) 
\ No newline at end of file
+        return self.criteria.score_skills(skills)
@@ -0,0 +1,268 @@
+"""
+Long-running evaluation service.
+
+Agents, the Gmail client, the pooled HTTP transport and the GitHub cache are
+created once and reused across polls, so a new resume costs only its own
+fetch, parse and enrichment instead of a full cold start. The inbox is polled
+on an interval; a poll can also be triggered immediately through an optional
+localhost control endpoint (``POST /poll``), e.g. from a Gmail push relay.
+
+Message IDs that have been processed are persisted, so restarts pick up where
+the previous process stopped and each message is only evaluated once. A
+message is only marked as processed once it was fetched and evaluated; one
+that failed (a Gmail error, a timeout) is tried again on the next poll. A new
+application from someone already evaluated (same email or GitHub username) is
+merged into their candidate; it is only enriched again if it adds a profile
+link.
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Set
+
+from utils.candidate_store import DEFAULT_STATE_PATH, load_candidates, save_candidates
+from utils.dedup import PROFILE_FIELDS, CandidateDeduplicator, IdentityIndex
+from utils.logger import get_logger
+from utils.report_generator import ReportGenerator
+from utils.scoring import CandidateScorer
+
+
+DEFAULT_PROCESSED_PATH = 'outputs/processed_messages.json'
+DEFAULT_POLL_INTERVAL = 30
+
+
+class ProcessedMessages:
+    """Set of processed Gmail message IDs, persisted as a JSON list."""
+
+    def __init__(self, path: str = DEFAULT_PROCESSED_PATH):
+        self.path = path
+        self.ids: Set[str] = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                self.ids = set(json.load(f))
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, message_id: str) -> None:
+        self.ids.add(message_id)
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(sorted(self.ids), f)
+        os.replace(tmp_path, self.path)
+
+
+class EvaluationDaemon:
+    """Polls the inbox and evaluates new resumes incrementally with warm agents."""
+
+    def __init__(self, config: Dict[str, Any], email_agent, parse_task, analyze_task, linkedin_task, verify_task,
+                 metrics, state_path: str = DEFAULT_STATE_PATH, processed_path: str = DEFAULT_PROCESSED_PATH,
+                 interval: Optional[float] = None, control_port: Optional[int] = None):
+        daemon_config = config.get('daemon', {})
+        self.config = config
+        self.email_agent = email_agent
+        self.parse_task = parse_task
+        self.analyze_task = analyze_task
+        self.linkedin_task = linkedin_task
+        self.verify_task = verify_task
+        self.metrics = metrics
+        self.state_path = state_path
+        self.interval = interval if interval is not None else daemon_config.get('poll_interval', DEFAULT_POLL_INTERVAL)
+        self.control_port = control_port if control_port is not None else daemon_config.get('control_port')
+        self.logger = get_logger('daemon')
+        self.deduplicator = CandidateDeduplicator(config)
+        self.scorer = CandidateScorer(config)
+
+        self.processed = ProcessedMessages(processed_path)
+        self.candidates: List[Dict[str, Any]] = (
+            load_candidates(state_path) if os.path.exists(state_path) else []
+        )
+        self.identities = IdentityIndex(self.candidates)
+        # Messages whose fetch or evaluation failed; retried on every poll until they succeed
+        self.failed: Set[str] = set()
+        self.polls = 0
+        self.last_poll: Optional[str] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._control_server: Optional[ThreadingHTTPServer] = None
+
+    def run(self) -> None:
+        """Poll until stopped by SIGINT/SIGTERM or ``stop()``."""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, lambda *_: self.stop())
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        if self.control_port:
+            self._start_control_server()
+
+        print(f"✓ Daemon started: polling every {self.interval}s, "
+              f"{len(self.processed)} messages already processed")
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.poll_once()
+                except Exception as e:
+                    self.logger.error("Poll failed: %s", e, exc_info=True)
+                self._wake.wait(self.interval)
+                self._wake.clear()
+        finally:
+            if self._control_server is not None:
+                self._control_server.shutdown()
+                self._control_server.server_close()
+            print("Daemon stopped")
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self) -> None:
+        """Poll now instead of waiting for the rest of the interval."""
+        self._wake.set()
+
+    def poll_once(self) -> int:
+        """Evaluate messages not seen before; returns how many were processed."""
+        self.polls += 1
+        self.last_poll = datetime.now().isoformat()
+        with self.metrics.timer('daemon.poll') as timer:
+            listed = self.email_agent.list_message_ids(seen=self.processed.__contains__)
+            new_ids = [m for m in listed if m not in self.processed]
+            # Failed messages that have dropped off the listed pages
+            new_ids += [m for m in self.failed if m not in new_ids]
+            timer.items = len(new_ids)
+        if not new_ids:
+            return 0
+
+        evaluated = []
+        for message_id in new_ids:
+            start = time.perf_counter()
+            try:
+                attachments = self.email_agent.fetch_message(message_id)
+                candidates = self.evaluate_attachments(attachments)
+            except Exception as e:
+                # Not marked as processed, so the next poll tries the message again
+                self.failed.add(message_id)
+                self.logger.warning("Could not evaluate message %s, will retry: %s", message_id, e)
+                continue
+            self.failed.discard(message_id)
+            evaluated.extend(candidates)
+            self.candidates.extend(candidates)
+            self.processed.add(message_id)
+            for candidate in candidates:
+                if candidate.get('error'):
+                    print(f"  {candidate['filename']}: {candidate['error']}")
+                else:
+                    print(f"  Scored {candidate.get('email') or candidate['filename']}: "
+                          f"{candidate.get('total_score', 0):.1f} in {time.perf_counter() - start:.2f}s")
+
+        save_candidates(self.candidates, self.state_path)
+        self.processed.save()
+        if evaluated:
+            with self.metrics.timer('task.report', items=len(self.candidates)):
+                ReportGenerator(self.config).generate_reports(
+                    [c for c in self.candidates if not c.get('error')]
+                )
+        self.metrics.write()
+        done = len(new_ids) - len(self.failed.intersection(new_ids))
+        print(f"Processed {done} new messages ({len(evaluated)} resumes)")
+        return done
+
+    def evaluate_attachments(self, attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Parse and enrich one message's attachments with the warm agents"""
+        if not attachments:
+            return []
+        with self.metrics.timer('task.parse', items=len(attachments)):
+            parsed = self.parse_task.execute(attachments)
+        for attachment, candidate in zip(attachments, parsed):
+            candidate['message_id'] = attachment.get('message_id')
+
+        valid, _ = self.deduplicator.deduplicate(c for c in parsed if not c.get('error'))
+        if self.deduplicator.enabled:
+            valid = [self.merge_known(candidate) for candidate in valid]
+        # Merged candidates that link no new profile keep the enrichment of the earlier application
+        to_enrich = [c for c in valid if c.pop('needs_enrichment', True)]
+        if to_enrich:
+            with self.metrics.timer('task.github', items=len(to_enrich)):
+                to_enrich = self.analyze_task.execute(to_enrich)
+            with self.metrics.timer('task.linkedin', items=len(to_enrich)):
+                to_enrich = self.linkedin_task.execute(to_enrich)
+            with self.metrics.timer('task.verify', items=len(to_enrich)):
+                to_enrich = self.verify_task.execute(to_enrich)
+        for candidate in valid:
+            self.scorer.score(candidate)
+            self.identities.add(candidate)
+        return valid + [c for c in parsed if c.get('error')]
+
+    def merge_known(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a new candidate into an earlier candidate of the same person, if there is one.
+
+        The earlier candidate is removed from ``self.candidates``; the merged
+        one is returned in its place with ``needs_enrichment`` set.
+        """
+        match = self.identities.find(candidate)
+        if match is None:
+            return candidate
+        known, reason = match
+        merged, decision = self.deduplicator.merge(
+            [known, candidate], [f"{known['filename']} ~ {candidate['filename']}: {reason}"]
+        )
+        self.candidates[:] = [c for c in self.candidates if c is not known]
+        self.identities.replace([known, candidate], merged)
+        merged['needs_enrichment'] = any(merged.get(field) != known.get(field) for field in PROFILE_FIELDS)
+        print(f"  Merged {candidate['filename']} with the earlier application {known['filename']} "
+              f"({decision['identity']})")
+        return merged
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'polls': self.polls,
+            'last_poll': self.last_poll,
+            'interval': self.interval,
+            'processed_messages': len(self.processed),
+            'candidates': len(self.candidates),
+        }
+
+    def _start_control_server(self) -> None:
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != '/poll':
+                    self._reply(404, {'error': 'not found'})
+                    return
+                daemon.trigger()
+                self._reply(202, {'status': 'poll scheduled'})
+
+            def do_GET(self):
+                if self.path != '/status':
+                    self._reply(404, {'error': 'not found'})
+                    return
+                self._reply(200, daemon.status())
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        # Localhost only: the endpoint has no authentication
+        self._control_server = ThreadingHTTPServer(('127.0.0.1', int(self.control_port)), Handler)
+        self._control_server.daemon_threads = True
+        threading.Thread(target=self._control_server.serve_forever, name='daemon-control', daemon=True).start()
+        print(f"✓ Control endpoint on http://127.0.0.1:{self.control_port} (POST /poll, GET /status)")
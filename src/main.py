@@ -1,30 +1,26 @@
 import os
 import sys
+import argparse
 import toml
 from pathlib import Path
 from dotenv import load_dotenv
-from crewai import Crew
 
 # Add src directory to Python path for proper imports
 src_path = Path(__file__).parent
 sys.path.insert(0, str(src_path))
 
-from utils.auth import GmailAuth, GitHubAuth
-from utils.parsers import ResumeParser
+# Only light modules are imported up front. Agents, tasks, parsers and the
+# Gmail/HTTP clients pull in PyMuPDF, python-docx, BeautifulSoup, requests and
+# the Google API client, so they are imported where the pipeline needs them and
+# commands such as rescore and report start without loading any of them.
 from utils.error_handler import ErrorHandler
 from utils.report_generator import ReportGenerator
-
-from agents.email_agent import EmailAgent
-from agents.resume_agent import ResumeAgent
-from agents.github_agent import GitHubAgent
-from agents.linkedin_agent import LinkedInAgent
-from agents.skills_verifier import SkillsVerifier
-
-from tasks.fetch_task import FetchTask
-from tasks.parse_task import ParseTask
-from tasks.analyze_task import AnalyzeTask
-from tasks.linkedin_task import LinkedInTask
-from tasks.verify_task import VerifyTask
+from utils.criteria import CompiledCriteria
+from utils.metrics import PipelineMetrics
+from utils.logger import get_logger
+from utils.profiling import ParseProfiler
+from utils.candidate_store import DEFAULT_STATE_PATH, load_candidates, save_candidates
+from utils.dedup import CandidateDeduplicator
 
 def load_config():
     """Load configuration files"""
@@ -34,32 +30,70 @@ def load_config():
     
     # Merge configs
     config = {**criteria, **api_config}
+    
+    # Recruiter settings are kept in their own namespace; their section names overlap the others
+    recruiter_path = config_dir / 'recruiter_config.toml'
+    if recruiter_path.exists():
+        config['recruiter'] = toml.load(recruiter_path)
     return config
 
-def setup_agents(config):
+def setup_agents(config, metrics=None, profiler=None):
     """Initialize all agents"""
-    # Setup authentication
-    gmail_auth = GmailAuth("src/utils/gmail_credentials.json")
-    if not gmail_auth.authenticate():
-        print("❌ Gmail authentication failed")
-        return None, None, None, None, None
+    from utils.auth import GmailAuth, GitHubAuth
+    from utils.parsers import ResumeParser
+    from utils.parse_sandbox import SandboxedParser
+    from utils.transport import MockTransport, create_transport
+    from utils.mock_services import LocalGmailService
+    from agents.email_agent import EmailAgent
+    from agents.resume_agent import ResumeAgent
+    from agents.github_agent import GitHubAgent
+    from agents.linkedin_agent import LinkedInAgent
+    from agents.skills_verifier import SkillsVerifier
+    
+    # One pooled transport shared by every agent; the mock backend sends
+    # everything, Gmail included, to the local stand-in server
+    transport = create_transport(config)
+    if isinstance(transport, MockTransport):
+        print(f"✓ Using mock services at {transport.base_url}")
+        gmail_service = LocalGmailService(transport)
+    else:
+        # Setup authentication
+        gmail_auth = GmailAuth("src/utils/gmail_credentials.json")
+        if not gmail_auth.authenticate(verify=config.get('gmail', {}).get('verify_on_start', False)):
+            print("❌ Gmail authentication failed")
+            return None, None, None, None, None
+        gmail_service = gmail_auth.get_service()
     github_auth = GitHubAuth()
     
     # Setup utility classes
-    resume_parser = ResumeParser()
+    if config.get('parsing', {}).get('sandbox', True) and not (profiler and profiler.enabled):
+        # Parse in a supervised worker process so one bad document cannot hang or crash the run
+        resume_parser = SandboxedParser(config, profiler=profiler)
+    else:
+        resume_parser = ResumeParser(profiler=profiler, config=config)
     error_handler = ErrorHandler()
+    criteria = CompiledCriteria(config)
     
     # Initialize agents
-    email_agent = EmailAgent(gmail_auth.get_service(), config, error_handler)
-    resume_agent = ResumeAgent(resume_parser, config, error_handler)
-    github_agent = GitHubAgent(config, github_auth, error_handler)
-    linkedin_agent = LinkedInAgent(config=config, error_handler=error_handler)
-    skills_verifier = SkillsVerifier(config, error_handler)
+    email_agent = EmailAgent(gmail_service, config, error_handler, metrics=metrics)
+    resume_agent = ResumeAgent(resume_parser, config, error_handler, criteria=criteria, metrics=metrics)
+    github_agent = GitHubAgent(config, github_auth, error_handler, criteria=criteria, metrics=metrics,
+                               transport=transport)
+    linkedin_agent = LinkedInAgent(config=config, error_handler=error_handler, metrics=metrics,
+                                   transport=transport)
+    skills_verifier = SkillsVerifier(config, error_handler, criteria=criteria, metrics=metrics,
+                                     transport=transport)
     
     return email_agent, resume_agent, github_agent, linkedin_agent, skills_verifier
 
 def setup_tasks(email_agent, resume_agent, github_agent, linkedin_agent, skills_verifier, error_handler):
     """Setup all tasks with proper CrewAI integration"""
+    from tasks.fetch_task import FetchTask
+    from tasks.parse_task import ParseTask
+    from tasks.analyze_task import AnalyzeTask
+    from tasks.linkedin_task import LinkedInTask
+    from tasks.verify_task import VerifyTask
+    
     fetch_task = FetchTask(
         agent=email_agent,
         error_handler=error_handler
@@ -83,20 +117,417 @@ def setup_tasks(email_agent, resume_agent, github_agent, linkedin_agent, skills_
     
     return fetch_task, parse_task, analyze_task, linkedin_task, verify_task
 
-def main():
+def print_metrics_summary(metrics):
+    """Print the per-stage latency summary"""
+    stages = metrics.summary()['stages']
+    if not stages:
+        return
+    print("Stage timings (p50 / p95 / max seconds):")
+    for name, stats in stages.items():
+        line = (f"  {name}: {stats['p50_seconds']:.3f} / {stats['p95_seconds']:.3f} / {stats['max_seconds']:.3f}"
+                f" over {stats['calls']} calls, {stats['items']} items")
+        if stats['cache_hit_ratio'] is not None:
+            line += f", cache hit ratio {stats['cache_hit_ratio']:.0%}"
+        print(line)
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Fetch, parse, enrich and rank resumes")
+    parser.add_argument(
+        'command', nargs='?', default='run',
+        choices=['run', 'rescore', 'report', 'reparse', 'daemon', 'enqueue', 'worker', 'queue-status'],
+        help="run: full pipeline (default); rescore: recompute scores of the saved candidates with the "
+             "current criteria and regenerate reports; report: regenerate reports from the saved candidates; "
+             "reparse: parse the stored raw attachments again with the current parser, update the saved "
+             "candidates and regenerate reports; "
+             "daemon: keep agents warm and evaluate new messages as they arrive; enqueue: add a fetch job "
+             "per inbox message to the job queue; worker: process queued jobs; queue-status: print job counts"
+    )
+    parser.add_argument(
+        '--state', default=DEFAULT_STATE_PATH,
+        help=f"Saved candidates written by run and read by rescore/report (default: {DEFAULT_STATE_PATH})"
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="Profile resume parsing and write outputs/profile/parse.pstats and phases.ndjson "
+             "(same as RESUME_PROFILE=1)"
+    )
+    parser.add_argument(
+        '--transport', choices=['live', 'mock'],
+        help="Override [transport] backend; 'mock' talks to a local mock services server"
+    )
+    parser.add_argument(
+        '--interval', type=float,
+        help="daemon: seconds between inbox polls (default: [daemon] poll_interval)"
+    )
+    parser.add_argument(
+        '--control-port', type=int,
+        help="daemon: serve POST /poll and GET /status on this localhost port (default: [daemon] control_port)"
+    )
+    parser.add_argument(
+        '--queue',
+        help="Job queue database used by enqueue/worker/queue-status (default: [queue] path)"
+    )
+    parser.add_argument(
+        '--processes', type=int,
+        help="worker: number of worker processes to start on this host (default: 1); "
+             "reparse: number of parser processes (default: CPU count)"
+    )
+    parser.add_argument(
+        '--idle-exit', action='store_true',
+        help="worker: exit once the queue has no runnable jobs instead of waiting for more"
+    )
+    parser.add_argument(
+        '--enrich', action='store_true',
+        help="reparse: run GitHub, LinkedIn and skills verification again for candidates whose profile "
+             "links or skills changed"
+    )
+    parser.add_argument(
+        '--from-queue', action='store_true',
+        help="report: collect the results stored in the job queue into --state before reporting"
+    )
+    return parser.parse_args(argv)
+
+def print_profile_summary(profiler):
+    """Dump parser profiling results and print the slowest documents"""
+    paths = profiler.dump()
+    if not paths:
+        return
+    print("Slowest documents to parse:")
+    for document in profiler.slowest_documents():
+        phases = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in list(document['phases'].items())[:3])
+        print(f"  {document['filename']}: {document['total_seconds']:.3f}s ({phases})")
+    print(f"Parser profile saved to {paths['pstats']} and {paths['phases']}")
+
+def generate_reports(config, candidates):
+    """Generate the reports and print the top candidate"""
+    report_generator = ReportGenerator(config)
+    ranked = report_generator.generate_reports(candidates)
+    print(f"✓ Report generation complete!")
+    if ranked:
+        top_candidate = ranked[0]
+        print(f"Top candidate: {top_candidate['email']} with score {top_candidate['total_score']:.1f}")
+    print("Reports saved to outputs/ directory")
+    return ranked
+
+def load_saved_candidates(state_path):
+    """Load candidates saved by a previous run, or None if there are none"""
+    if not os.path.exists(state_path):
+        print(f"❌ No saved candidates at {state_path}; run the full pipeline first")
+        return None
+    candidates = [c for c in load_candidates(state_path) if not c.get('error')]
+    print(f"Loaded {len(candidates)} saved candidates from {state_path}")
+    return candidates
+
+def rescore_candidates(config, state_path):
+    """Recompute every score of the saved candidates with the current criteria and regenerate reports"""
+    from utils.scoring import CandidateScorer
+    
+    candidates = load_saved_candidates(state_path)
+    if candidates is None:
+        return False
+    scorer = CandidateScorer(config)
+    for candidate in candidates:
+        scorer.score(candidate)
+    save_candidates(candidates, state_path)
+    print(f"Rescored {len(candidates)} candidates")
+    generate_reports(config, candidates)
+    return True
+
+def regenerate_reports(config, state_path):
+    """Regenerate the reports from the saved candidates without rescoring"""
+    candidates = load_saved_candidates(state_path)
+    if candidates is None:
+        return False
+    generate_reports(config, candidates)
+    return True
+
+# Candidate fields that come from the parser and are replaced by reparse
+PARSED_FIELDS = (
+    'email', 'github_username', 'linkedin_url', 'portfolio_url', 'skills', 'experience_years', 'education',
+    'text', 'screening'
+)
+# Enrichment results that depend on a parsed field; reparse drops them when the field changes
+ENRICHMENT_INPUTS = {
+    'github_username': ('github_data', 'verified_skills'),
+    'linkedin_url': ('linkedin_data', 'verified_skills'),
+    'portfolio_url': ('verified_skills',),
+    'skills': ('verified_skills',),
+}
+
+def reparse_blobs(config, store, processes):
+    """Parse the stored blobs without a result from the current parser version, in parallel"""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.parsers import parser_version
+    from utils.parse_sandbox import SandboxedParser
+    
+    version = parser_version(config)
+    stale = store.stale(version)
+    # Each thread drives its own parser process
+    local = threading.local()
+    parsers = []
+    
+    def parse(item):
+        digest, filename = item
+        if not hasattr(local, 'parser'):
+            local.parser = SandboxedParser(config)
+            parsers.append(local.parser)
+        content = store.get(digest)
+        try:
+            result = local.parser.parse_resume(filename, content)
+        finally:
+            content.release()
+        # Timeouts and crashes are retried by the next reparse instead of being cached
+        if not result.get('parse_error'):
+            store.save_result(digest, version, result)
+        return result
+    
+    try:
+        with ThreadPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(parse, stale))
+    finally:
+        for parser in parsers:
+            parser.close()
+    failed = len([result for result in results if result.get('error')])
+    return version, len(stale), failed
+
+def reparse_candidates(config, args):
+    """Reparse stored attachments whose results are outdated, then update and rescore the saved candidates"""
+    from utils.blob_store import BlobStore
+    from utils.scoring import CandidateScorer
+    
+    store = BlobStore(config)
+    try:
+        processes = args.processes or os.cpu_count() or 1
+        version, reparsed, failed = reparse_blobs(config, store, processes)
+        print(f"Reparsed {reparsed} stored attachments with parser version {version} ({failed} failed)")
+        
+        candidates = load_saved_candidates(args.state)
+        if candidates is None:
+            return False
+        hashes = {(message_id, filename): digest for message_id, filename, digest in store.attachments()}
+        updated = merged = 0
+        for candidate in candidates:
+            if candidate.get('merged_from'):
+                # Its fields are the union of several resumes; one reparsed resume must not replace them
+                merged += 1
+                continue
+            digest = hashes.get((candidate.get('message_id'), candidate['filename']))
+            cached = store.result(digest) if digest else None
+            if cached is None or cached[0] != version or cached[1].get('error'):
+                continue
+            parsed = {field: cached[1].get(field) for field in PARSED_FIELDS}
+            for field, enrichment in ENRICHMENT_INPUTS.items():
+                if parsed[field] != candidate.get(field):
+                    for key in enrichment:
+                        candidate.pop(key, None)
+                    candidate['needs_enrichment'] = True
+            candidate.update(parsed)
+            updated += 1
+    finally:
+        store.close()
+    
+    stale = [candidate for candidate in candidates if candidate.get('needs_enrichment')]
+    if stale and args.enrich:
+        metrics = PipelineMetrics(performance_logger=get_logger('performance'))
+        pipeline = build_warm_pipeline(config, metrics, ParseProfiler(enabled=False))
+        if pipeline is None:
+            return False
+        _, _, analyze_task, linkedin_task, verify_task = pipeline
+        verify_task.execute(linkedin_task.execute(analyze_task.execute(stale)))
+        for candidate in stale:
+            del candidate['needs_enrichment']
+        print(f"Enriched {len(stale)} candidates whose profile links or skills changed")
+    elif stale:
+        print(f"{len(stale)} candidates have changed profile links or skills; their stale enrichment was "
+              f"dropped. Run reparse --enrich to enrich them again")
+    
+    scorer = CandidateScorer(config)
+    for candidate in candidates:
+        scorer.score(candidate)
+    save_candidates(candidates, args.state)
+    print(f"Updated {updated} of {len(candidates)} saved candidates from stored attachments "
+          f"({merged} merged candidates left as they are)")
+    generate_reports(config, candidates)
+    return True
+
+def build_warm_pipeline(config, metrics, profiler):
+    """Set up the agents and return (email_agent, parse, analyze, linkedin, verify tasks), or None"""
+    email_agent, resume_agent, github_agent, linkedin_agent, skills_verifier = setup_agents(config, metrics, profiler)
+    if email_agent is None:
+        return None
+    _, parse_task, analyze_task, linkedin_task, verify_task = setup_tasks(
+        email_agent, resume_agent, github_agent, linkedin_agent, skills_verifier, ErrorHandler()
+    )
+    return email_agent, parse_task, analyze_task, linkedin_task, verify_task
+
+def run_daemon(args):
+    """Run the long-lived service that polls the inbox with warm agents and caches"""
+    from daemon import EvaluationDaemon
+    
+    config = load_config()
+    if args.transport:
+        config.setdefault('transport', {})['backend'] = args.transport
+    metrics = PipelineMetrics(performance_logger=get_logger('performance'))
+    profiler = ParseProfiler(enabled=True) if args.profile else ParseProfiler.from_env()
+    
+    pipeline = build_warm_pipeline(config, metrics, profiler)
+    if pipeline is None:
+        return False
+    daemon = EvaluationDaemon(
+        config, *pipeline, metrics,
+        state_path=args.state, interval=args.interval, control_port=args.control_port
+    )
+    try:
+        daemon.run()
+    finally:
+        print_metrics_summary(metrics)
+        print_profile_summary(profiler)
+    return True
+
+def enqueue_messages(args):
+    """Add a fetch job to the queue for every inbox message not queued before"""
+    from utils.job_queue import create_job_queue
+    from worker import enqueue_inbox
+    
+    config = load_config()
+    if args.transport:
+        config.setdefault('transport', {})['backend'] = args.transport
+    email_agent = setup_agents(config)[0]
+    if email_agent is None:
+        return False
+    queue = create_job_queue(config, args.queue)
+    try:
+        new, known = enqueue_inbox(queue, email_agent)
+    finally:
+        queue.close()
+    print(f"Queued {new} new messages ({known} already queued)")
+    return True
+
+def worker_process(args):
+    """Entry point of one worker process; top level so it can be spawned"""
+    from utils.job_queue import create_job_queue
+    from worker import PipelineWorker
+    
+    load_dotenv()
+    config = load_config()
+    if args.transport:
+        config.setdefault('transport', {})['backend'] = args.transport
+    metrics = PipelineMetrics(performance_logger=get_logger('performance'))
+    pipeline = build_warm_pipeline(config, metrics, ParseProfiler.from_env())
+    if pipeline is None:
+        return False
+    queue = create_job_queue(config, args.queue)
+    worker = PipelineWorker(queue, config, *pipeline, metrics)
+    try:
+        processed = worker.run(stop_when_idle=args.idle_exit)
+    except KeyboardInterrupt:
+        processed = worker.processed
+    finally:
+        queue.close()
+    print(f"Worker {worker.worker_id} processed {processed} jobs")
+    print_metrics_summary(metrics)
+    return True
+
+def worker_child(args):
+    """Target of a spawned worker process; exits non-zero if the worker could not start"""
+    sys.exit(0 if worker_process(args) else 1)
+
+def run_workers(args):
+    """Run queue workers in this process or in ``--processes`` child processes"""
+    processes = args.processes or 1
+    if processes <= 1:
+        return worker_process(args)
+    
+    import multiprocessing
+    
+    # Spawn rather than fork: every worker builds its own Gmail client, HTTP pool and queue connection
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=worker_child, args=(args,)) for _ in range(processes)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+    return all(process.exitcode == 0 for process in processes)
+
+def print_queue_status(args):
+    """Print job counts per stage and the most recent failures"""
+    from utils.job_queue import create_job_queue
+    
+    queue = create_job_queue(load_config(), args.queue)
+    try:
+        stats = queue.stats()
+        failed = queue.failed_jobs()
+    finally:
+        queue.close()
+    if not stats:
+        print("Job queue is empty")
+    for kind, counts in stats.items():
+        print(f"  {kind}: " + ", ".join(f"{count} {status}" for status, count in counts.items()))
+    if failed:
+        print("Recent failures:")
+        for job in failed:
+            error = (job['error'] or '').splitlines()[0] if job['error'] else 'unknown error'
+            print(f"  #{job['id']} {job['kind']} after {job['attempts']} attempts: {error}")
+    return True
+
+def collect_queue_results(config, args):
+    """Save the candidates finished by queue workers to the state file"""
+    from utils.job_queue import create_job_queue
+    from worker import fold_duplicates
+    
+    queue = create_job_queue(config, args.queue)
+    try:
+        count = save_candidates(fold_duplicates(queue, config), args.state)
+    finally:
+        queue.close()
+    print(f"Collected {count} results from the job queue into {args.state}")
+
+def main(argv=None):
     """Main execution function"""
+    args = parse_args(argv)
     print("Starting Resume Evaluator...")
     
     # Load environment variables
     load_dotenv()
     
+    if args.command == 'daemon':
+        return run_daemon(args)
+    if args.command == 'enqueue':
+        return enqueue_messages(args)
+    if args.command == 'worker':
+        return run_workers(args)
+    if args.command == 'queue-status':
+        return print_queue_status(args)
+    
+    if args.command == 'reparse':
+        return reparse_candidates(load_config(), args)
+    
+    if args.command in ('rescore', 'report'):
+        config = load_config()
+        if args.from_queue:
+            collect_queue_results(config, args)
+        if args.command == 'rescore':
+            return rescore_candidates(config, args.state)
+        return regenerate_reports(config, args.state)
+    
+    metrics = PipelineMetrics(performance_logger=get_logger('performance'))
+    profiler = ParseProfiler(enabled=True) if args.profile else ParseProfiler.from_env()
     try:
         # Load configuration
         config = load_config()
+        if args.transport:
+            config.setdefault('transport', {})['backend'] = args.transport
         print("✓ Configuration loaded successfully")
         
         # Setup agents
-        email_agent, resume_agent, github_agent, linkedin_agent, skills_verifier = setup_agents(config)
+        with metrics.timer('task.setup'):
+            email_agent, resume_agent, github_agent, linkedin_agent, skills_verifier = setup_agents(config, metrics, profiler)
         print("✓ Agents initialized successfully")
         
         # Setup tasks
@@ -110,7 +541,9 @@ def main():
         
         # Execute workflow step by step
         print("Fetching email attachments...")
-        attachments = fetch_task.execute()
+        with metrics.timer('task.fetch') as timer:
+            attachments = fetch_task.execute()
+            timer.items = len(attachments)
         print(f"Found {len(attachments)} resume attachments")
         for att in attachments:
             print(f"  - {att['filename']}")
@@ -120,7 +553,10 @@ def main():
             return
         
         print("Parsing and evaluating resumes...")
-        candidates = parse_task.execute(attachments)
+        with metrics.timer('task.parse', items=len(attachments)):
+            candidates = parse_task.execute(attachments)
+        for attachment, candidate in zip(attachments, candidates):
+            candidate['message_id'] = attachment.get('message_id')
         for result in candidates:
             print(f"Parsed: {result['filename']}")
             if result.get('error'):
@@ -135,36 +571,48 @@ def main():
             print("No valid candidates found. Exiting.")
             return
         
+        # Merge duplicate applications so each person is enriched once
+        with metrics.timer('task.dedup', items=len(candidates)):
+            candidates, merge_decisions = CandidateDeduplicator(config).deduplicate(candidates)
+        for decision in merge_decisions:
+            print(f"Merged {', '.join(decision['merged'])} into {decision['kept']} ({decision['identity']})")
+        
         print("Analyzing GitHub profiles...")
-        github_enriched = analyze_task.execute(candidates)
+        with metrics.timer('task.github', items=len(candidates)):
+            github_enriched = analyze_task.execute(candidates)
         print(f"Enriched {len(github_enriched)} candidates with GitHub data")
         
         print("Analyzing LinkedIn profiles...")
-        linkedin_enriched = linkedin_task.execute(github_enriched)
+        with metrics.timer('task.linkedin', items=len(github_enriched)):
+            linkedin_enriched = linkedin_task.execute(github_enriched)
         print(f"Enriched {len(linkedin_enriched)} candidates with LinkedIn data")
         
         print("Verifying skills...")
-        final_candidates = verify_task.execute(linkedin_enriched)
+        with metrics.timer('task.verify', items=len(linkedin_enriched)):
+            final_candidates = verify_task.execute(linkedin_enriched)
         print(f"Verified skills for {len(final_candidates)} candidates")
         
+        # Save evaluated candidates so they can be rescored or reported on without rerunning
+        save_candidates(final_candidates, args.state)
+        print(f"Saved candidates to {args.state}")
+        
         # Generate reports
         print("Generating reports...")
-        report_generator = ReportGenerator(config)
-        final_candidates = report_generator.generate_reports(final_candidates)
-        
-        print(f"✓ Report generation complete!")
-        if final_candidates:
-            top_candidate = final_candidates[0]
-            print(f"Top candidate: {top_candidate['email']} with score {top_candidate['total_score']:.1f}")
-        print("Reports saved to outputs/ directory")
+        with metrics.timer('task.report', items=len(final_candidates)):
+            generate_reports(config, final_candidates)
         
     except Exception as e:
         print(f"❌ Error during execution: {e}")
         import traceback
         print(f"Traceback: {traceback.format_exc()}")
         return False
+    finally:
+        print_metrics_summary(metrics)
+        print(f"Stage metrics saved to {metrics.write()}")
+        print_profile_summary(profiler)
     
     return True
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if main() is False:
+        sys.exit(1)
\ No newline at end of file
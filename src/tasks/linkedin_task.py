@@ -10,12 +10,16 @@ class LinkedInTask:
         """Execute LinkedIn enrichment task"""
         enriched_candidates = []
         for candidate in candidates:
+            if not candidate.get('linkedin_url'):
+                # Only profiles the resume links to are requested
+                enriched_candidates.append(candidate)
+                continue
             try:
-                linkedin_data = self.agent.get_linkedin_profile(candidate['email'])
+                linkedin_data = self.agent.get_linkedin_profile(candidate['linkedin_url'])
                 if linkedin_data:
                     candidate['linkedin_data'] = linkedin_data
                 enriched_candidates.append(candidate)
             except Exception as e:
-                self.error_handler.handle_linkedin_error(e, candidate['email'])
+                self.error_handler.handle_linkedin_error(e, candidate.get('email'))
                 enriched_candidates.append(candidate)
         return enriched_candidates 
\ No newline at end of file
@@ -11,7 +11,7 @@ class VerifyTask:
         verified_candidates = []
         for candidate in candidates:
             try:
-                verified_skills = self.agent.verify_skills(candidate['skills'])
+                verified_skills = self.agent.verify_skills(candidate)
                 candidate['verified_skills'] = verified_skills
                 verified_candidates.append(candidate)
             except Exception as e:
@@ -0,0 +1,119 @@
+"""
+Attachment buffers that spill to disk.
+
+Gmail returns attachments as base64 strings. Small attachments are decoded
+into memory; anything above ``[gmail] spill_threshold`` bytes is decoded in
+chunks straight into a temporary file, and the parser opens it by path (PyMuPDF,
+python-docx) or through a memory map instead of holding a copy in memory.
+``release()`` drops the bytes or deletes the file once the attachment has been
+parsed, so peak memory follows the number of documents being parsed at once
+rather than the size of the inbox.
+"""
+
+import base64
+import io
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+
+DEFAULT_SPILL_THRESHOLD = 1024 * 1024  # 1MB
+# Multiple of 4 so every chunk of base64 decodes on its own
+DECODE_CHUNK_CHARS = 4 * 256 * 1024
+
+
+class StoredAttachment:
+    """Attachment bytes held in memory or in a temporary file."""
+
+    def __init__(self, data: Optional[bytes] = None, path: Optional[str] = None, size: Optional[int] = None,
+                 owned: bool = True):
+        self._data = data
+        self.path = path
+        self.size = size if size is not None else (len(data) if data is not None else os.path.getsize(path))
+        # Delete a spilled file we own even if release() is never called
+        self._finalizer = weakref.finalize(self, _remove, path) if path and owned else None
+
+    @property
+    def on_disk(self) -> bool:
+        return self.path is not None
+
+    def open(self) -> BinaryIO:
+        """Binary file object over the content, for readers that take a stream."""
+        if self.path is not None:
+            return open(self.path, 'rb')
+        return io.BytesIO(self._data)
+
+    def view(self) -> Union[memoryview, mmap.mmap]:
+        """Zero-copy view: the in-memory bytes, or a read-only memory map of the file."""
+        if self.path is None:
+            return memoryview(self._data)
+        with open(self.path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def open_pdf(self):
+        """Open with PyMuPDF by path when spilled, from the in-memory bytes otherwise."""
+        import fitz
+        if self.path is not None:
+            return fitz.open(self.path, filetype='pdf')
+        return fitz.open(stream=self._data, filetype='pdf')
+
+    def getvalue(self) -> bytes:
+        """Copy of the content; prefer ``open``, ``view`` or ``open_pdf``."""
+        if self.path is None:
+            return self._data
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def release(self) -> None:
+        """Drop the content and delete the spilled file."""
+        self._data = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def as_stored(content: Any) -> StoredAttachment:
+    """Wrap bytes or a BytesIO (as built by tests and benchmarks) in a StoredAttachment."""
+    if isinstance(content, StoredAttachment):
+        return content
+    if isinstance(content, io.BytesIO):
+        return StoredAttachment(content.getvalue())
+    return StoredAttachment(bytes(content))
+
+
+class AttachmentStore:
+    """Decodes Gmail attachment data into memory or a spill file by size."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        settings = (config or {}).get('gmail', {})
+        self.spill_threshold = settings.get('spill_threshold', DEFAULT_SPILL_THRESHOLD)
+        self.spill_dir = settings.get('spill_dir') or None
+
+    def from_base64(self, data: str) -> StoredAttachment:
+        """Decode URL-safe base64 attachment data."""
+        # Decoded size is about 3/4 of the encoded length
+        if len(data) * 3 // 4 <= self.spill_threshold:
+            return StoredAttachment(base64.urlsafe_b64decode(data))
+
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix='attachment-', dir=self.spill_dir)
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for start in range(0, len(data), DECODE_CHUNK_CHARS):
+                    chunk = base64.urlsafe_b64decode(data[start:start + DECODE_CHUNK_CHARS])
+                    f.write(chunk)
+                    size += len(chunk)
+        except Exception:
+            _remove(path)
+            raise
+        return StoredAttachment(path=path, size=size)
@@ -1,7 +1,5 @@
 import os
 import json
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 
 class GmailAuth:
     def __init__(self, credentials_path):
@@ -9,8 +7,16 @@ class GmailAuth:
         self.token_path = "src/utils/gmail_token.json"
         self.service = None
     
-    def authenticate(self):
-        """Authenticate with Gmail API using existing token"""
+    def authenticate(self, verify=False):
+        """Authenticate with Gmail API using existing token
+        
+        The Google client libraries are imported here rather than at module
+        load. ``verify`` makes a ``getProfile`` round trip to check the token
+        up front; by default a bad token surfaces on the first real request.
+        """
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.discovery import build
+        
         try:
             # Check if token file exists
             if not os.path.exists(self.token_path):
@@ -28,10 +34,11 @@ class GmailAuth:
             creds = Credentials.from_authorized_user_info(creds_data)
             
             # Test the credentials by building the service
-            self.service = build('gmail', 'v1', credentials=creds)
+            self.service = build('gmail', 'v1', credentials=creds, cache_discovery=False)
             
             # Verify service is working with a simple API call
-            self.service.users().getProfile(userId='me').execute()
+            if verify:
+                self.service.users().getProfile(userId='me').execute()
             
             print("✓ Gmail authentication successful")
             return True
@@ -0,0 +1,187 @@
+"""
+Local store of raw resume attachments for reprocessing without Gmail.
+
+Attachments are stored once per content hash, zlib-compressed, under
+``objects/<hash[:2]>/<hash>.z`` in ``[blob_store] path``. An SQLite index
+maps each (message ID, filename) to its hash and keeps the last parse result
+of every blob together with the parser version that produced it, so
+``reparse`` only parses blobs whose result is missing or came from an older
+parser.
+
+Objects are written to a temporary file and renamed into place, so several
+worker processes can store the same attachment at once.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.attachment_store import DEFAULT_SPILL_THRESHOLD, StoredAttachment
+
+
+DEFAULT_BLOB_PATH = 'outputs/blobs'
+DEFAULT_COMPRESSION_LEVEL = 6
+CHUNK_SIZE = 256 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attachments (
+    message_id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (message_id, filename)
+);
+CREATE INDEX IF NOT EXISTS attachments_hash ON attachments (hash);
+CREATE TABLE IF NOT EXISTS parse_results (
+    hash TEXT PRIMARY KEY,
+    parser_version TEXT NOT NULL,
+    result BLOB NOT NULL,
+    parsed_at REAL NOT NULL
+);
+"""
+
+
+class BlobStore:
+    """Content-addressed, compressed attachment store with an SQLite index."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, path: Optional[str] = None):
+        config = config or {}
+        settings = config.get('blob_store', {})
+        self.root = path or settings.get('path', DEFAULT_BLOB_PATH)
+        self.compression_level = settings.get('compression_level', DEFAULT_COMPRESSION_LEVEL)
+        self.spill_threshold = config.get('gmail', {}).get('spill_threshold', DEFAULT_SPILL_THRESHOLD)
+        self.spill_dir = config.get('gmail', {}).get('spill_dir') or None
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(self.root, 'index.sqlite3'), timeout=30,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.z")
+
+    def put(self, content: StoredAttachment) -> str:
+        """Store the content if it is new; returns its SHA-256 hex digest."""
+        sha = hashlib.sha256()
+        with content.open() as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            return digest
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.blob-', dir=directory)
+        try:
+            compressor = zlib.compressobj(self.compression_level)
+            with os.fdopen(fd, 'wb') as out, content.open() as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    out.write(compressor.compress(chunk))
+                out.write(compressor.flush())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest
+
+    def store_attachment(self, message_id: str, filename: str, content: StoredAttachment) -> str:
+        """Store an attachment and map (message_id, filename) to it; returns its digest."""
+        digest = self.put(content)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO attachments (message_id, filename, hash, size, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (message_id, filename, digest, content.size, time.time())
+            )
+        return digest
+
+    def get(self, digest: str) -> StoredAttachment:
+        """Decompress a blob into memory, or into a spill file above the spill threshold."""
+        decompressor = zlib.decompressobj()
+        buffer = bytearray()
+        out, tmp_path, size = None, None, 0
+        try:
+            with open(self.object_path(digest), 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    data = decompressor.decompress(chunk)
+                    size += len(data)
+                    if out is None and size <= self.spill_threshold:
+                        buffer += data
+                        continue
+                    if out is None:
+                        fd, tmp_path = tempfile.mkstemp(prefix='attachment-', dir=self.spill_dir)
+                        out = os.fdopen(fd, 'wb')
+                        out.write(buffer)
+                        buffer = bytearray()
+                    out.write(data)
+            data = decompressor.flush()
+            size += len(data)
+            if out is None:
+                return StoredAttachment(bytes(buffer + data))
+            out.write(data)
+            out.close()
+        except BaseException:
+            if out is not None:
+                out.close()
+                os.remove(tmp_path)
+            raise
+        return StoredAttachment(path=tmp_path, size=size)
+
+    def attachments(self) -> Iterator[Tuple[str, str, str]]:
+        """(message_id, filename, hash) of every stored attachment."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT message_id, filename, hash FROM attachments ORDER BY stored_at"
+            ).fetchall()
+        return iter(rows)
+
+    def stale(self, parser_version: str) -> List[Tuple[str, str]]:
+        """(hash, a filename) of blobs without a result from ``parser_version``."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT a.hash, MIN(a.filename) FROM attachments a "
+                "LEFT JOIN parse_results r ON r.hash = a.hash AND r.parser_version = ? "
+                "WHERE r.hash IS NULL GROUP BY a.hash",
+                (parser_version,)
+            ).fetchall()
+
+    def result(self, digest: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(parser_version, result) cached for a blob, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT parser_version, result FROM parse_results WHERE hash = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(zlib.decompress(row[1]))
+
+    def save_result(self, digest: str, parser_version: str, result: Dict[str, Any]) -> None:
+        record = zlib.compress(json.dumps(result, default=str).encode(), self.compression_level)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_results (hash, parser_version, result, parsed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (digest, parser_version, record, time.time())
+            )
+
+
+def create_blob_store(config: Dict[str, Any]) -> Optional[BlobStore]:
+    """The store configured by ``[blob_store]``, or None when it is disabled."""
+    if not config.get('blob_store', {}).get('enabled', True):
+        return None
+    return BlobStore(config)
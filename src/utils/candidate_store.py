@@ -0,0 +1,55 @@
+"""
+Persisted evaluation state, so candidates can be rescored or reported on
+again without refetching, reparsing or re-enriching them.
+"""
+
+import json
+import os
+from typing import Dict, Any, Iterable, Iterator, List
+
+
+DEFAULT_STATE_PATH = 'outputs/candidates_state.ndjson'
+
+# Bulky fields that scoring and reporting never read
+DROPPED_FIELDS = ('text', 'content')
+DROPPED_GITHUB_FIELDS = ('repos', 'events')
+
+
+def to_record(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the JSON-serializable part of a candidate worth persisting."""
+    record = {key: value for key, value in candidate.items() if key not in DROPPED_FIELDS}
+    github_data = record.get('github_data')
+    if isinstance(github_data, dict):
+        record['github_data'] = {
+            key: value for key, value in github_data.items() if key not in DROPPED_GITHUB_FIELDS
+        }
+    return record
+
+
+def save_candidates(candidates: Iterable[Dict[str, Any]], path: str = DEFAULT_STATE_PATH) -> int:
+    """Write candidates as NDJSON, replacing the file atomically. Returns the count written."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    count = 0
+    with open(tmp_path, 'w') as f:
+        for candidate in candidates:
+            f.write(json.dumps(to_record(candidate), default=str))
+            f.write('\n')
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def iter_candidates(path: str = DEFAULT_STATE_PATH) -> Iterator[Dict[str, Any]]:
+    """Stream candidates back from a state file."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_candidates(path: str = DEFAULT_STATE_PATH) -> List[Dict[str, Any]]:
+    """Load every candidate from a state file."""
+    return list(iter_candidates(path))
@@ -0,0 +1,168 @@
+"""
+Columnar (Parquet / Arrow IPC) export of evaluation results.
+
+pyarrow is an optional dependency; install it with
+``pip install "resume-evaluator[analytics]"`` to enable this backend.
+"""
+
+import os
+import re
+from typing import Dict, Any, Iterable, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    ipc = None
+    pq = None
+
+from src.utils.criteria import CompiledCriteria
+
+
+COLUMNAR_EXTENSIONS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "Columnar export requires pyarrow. Install it with "
+            "'pip install \"resume-evaluator[analytics]\"' or 'pip install pyarrow'."
+        )
+
+
+def skill_column(skill: str) -> str:
+    """Return the column name used for a skill flag, e.g. 'skill_ci_cd'."""
+    return 'skill_' + re.sub(r'[^0-9a-z]+', '_', skill.lower()).strip('_')
+
+
+class ColumnarExporter:
+    """Flattens ranked candidates into one row per candidate and writes them as Parquet or Arrow IPC."""
+
+    def __init__(self, config: Dict[str, Any], criteria: Optional[CompiledCriteria] = None):
+        self.config = config
+        self.criteria = criteria or CompiledCriteria(config)
+        self.skill_columns = [
+            (key, skill_column(self.criteria.canonical[key])) for key in sorted(self.criteria.all_skills)
+        ]
+
+    def build_table(self, candidates: Iterable[Dict[str, Any]], run_id: str) -> 'pa.Table':
+        """Flatten ranked candidates into an Arrow table in a single pass."""
+        _require_pyarrow()
+        columns: Dict[str, List[Any]] = {name: [] for name in self.schema().names}
+
+        for rank, candidate in enumerate(candidates, start=1):
+            github_data = candidate.get('github_data') or {}
+            repo_stats = github_data.get('repo_stats') or {}
+            contribution_stats = github_data.get('contribution_stats') or {}
+            skills = candidate.get('skills') or []
+            normalized = self.criteria.normalize_all(skills)
+
+            columns['run_id'].append(run_id)
+            columns['rank'].append(rank)
+            columns['email'].append(candidate.get('email', ''))
+            columns['filename'].append(candidate.get('filename', ''))
+            columns['github_username'].append(candidate.get('github_username', ''))
+            columns['score_total'].append(float(candidate.get('total_score') or 0))
+            columns['score_skills'].append(float(candidate.get('skills_score') or 0))
+            columns['score_experience'].append(float(candidate.get('experience_score') or 0))
+            columns['score_education'].append(float(candidate.get('education_score') or 0))
+            columns['score_github'].append(float(candidate.get('github_score') or 0))
+            columns['experience_years'].append(int(candidate.get('experience_years') or 0))
+            columns['education'].append(candidate.get('education', ''))
+            columns['skills'].append(list(skills))
+            columns['github_total_repos'].append(repo_stats.get('total_repos', 0))
+            columns['github_total_stars'].append(repo_stats.get('total_stars', 0))
+            columns['github_total_forks'].append(repo_stats.get('total_forks', 0))
+            columns['github_total_contributions'].append(contribution_stats.get('total_contributions', 0))
+            columns['github_commits'].append(contribution_stats.get('commits', 0))
+            columns['github_pull_requests'].append(contribution_stats.get('pull_requests', 0))
+            columns['github_issues'].append(contribution_stats.get('issues', 0))
+            columns['github_recent_activity'].append(contribution_stats.get('recent_activity', 0))
+            for key, name in self.skill_columns:
+                columns[name].append(key in normalized)
+
+        return pa.table(columns, schema=self.schema())
+
+    def schema(self) -> 'pa.Schema':
+        """Return the fixed schema of the exported table."""
+        _require_pyarrow()
+        fields = [
+            ('run_id', pa.string()),
+            ('rank', pa.int32()),
+            ('email', pa.string()),
+            ('filename', pa.string()),
+            ('github_username', pa.string()),
+            ('score_total', pa.float64()),
+            ('score_skills', pa.float64()),
+            ('score_experience', pa.float64()),
+            ('score_education', pa.float64()),
+            ('score_github', pa.float64()),
+            ('experience_years', pa.int32()),
+            ('education', pa.string()),
+            ('skills', pa.list_(pa.string())),
+            ('github_total_repos', pa.int64()),
+            ('github_total_stars', pa.int64()),
+            ('github_total_forks', pa.int64()),
+            ('github_total_contributions', pa.int64()),
+            ('github_commits', pa.int64()),
+            ('github_pull_requests', pa.int64()),
+            ('github_issues', pa.int64()),
+            ('github_recent_activity', pa.int64()),
+        ]
+        fields.extend((name, pa.bool_()) for _, name in self.skill_columns)
+        return pa.schema(fields)
+
+    def export(self, candidates: Iterable[Dict[str, Any]], run_id: str,
+               output_format: str = 'parquet', output_dir: str = 'outputs/columnar') -> str:
+        """Write ranked candidates to ``<output_dir>/candidates-<run_id>.<ext>`` and return the path."""
+        if output_format not in COLUMNAR_EXTENSIONS:
+            raise ValueError(f"Unsupported columnar format: {output_format}")
+        table = self.build_table(candidates, run_id)
+
+        os.makedirs(output_dir, exist_ok=True)
+        safe_run_id = re.sub(r'[^0-9A-Za-z_-]+', '-', run_id)
+        path = os.path.join(output_dir, f"candidates-{safe_run_id}{COLUMNAR_EXTENSIONS[output_format]}")
+        if output_format == 'parquet':
+            pq.write_table(table, path)
+        else:
+            # Uncompressed IPC files can be memory-mapped without copying
+            with pa.OSFile(path, 'wb') as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        return path
+
+
+def read_candidates_table(path: str, memory_map: bool = True) -> 'pa.Table':
+    """Read an exported Parquet or Arrow IPC file, memory-mapping it by default."""
+    _require_pyarrow()
+    if path.endswith(COLUMNAR_EXTENSIONS['arrow']):
+        source = pa.memory_map(path, 'r') if memory_map else pa.OSFile(path, 'rb')
+        return ipc.open_file(source).read_all()
+    return pq.read_table(path, memory_map=memory_map)
+
+
+def read_runs(output_dir: str = 'outputs/columnar', output_format: str = 'parquet') -> 'pa.Table':
+    """Read every exported run in a directory as one table, for queries across runs.
+
+    Runs exported with different criteria have different skill flag columns;
+    they are read with the union of all run schemas, and a run without a
+    column has nulls in it. Raises FileNotFoundError if the directory has no
+    runs in ``output_format``.
+    """
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    extension = COLUMNAR_EXTENSIONS[output_format]
+    file_format = 'ipc' if output_format == 'arrow' else 'parquet'
+    paths = sorted(
+        os.path.join(output_dir, name) for name in os.listdir(output_dir) if name.endswith(extension)
+    )
+    if not paths:
+        raise FileNotFoundError(f"No {output_format} runs exported in {output_dir}")
+    schema = pa.unify_schemas([ds.dataset(path, format=file_format).schema for path in paths])
+    return ds.dataset(paths, schema=schema, format=file_format).to_table()
@@ -0,0 +1,80 @@
+"""
+Compiled skill criteria shared by all scoring agents.
+"""
+
+from typing import Dict, Any, Iterable, List, Optional, FrozenSet, Tuple
+
+
+SKILL_CATEGORIES = ('required', 'preferred', 'bonus')
+
+
+class CompiledCriteria:
+    """Skill criteria compiled once from the config into lookup sets.
+
+    Skills are matched case-insensitively: every configured skill is keyed
+    by its lowercase form, and candidate skills are normalized the same way
+    before being intersected with the category sets.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        skills_config = config.get('skills', {}) if isinstance(config, dict) else {}
+
+        self.canonical: Dict[str, str] = {}
+        self.categories: Dict[str, str] = {}
+        category_sets = {}
+        for category in SKILL_CATEGORIES:
+            normalized = set()
+            for skill in skills_config.get(category, []):
+                key = self.normalize(skill)
+                # A skill listed under several categories (in any spelling) counts in the first only
+                if self.categories.setdefault(key, category) != category:
+                    continue
+                self.canonical.setdefault(key, skill)
+                normalized.add(key)
+            category_sets[category] = frozenset(normalized)
+
+        self.required: FrozenSet[str] = category_sets['required']
+        self.preferred: FrozenSet[str] = category_sets['preferred']
+        self.bonus: FrozenSet[str] = category_sets['bonus']
+        self.all_skills: FrozenSet[str] = self.required | self.preferred | self.bonus
+
+        # (lowercase, canonical) pairs for substring scans over free text
+        self._text_terms: Tuple[Tuple[str, str], ...] = tuple(
+            (key, self.canonical[key]) for key in sorted(self.all_skills)
+        )
+
+    @staticmethod
+    def normalize(skill: str) -> str:
+        """Return the lookup key for a skill name."""
+        return skill.strip().lower()
+
+    def normalize_all(self, skills: Iterable[str]) -> FrozenSet[str]:
+        """Normalize a collection of skill names into a lookup set."""
+        return frozenset(self.normalize(skill) for skill in skills if skill)
+
+    def canonical_name(self, skill: str) -> str:
+        """Return the configured spelling of a skill, or the skill unchanged."""
+        return self.canonical.get(self.normalize(skill), skill)
+
+    def category_of(self, skill: str) -> Optional[str]:
+        """Return 'required', 'preferred', 'bonus' or None for a skill."""
+        return self.categories.get(self.normalize(skill))
+
+    def find_in_text(self, text: str) -> List[str]:
+        """Return canonical names of configured skills mentioned in text."""
+        text_lower = text.lower()
+        return [name for key, name in self._text_terms if key in text_lower]
+
+    def score_skills(self, skills: Iterable[str]) -> float:
+        """Score a skill list against the required/preferred/bonus sets."""
+        if not skills:
+            return 0.0
+        candidate_skills = self.normalize_all(skills)
+
+        score = 0
+        if self.required:
+            score += (len(self.required & candidate_skills) / len(self.required)) * 60
+        if self.preferred:
+            score += (len(self.preferred & candidate_skills) / len(self.preferred)) * 30
+        score += min(len(self.bonus & candidate_skills) * 5, 10)
+        return min(score, 100)
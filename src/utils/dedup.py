@@ -0,0 +1,300 @@
+"""
+Duplicate application detection.
+
+The same person often applies more than once, from several threads or with a
+slightly edited resume. Parsed candidates are grouped into identities before
+enrichment so GitHub, LinkedIn and skills verification run once per person:
+
+- same normalized email address
+- same GitHub username (case-insensitive)
+- near-identical resume text, estimated with MinHash over word shingles and
+  bucketed with locality-sensitive hashing so only likely pairs are compared
+
+Linked candidates are merged with union-find, so A~B and B~C put all three in
+one identity. The kept candidate records what was merged into it and why.
+
+``IdentityIndex`` matches later applications against candidates evaluated
+earlier (previous daemon polls) by email and GitHub username, so they are
+merged into the enriched candidate instead of being enriched again. It does
+not compare resume text: saved candidates drop their text, and matching must
+work the same after a restart as before it.
+"""
+
+import hashlib
+import re
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+
+DEFAULT_SIGNATURE_SIZE = 64
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+
+_WORD = re.compile(r'[a-z0-9]+')
+_EMPTY_BIN = 1 << 64
+
+# Profile links enrichment is fetched for
+PROFILE_FIELDS = ('github_username', 'linkedin_url', 'portfolio_url')
+# Enrichment results and the fields they were fetched for
+ENRICHMENT_SOURCES = {
+    'github_data': ('github_username',),
+    'linkedin_data': ('linkedin_url',),
+    'verified_skills': PROFILE_FIELDS,
+}
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Lowercase an address and drop Gmail-style ``+tag`` suffixes and dots."""
+    if not email or '@' not in email:
+        return None
+    local, domain = email.strip().lower().rsplit('@', 1)
+    local = local.split('+', 1)[0]
+    if domain in ('gmail.com', 'googlemail.com'):
+        local = local.replace('.', '')
+        domain = 'gmail.com'
+    return f"{local}@{domain}"
+
+
+def identity_keys(candidate: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(kind, value) keys that identify the person behind a candidate."""
+    keys = []
+    email = normalize_email(candidate.get('email'))
+    if email:
+        keys.append(('email', email))
+    github = (candidate.get('github_username') or '').lower()
+    if github:
+        keys.append(('github', github))
+    return keys
+
+
+class MinHasher:
+    """One-permutation MinHash signatures over word shingles.
+
+    Each shingle is hashed once; the hash picks one of ``size`` bins and the
+    signature keeps the minimum per bin. This costs one pass over the shingles
+    instead of one per signature position, and matching bins still estimate
+    the Jaccard similarity of the two shingle sets.
+    """
+
+    def __init__(self, size: int = DEFAULT_SIGNATURE_SIZE, shingle_size: int = DEFAULT_SHINGLE_SIZE):
+        self.size = size
+        self.shingle_size = shingle_size
+
+    def shingles(self, text: str) -> set:
+        words = _WORD.findall(text.lower())
+        size = self.shingle_size
+        if len(words) <= size:
+            return {' '.join(words)} if words else set()
+        return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Return the MinHash signature of ``text``, or None if it has no words."""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        bins = self.size
+        signature = [_EMPTY_BIN] * bins
+        for shingle in shingles:
+            value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'little')
+            index, value = value % bins, value // bins
+            if value < signature[index]:
+                signature[index] = value
+        return tuple(signature)
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+        filled = matches = 0
+        for x, y in zip(first, second):
+            if x == y == _EMPTY_BIN:
+                continue
+            filled += 1
+            matches += x == y
+        return matches / filled if filled else 0.0
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+class CandidateDeduplicator:
+    """Merges parsed candidates that belong to the same person.
+
+    Settings come from the optional ``[dedup]`` config section.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        settings = config.get('dedup', {}) if isinstance(config, dict) else {}
+        self.enabled = settings.get('enabled', True)
+        self.threshold = settings.get('similarity_threshold', DEFAULT_SIMILARITY_THRESHOLD)
+        signature_size = settings.get('signature_size', DEFAULT_SIGNATURE_SIZE)
+        self.bands = settings.get('bands', DEFAULT_BANDS)
+        if signature_size % self.bands:
+            raise ValueError("dedup.signature_size must be a multiple of dedup.bands")
+        self.hasher = MinHasher(signature_size, settings.get('shingle_size', DEFAULT_SHINGLE_SIZE))
+
+    def deduplicate(self, candidates: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return (one candidate per identity, merge decisions).
+
+        Candidates with a parse error are passed through untouched. The kept
+        candidate of each merged identity gets a ``merged_from`` list.
+        """
+        candidates = list(candidates)
+        valid = [c for c in candidates if not c.get('error')]
+        errors = [c for c in candidates if c.get('error')]
+        if not self.enabled or len(valid) < 2:
+            return valid + errors, []
+
+        groups = _UnionFind(len(valid))
+        # Each link is (i, j, reason); pairs are only recorded when they join two groups
+        links: List[Tuple[int, int, str]] = []
+
+        def link(i: int, j: int, reason: str) -> None:
+            if groups.find(i) != groups.find(j):
+                groups.union(i, j)
+                links.append((i, j, reason))
+
+        first_seen: Dict[Tuple[str, str], int] = {}
+        for i, candidate in enumerate(valid):
+            for kind, value in identity_keys(candidate):
+                if (kind, value) in first_seen:
+                    link(first_seen[(kind, value)], i, f"same {kind}: {value}")
+                else:
+                    first_seen[(kind, value)] = i
+
+        signatures = [self.hasher.signature(c.get('text') or '') for c in valid]
+        rows = self.hasher.size // self.bands
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for i, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            for band in range(self.bands):
+                key = signature[band * rows:(band + 1) * rows]
+                # Short texts leave bins empty; empty bands say nothing about similarity
+                if key.count(_EMPTY_BIN) < rows:
+                    buckets.setdefault((band, key), []).append(i)
+        compared = set()
+        for members in buckets.values():
+            for position, i in enumerate(members):
+                for j in members[position + 1:]:
+                    if (i, j) in compared or groups.find(i) == groups.find(j):
+                        continue
+                    compared.add((i, j))
+                    similarity = MinHasher.similarity(signatures[i], signatures[j])
+                    if similarity >= self.threshold:
+                        link(i, j, f"resume text {similarity:.0%} similar")
+
+        members_by_root: Dict[int, List[int]] = {}
+        for i in range(len(valid)):
+            members_by_root.setdefault(groups.find(i), []).append(i)
+        reasons_by_root: Dict[int, List[str]] = {}
+        for i, j, reason in links:
+            reasons_by_root.setdefault(groups.find(i), []).append(
+                f"{valid[i]['filename']} ~ {valid[j]['filename']}: {reason}"
+            )
+
+        merged, decisions = [], []
+        for root, members in members_by_root.items():
+            if len(members) == 1:
+                merged.append(valid[members[0]])
+                continue
+            kept, decision = self.merge([valid[i] for i in members], reasons_by_root.get(root, []))
+            merged.append(kept)
+            decisions.append(decision)
+        return merged + errors, decisions
+
+    @staticmethod
+    def merge(duplicates: List[Dict[str, Any]], reasons: List[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Combine one identity's candidates, keeping the most complete resume as the base
+
+        Enrichment of any duplicate is kept if it was fetched for the profile
+        links the merged candidate ends up with, and candidates that were
+        merges themselves keep their ``merged_from`` and ``merge_reasons``.
+        """
+        ordered = sorted(duplicates, key=lambda c: len(c.get('text') or ''), reverse=True)
+        kept = dict(ordered[0])
+        others = ordered[1:]
+        for other in others:
+            for field in ('email', 'github_username', 'education', 'linkedin_url', 'portfolio_url'):
+                if not kept.get(field) and other.get(field):
+                    kept[field] = other[field]
+        for field, sources in ENRICHMENT_SOURCES.items():
+            if kept.get(field) is not None and all(kept.get(s) == ordered[0].get(s) for s in sources):
+                continue
+            kept.pop(field, None)
+            for candidate in ordered:
+                if candidate.get(field) is not None and all(kept.get(s) == candidate.get(s) for s in sources):
+                    kept[field] = candidate[field]
+                    break
+        skills = list(kept.get('skills') or [])
+        seen = {skill.lower() for skill in skills}
+        for other in others:
+            for skill in other.get('skills') or []:
+                if skill.lower() not in seen:
+                    seen.add(skill.lower())
+                    skills.append(skill)
+        kept['skills'] = skills
+        kept['experience_years'] = max(c.get('experience_years', 0) or 0 for c in ordered)
+        kept['merged_from'] = [entry for c in ordered for entry in c.get('merged_from') or []] + [
+            {'filename': other['filename'], 'message_id': other.get('message_id')} for other in others
+        ]
+        kept['merge_reasons'] = [reason for c in ordered for reason in c.get('merge_reasons') or []] + reasons
+        decision = {
+            'identity': kept.get('email') or kept.get('github_username') or kept['filename'],
+            'kept': kept['filename'],
+            'merged': [other['filename'] for other in others],
+            'reasons': reasons,
+        }
+        return kept, decision
+
+
+class IdentityIndex:
+    """Evaluated candidates by identity key, for merging applications that arrive later."""
+
+    def __init__(self, candidates: Iterable[Dict[str, Any]] = ()):
+        self._by_key: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for candidate in candidates:
+            self.add(candidate)
+
+    def add(self, candidate: Dict[str, Any]) -> None:
+        """Index a candidate under its own email and GitHub username."""
+        if candidate.get('error'):
+            return
+        for key in identity_keys(candidate):
+            self._by_key[key] = candidate
+
+    def replace(self, sources: Iterable[Dict[str, Any]], merged: Dict[str, Any]) -> None:
+        """Point every key of the ``sources`` merged into ``merged`` at it.
+
+        Keys of an earlier candidate that the merged one does not carry (a
+        second email address) keep finding the person instead of the record
+        that was replaced.
+        """
+        sources = list(sources)
+        for key, known in list(self._by_key.items()):
+            if any(known is source for source in sources):
+                self._by_key[key] = merged
+        for source in sources:
+            for key in identity_keys(source):
+                self._by_key[key] = merged
+        self.add(merged)
+
+    def find(self, candidate: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """(indexed candidate, reason) of the same person, or None."""
+        for kind, value in identity_keys(candidate):
+            known = self._by_key.get((kind, value))
+            if known is not None and known is not candidate:
+                return known, f"same {kind}: {value}"
+        return None
@@ -0,0 +1,100 @@
+"""
+Gmail search query compiled from the recruiter's ``[email_search]`` settings.
+
+Filtering with search operators happens on Google's side, so messages that
+would be discarded after listing or downloading are never returned:
+
+- ``subject_keywords`` -> ``{subject:"Resume" subject:"CV"}`` (any of)
+- ``exclude_keywords`` -> ``-subject:"spam"``
+- ``attachment_types`` -> ``has:attachment {filename:pdf filename:docx}``,
+  limited to the types the parser supports
+- ``search_timeframe`` -> ``newer_than:30d``
+- ``min_attachment_size`` / ``max_attachment_size`` -> ``larger:`` / ``smaller:``
+- ``max_results`` -> messages per ``messages.list`` page, instead of
+  ``[gmail] max_results``
+
+Gmail's size operators apply to the whole message, in which attachments are
+base64-encoded, so they are loose bounds; exact per-attachment limits are
+still enforced on each part before download.
+"""
+
+import math
+import re
+from typing import Dict, Any, Iterable, List, Optional
+
+
+SUPPORTED_ATTACHMENT_TYPES = ('pdf', 'docx')
+# base64 grows attachments by 4/3, plus headers and MIME boundaries
+ENCODED_SIZE_FACTOR = 4 / 3
+MESSAGE_OVERHEAD_BYTES = 64 * 1024
+_TIMEFRAME = re.compile(r'^\d+[dmy]$')
+
+
+def quote(term: str) -> str:
+    """Quote a search term for use after an operator."""
+    term = term.replace('"', ' ').strip()
+    return f'"{term}"' if re.search(r'\W', term) else term
+
+
+def any_of(operator: str, terms: Iterable[str]) -> Optional[str]:
+    """``operator:a`` or ``{operator:a operator:b}`` (Gmail's OR grouping)."""
+    clauses = [f"{operator}:{quote(term)}" for term in terms if term and term.strip()]
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else '{' + ' '.join(clauses) + '}'
+
+
+def build_gmail_query(email_search: Dict[str, Any]) -> str:
+    """Compile an ``[email_search]`` section into a Gmail search query."""
+    clauses: List[str] = []
+
+    subjects = any_of('subject', email_search.get('subject_keywords', []))
+    if subjects:
+        clauses.append(subjects)
+    for keyword in email_search.get('exclude_keywords', []):
+        if keyword and keyword.strip():
+            clauses.append(f"-subject:{quote(keyword)}")
+
+    clauses.append('has:attachment')
+    types = [t.lower().lstrip('.') for t in email_search.get('attachment_types', SUPPORTED_ATTACHMENT_TYPES)]
+    filenames = any_of('filename', [t for t in types if t in SUPPORTED_ATTACHMENT_TYPES])
+    if filenames:
+        clauses.append(filenames)
+
+    timeframe = str(email_search.get('search_timeframe', '')).strip().lower()
+    if timeframe:
+        if not _TIMEFRAME.match(timeframe):
+            raise ValueError(f"Invalid search_timeframe {timeframe!r}; expected e.g. '30d', '6m' or '1y'")
+        clauses.append(f"newer_than:{timeframe}")
+
+    min_size = email_search.get('min_attachment_size')
+    if min_size:
+        clauses.append(f"larger:{int(min_size)}")
+    max_size = email_search.get('max_attachment_size')
+    if max_size:
+        clauses.append(f"smaller:{math.ceil(max_size * ENCODED_SIZE_FACTOR) + MESSAGE_OVERHEAD_BYTES}")
+
+    return ' '.join(clauses)
+
+
+def resolve_gmail_query(config: Dict[str, Any]) -> str:
+    """The query EmailAgent should search with, per ``[gmail] query_source``.
+
+    ``recruiter`` (default) compiles ``recruiter_config.toml``'s
+    ``[email_search]`` when it is loaded; ``static`` uses ``[gmail] query``.
+    """
+    gmail_config = config['gmail']
+    email_search = config.get('recruiter', {}).get('email_search')
+    if gmail_config.get('query_source', 'recruiter') == 'recruiter' and email_search:
+        return build_gmail_query(email_search)
+    return gmail_config['query']
+
+
+def resolve_max_results(config: Dict[str, Any]) -> int:
+    """Messages per list page: ``[email_search] max_results`` when the query comes from it."""
+    gmail_config = config['gmail']
+    email_search = config.get('recruiter', {}).get('email_search')
+    if gmail_config.get('query_source', 'recruiter') == 'recruiter' and email_search \
+            and email_search.get('max_results'):
+        return int(email_search['max_results'])
+    return gmail_config['max_results']
@@ -0,0 +1,289 @@
+"""
+Durable job queue with leases and retries for distributing pipeline stages
+across worker processes.
+
+Workers claim a job by taking a lease on it. A job whose lease expires
+(because its worker crashed or hung) becomes claimable again. Failed jobs are
+retried with a linear backoff until ``max_attempts`` is reached. Completing a
+job, enqueueing its follow-up jobs and storing its results happen in one
+transaction, so a crash never loses or duplicates a stage.
+
+``SQLiteJobQueue`` is the built-in backend. It runs SQLite in WAL mode, which
+handles many worker processes on one host but needs shared memory between
+them: keep the database on a local disk and every worker on that host. WAL
+does not work over a network filesystem, so workers on several hosts need a
+backend with the same interface on a shared server. Select the backend with
+the ``[queue]`` config section.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+DEFAULT_QUEUE_PATH = 'outputs/jobs.sqlite3'
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BACKOFF = 30.0
+
+# (kind, payload, dedupe_key, priority) of a job to enqueue
+FollowUp = Tuple[str, Dict[str, Any], Optional[str], int]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    dedupe_key TEXT UNIQUE,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, priority DESC, available_at, id);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS identities (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class Job:
+    """A claimed job. ``attempts`` counts this attempt."""
+    __slots__ = ('id', 'kind', 'payload', 'attempts', 'max_attempts', 'lease_owner')
+
+    def __init__(self, id: int, kind: str, payload: Dict[str, Any], attempts: int,
+                 max_attempts: int, lease_owner: str):
+        self.id = id
+        self.kind = kind
+        self.payload = payload
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.lease_owner = lease_owner
+
+    def __repr__(self) -> str:
+        return f"Job(id={self.id}, kind={self.kind!r}, attempts={self.attempts})"
+
+
+class SQLiteJobQueue:
+    """Job queue stored in a single SQLite database file."""
+
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_backoff: float = DEFAULT_RETRY_BACKOFF):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Autocommit mode; multi-statement operations use explicit BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], dedupe_key: Optional[str] = None,
+                priority: int = 0, delay: float = 0.0) -> Optional[int]:
+        """Add a job; returns its id, or None if a job with ``dedupe_key`` already exists."""
+        with self._transaction():
+            return self._insert(kind, payload, dedupe_key, priority, time.time() + delay)
+
+    def has_job(self, dedupe_key: str) -> bool:
+        """Whether a job with ``dedupe_key`` was ever enqueued."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM jobs WHERE dedupe_key = ?", (dedupe_key,)).fetchone()
+        return row is not None
+
+    def claim(self, worker_id: str, kinds: Optional[Sequence[str]] = None) -> Optional[Job]:
+        """Lease the next available job, highest priority first, or return None."""
+        now = time.time()
+        kind_filter = ''
+        params: List[Any] = [now, now]
+        if kinds:
+            kind_filter = f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+
+        with self._transaction():
+            # Expired leases that have used up their attempts will never succeed
+            self._conn.execute(
+                "UPDATE jobs SET status = 'failed', last_error = COALESCE(last_error, 'lease expired'), "
+                "updated_at = ? WHERE status = 'leased' AND lease_expires < ? AND attempts >= max_attempts",
+                (now, now)
+            )
+            row = self._conn.execute(
+                "SELECT id, kind, payload, attempts, max_attempts FROM jobs "
+                "WHERE ((status = 'pending' AND available_at <= ?) OR (status = 'leased' AND lease_expires < ?))"
+                f"{kind_filter} ORDER BY priority DESC, available_at, id LIMIT 1",
+                params
+            ).fetchone()
+            if row is None:
+                return None
+            job_id, kind, payload, attempts, max_attempts = row
+            self._conn.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, job_id)
+            )
+        return Job(job_id, kind, json.loads(payload), attempts + 1, max_attempts, worker_id)
+
+    def extend_lease(self, job: Job) -> bool:
+        """Renew the lease of a long-running job; False if it was lost to another worker."""
+        now = time.time()
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (now + self.lease_seconds, now, job.id, job.lease_owner)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job: Job, follow_ups: Iterable[FollowUp] = (),
+                 results: Optional[Dict[str, Dict[str, Any]]] = None) -> bool:
+        """Mark a job done, enqueue its follow-ups and store its results atomically.
+
+        Returns False (and changes nothing) if the lease was lost, e.g. because
+        it expired and another worker claimed the job.
+        """
+        now = time.time()
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'done', lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (now, job.id, job.lease_owner)
+            )
+            if cursor.rowcount != 1:
+                return False
+            for kind, payload, dedupe_key, priority in follow_ups:
+                self._insert(kind, payload, dedupe_key, priority, now)
+            for key, record in (results or {}).items():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, record, updated_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(record, default=str), now)
+                )
+        return True
+
+    def fail(self, job: Job, error: str) -> bool:
+        """Record a failed attempt; returns True if the job will be retried."""
+        now = time.time()
+        retry = job.attempts < job.max_attempts
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, lease_owner = NULL, lease_expires = NULL, "
+                "last_error = ?, updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                ('pending' if retry else 'failed', now + self.retry_backoff * job.attempts,
+                 error[:2000], now, job.id, job.lease_owner)
+            )
+        return retry
+
+    def claim_identity(self, keys: Sequence[str], owner: str) -> str:
+        """Record ``owner`` for the identity ``keys`` unless another owner has one of them.
+
+        Returns the owner the identity now belongs to, so a worker can tell a
+        second application from the same person before enriching it. Claiming
+        again for the same owner (a retried job) returns that owner.
+        """
+        now = time.time()
+        with self._transaction():
+            for key in keys:
+                row = self._conn.execute("SELECT owner FROM identities WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    owner = row[0]
+                    break
+            for key in keys:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO identities (key, owner, created_at) VALUES (?, ?, ?)",
+                    (key, owner, now)
+                )
+        return owner
+
+    def iter_results(self) -> Iterator[Dict[str, Any]]:
+        """Stream stored results in key order."""
+        for (record,) in self._conn.execute("SELECT record FROM results ORDER BY key"):
+            yield json.loads(record)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Job counts per kind and status."""
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in self._conn.execute(
+                "SELECT kind, status, COUNT(*) FROM jobs GROUP BY kind, status ORDER BY kind, status"):
+            counts.setdefault(kind, {})[status] = count
+        return counts
+
+    def failed_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT id, kind, attempts, last_error FROM jobs WHERE status = 'failed' ORDER BY updated_at DESC LIMIT ?",
+            (limit,)
+        )
+        return [{'id': r[0], 'kind': r[1], 'attempts': r[2], 'error': r[3]} for r in rows]
+
+    def _insert(self, kind: str, payload: Dict[str, Any], dedupe_key: Optional[str],
+                priority: int, available_at: float) -> Optional[int]:
+        now = time.time()
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO jobs (kind, payload, dedupe_key, priority, max_attempts, available_at, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (kind, json.dumps(payload, default=str), dedupe_key, priority, self.max_attempts,
+             available_at, now, now)
+        )
+        return cursor.lastrowid if cursor.rowcount == 1 else None
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error; serialized within the process."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            self.conn.execute('BEGIN IMMEDIATE')
+        except Exception:
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self.lock.release()
+        return False
+
+
+def create_job_queue(config: Dict[str, Any], path: Optional[str] = None) -> SQLiteJobQueue:
+    """Build the job queue selected by the ``[queue]`` config section."""
+    settings = config.get('queue', {}) if isinstance(config, dict) else {}
+    backend = settings.get('backend', 'sqlite')
+    if backend != 'sqlite':
+        raise ValueError(f"Unknown job queue backend: {backend}")
+    return SQLiteJobQueue(
+        path or settings.get('path', DEFAULT_QUEUE_PATH),
+        lease_seconds=settings.get('lease_seconds', DEFAULT_LEASE_SECONDS),
+        max_attempts=settings.get('max_attempts', DEFAULT_MAX_ATTEMPTS),
+        retry_backoff=settings.get('retry_backoff', DEFAULT_RETRY_BACKOFF),
+    )
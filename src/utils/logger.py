@@ -2,12 +2,16 @@
 Logging utilities for the resume evaluator system.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 
 
@@ -33,6 +37,138 @@ class CustomFormatter(logging.Formatter):
         return super().format(record)
 
 
+class BufferedJsonlWriter:
+    """Appends JSON lines to a file from a background writer thread.
+    
+    Callers only enqueue the record, so the per-event cost on the calling
+    thread is a queue put. The writer thread serializes records and writes
+    them in batches, keeping the file open between batches. Once closed,
+    records are written synchronously by the caller instead, so loggers
+    still holding the writer at interpreter exit do not lose them.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, filename: str, batch_size: int = 512):
+        self.filename = filename
+        self.batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"jsonl-writer:{filename}", daemon=True
+        )
+        self._thread.start()
+    
+    def write(self, record: Dict[str, Any]):
+        """Queue a record for writing, or write it now if the writer was closed."""
+        with self._lock:
+            if not self._closed:
+                self._queue.put(record)
+                return
+            handle = self._open()
+            if handle is not None:
+                with handle:
+                    self._write_lines(handle, [json.dumps(record, default=str)])
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until everything queued so far has been written."""
+        with self._lock:
+            if self._closed:
+                return True
+            done = threading.Event()
+            self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = 5.0):
+        """Write any queued records and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._STOP)
+        self._thread.join(timeout)
+    
+    def _open(self):
+        try:
+            directory = os.path.dirname(self.filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            return open(self.filename, 'a', encoding='utf-8')
+        except Exception as e:
+            print(f"Failed to write {self.filename}: {e}", file=sys.stderr)
+            return None
+    
+    def _write_lines(self, handle, lines: List[str]) -> bool:
+        try:
+            handle.write('\n'.join(lines) + '\n')
+            handle.flush()
+            return True
+        except Exception as e:
+            print(f"Failed to write {self.filename}: {e}", file=sys.stderr)
+            return False
+    
+    def _run(self):
+        handle = None
+        while True:
+            batch: List[Any] = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [json.dumps(item, default=str) for item in batch if isinstance(item, dict)]
+            if lines:
+                if handle is None:
+                    handle = self._open()
+                if handle is not None and not self._write_lines(handle, lines):
+                    handle = None
+            
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if any(item is self._STOP for item in batch):
+                if handle is not None:
+                    handle.close()
+                return
+
+
+_jsonl_writers: Dict[str, BufferedJsonlWriter] = {}
+_jsonl_writers_lock = threading.Lock()
+
+
+def get_jsonl_writer(filename: str) -> BufferedJsonlWriter:
+    """Return the shared buffered writer for a file, starting it on first use."""
+    key = os.path.abspath(filename)
+    writer = _jsonl_writers.get(key)
+    if writer is None:
+        with _jsonl_writers_lock:
+            writer = _jsonl_writers.get(key)
+            if writer is None:
+                writer = _jsonl_writers[key] = BufferedJsonlWriter(filename)
+    return writer
+
+
+def flush_log_writers(timeout: Optional[float] = 5.0):
+    """Wait for all buffered performance and audit records to reach disk."""
+    for writer in list(_jsonl_writers.values()):
+        writer.flush(timeout)
+
+
+@atexit.register
+def shutdown_log_writers():
+    """Flush and stop every buffered writer; runs automatically at exit.
+
+    Loggers that still hold a stopped writer keep logging, synchronously.
+    """
+    with _jsonl_writers_lock:
+        writers = list(_jsonl_writers.values())
+        _jsonl_writers.clear()
+    for writer in writers:
+        writer.close()
+
+
 class StructuredLogger:
     """Structured logger for the resume evaluator system."""
     
@@ -40,6 +176,8 @@ class StructuredLogger:
         self.name = name
         self.config = config
         self.logger = self._setup_logger()
+        self._performance_writer = None
+        self._audit_writer = None
         
     def _setup_logger(self) -> logging.Logger:
         """Set up logger with file and console handlers."""
@@ -49,8 +187,7 @@ class StructuredLogger:
         logger.handlers.clear()
         
         # Set log level
-        log_level = getattr(logging, self.config.get('level', 'INFO').upper())
-        logger.setLevel(log_level)
+        logger.setLevel(resolve_log_level(self.name, self.config))
         
         # Create logs directory if it doesn't exist
         log_dir = Path('logs')
@@ -96,28 +233,42 @@ class StructuredLogger:
             encoding='utf-8'
         )
     
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if messages at ``level`` would be emitted."""
+        return self.logger.isEnabledFor(level)
+    
+    def info(self, message: str, *args, extra: Optional[Dict[str, Any]] = None):
         """Log info message."""
-        self._log_with_extra(logging.INFO, message, extra)
+        self._log_with_extra(logging.INFO, message, args, extra)
     
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: bool = False):
+    def error(self, message: str, *args, extra: Optional[Dict[str, Any]] = None, exc_info: bool = False):
         """Log error message."""
-        self._log_with_extra(logging.ERROR, message, extra, exc_info=exc_info)
+        self._log_with_extra(logging.ERROR, message, args, extra, exc_info=exc_info)
     
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def warning(self, message: str, *args, extra: Optional[Dict[str, Any]] = None):
         """Log warning message."""
-        self._log_with_extra(logging.WARNING, message, extra)
+        self._log_with_extra(logging.WARNING, message, args, extra)
     
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def debug(self, message: str, *args, extra: Optional[Dict[str, Any]] = None):
         """Log debug message."""
-        self._log_with_extra(logging.DEBUG, message, extra)
+        self._log_with_extra(logging.DEBUG, message, args, extra)
     
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def critical(self, message: str, *args, extra: Optional[Dict[str, Any]] = None):
         """Log critical message."""
-        self._log_with_extra(logging.CRITICAL, message, extra)
+        self._log_with_extra(logging.CRITICAL, message, args, extra)
     
-    def _log_with_extra(self, level: int, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: bool = False):
-        """Log message with extra context."""
+    def _log_with_extra(self, level: int, message: str, args: tuple = (), extra: Optional[Dict[str, Any]] = None,
+                        exc_info: bool = False):
+        """Log message with extra context.
+        
+        Formatting is lazy: ``message % args`` and the context JSON are only
+        built once the level check has passed, so disabled levels cost a
+        single comparison.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
         if extra:
             message = f"{message} | Context: {json.dumps(extra, default=str)}"
         
@@ -134,37 +285,59 @@ class StructuredLogger:
         if extra:
             perf_data.update(extra)
         
-        # Write to performance log file
-        perf_log_file = self.config.get('performance_log', 'logs/performance.log')
-        try:
-            with open(perf_log_file, 'a', encoding='utf-8') as f:
-                f.write(f"{json.dumps(perf_data)}\n")
-        except Exception as e:
-            self.error(f"Failed to write performance log: {e}")
+        # Queue for the buffered performance log writer
+        if self._performance_writer is None:
+            self._performance_writer = get_jsonl_writer(self.config.get('performance_log', 'logs/performance.log'))
+        self._performance_writer.write(perf_data)
         
-        self.info(f"Performance: {operation} took {duration:.3f}s", extra)
+        self.info("Performance: %s took %.3fs", operation, duration, extra=extra)
     
     def log_audit(self, action: str, details: Dict[str, Any]):
         """Log audit trail."""
         audit_data = {
             'action': action,
             'timestamp': datetime.now().isoformat(),
-            'details': details
+            'details': dict(details)
         }
         
-        # Write to audit log file
-        audit_log_file = self.config.get('audit_log', 'logs/audit.log')
-        try:
-            with open(audit_log_file, 'a', encoding='utf-8') as f:
-                f.write(f"{json.dumps(audit_data)}\n")
-        except Exception as e:
-            self.error(f"Failed to write audit log: {e}")
+        # Queue for the buffered audit log writer
+        if self._audit_writer is None:
+            self._audit_writer = get_jsonl_writer(self.config.get('audit_log', 'logs/audit.log'))
+        self._audit_writer.write(audit_data)
         
-        self.info(f"Audit: {action}", audit_data['details'])
+        self.info("Audit: %s", action, extra=audit_data['details'])
+
+
+def resolve_log_level(name: str, config: Dict[str, Any]) -> int:
+    """Resolve the log level for a named logger.
+    
+    Precedence, highest first: the ``LOG_LEVEL_<NAME>`` environment variable
+    (e.g. ``LOG_LEVEL_PARSER=DEBUG``), the ``levels`` mapping in the config,
+    ``DEBUG=true`` or ``LOG_LEVEL`` in the environment, then the config
+    ``level``.
+    """
+    env_name = 'LOG_LEVEL_' + ''.join(c if c.isalnum() else '_' for c in name).upper()
+    level = (
+        os.getenv(env_name)
+        or config.get('levels', {}).get(name)
+        or ('DEBUG' if os.getenv('DEBUG', '').lower() == 'true' else None)
+        or os.getenv('LOG_LEVEL')
+        or config.get('level', 'INFO')
+    )
+    return getattr(logging, str(level).upper(), logging.INFO)
+
+
+_structured_loggers: Dict[str, StructuredLogger] = {}
 
 
 def get_logger(name: str, config: Optional[Dict[str, Any]] = None) -> StructuredLogger:
-    """Get a structured logger instance."""
+    """Get a structured logger instance.
+    
+    Loggers are cached by name so modules can call this at construction
+    time without rebuilding handlers; passing a config rebuilds the logger.
+    """
+    if config is None and name in _structured_loggers:
+        return _structured_loggers[name]
     if config is None:
         config = {
             'level': 'INFO',
@@ -178,7 +351,9 @@ def get_logger(name: str, config: Optional[Dict[str, Any]] = None) -> Structured
             'backup_count': 5
         }
     
-    return StructuredLogger(name, config)
+    logger = StructuredLogger(name, config)
+    _structured_loggers[name] = logger
+    return logger
 
 
 # Global logger instances
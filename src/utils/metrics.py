@@ -0,0 +1,129 @@
+"""
+Per-stage timing and throughput metrics for the evaluation pipeline.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class StageStats:
+    """Accumulated samples for a single stage or external call."""
+    __slots__ = ('durations', 'items', 'bytes', 'cache_hits', 'cache_lookups', 'errors')
+
+    def __init__(self):
+        self.durations: List[float] = []
+        self.items = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+        self.errors = 0
+
+    def summary(self) -> Dict[str, Any]:
+        durations = sorted(self.durations)
+        total = sum(durations)
+        return {
+            'calls': len(durations),
+            'errors': self.errors,
+            'total_seconds': round(total, 6),
+            'p50_seconds': round(percentile(durations, 50), 6),
+            'p95_seconds': round(percentile(durations, 95), 6),
+            'max_seconds': round(durations[-1], 6) if durations else 0.0,
+            'items': self.items,
+            'items_per_second': round(self.items / total, 3) if total else 0.0,
+            'bytes': self.bytes,
+            'bytes_per_second': round(self.bytes / total, 3) if total else 0.0,
+            'cache_hit_ratio': round(self.cache_hits / self.cache_lookups, 4) if self.cache_lookups else None,
+        }
+
+
+class StageTimer:
+    """Mutable handle yielded by ``PipelineMetrics.timer`` so callers can report what the call did."""
+    __slots__ = ('items', 'bytes', 'cache_hit', 'error')
+
+    def __init__(self, items: int = 0):
+        self.items = items
+        self.bytes = 0
+        self.cache_hit: Optional[bool] = None
+        self.error = False
+
+
+class PipelineMetrics:
+    """Collects wall time, item counts, bytes and cache hits per pipeline stage.
+
+    Stage names are dotted, e.g. ``task.parse`` for a whole task or
+    ``github.request`` for individual external calls. Recording is
+    thread-safe so agents can share one instance.
+    """
+
+    def __init__(self, performance_logger=None):
+        self.performance_logger = performance_logger
+        self.started_at = datetime.now().isoformat()
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, duration: float, items: int = 0, nbytes: int = 0,
+               cache_hit: Optional[bool] = None, error: bool = False) -> None:
+        """Record one call of a stage."""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = StageStats()
+            stats.durations.append(duration)
+            stats.items += items
+            stats.bytes += nbytes
+            if cache_hit is not None:
+                stats.cache_lookups += 1
+                stats.cache_hits += int(cache_hit)
+            if error:
+                stats.errors += 1
+
+    @contextmanager
+    def timer(self, stage: str, items: int = 0) -> Iterator[StageTimer]:
+        """Time a block and record it under ``stage`` when it exits."""
+        handle = StageTimer(items)
+        start = time.perf_counter()
+        try:
+            yield handle
+        except Exception:
+            handle.error = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self.record(stage, duration, handle.items, handle.bytes, handle.cache_hit, handle.error)
+            if self.performance_logger is not None and stage.startswith('task.'):
+                self.performance_logger.log_performance(
+                    stage, duration, {'items': handle.items, 'bytes': handle.bytes}
+                )
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the per-stage latency and throughput summary."""
+        with self._lock:
+            stages = {name: stats.summary() for name, stats in sorted(self._stages.items())}
+        return {
+            'started_at': self.started_at,
+            'finished_at': datetime.now().isoformat(),
+            'stages': stages
+        }
+
+    def write(self, path: str = 'outputs/metrics.json') -> str:
+        """Write the summary as JSON and return the path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
@@ -0,0 +1,527 @@
+"""
+Deterministic fake Gmail, GitHub, LinkedIn and portfolio data, and a local
+HTTP server that serves it.
+
+Used by the benchmark suite and for offline load tests: point the agents at
+the server with the ``mock`` transport backend (see ``src.utils.transport``).
+The server can add latency, fail a fraction of requests and enforce a rate
+limit with GitHub-style ``X-RateLimit-*`` headers. Every fixture is derived
+from ``(seed, username)`` so the same corpus always produces byte-identical
+responses.
+
+Run standalone with::
+
+    python -m src.utils.mock_services --port 8765 --latency 0.05 --error-rate 0.02 \\
+        --rate-limit 5000 --resumes-dir benchmarks/corpus/resumes
+"""
+
+import argparse
+import base64
+import json
+import math
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+# Fixed reference date so generated event timestamps do not depend on when they are built
+FIXTURE_EPOCH = datetime(2024, 1, 1)
+
+FIRST_NAMES = ['Ada', 'Grace', 'Alan', 'Linus', 'Margaret', 'Dennis', 'Barbara', 'Ken',
+               'Frances', 'Guido', 'Radia', 'Edsger', 'Hedy', 'Bjarne', 'Katherine', 'Niklaus']
+LAST_NAMES = ['Lovelace', 'Hopper', 'Turing', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov',
+              'Thompson', 'Allen', 'Rossum', 'Perlman', 'Dijkstra', 'Lamarr', 'Stroustrup']
+SKILLS = ['Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'SQL', 'PostgreSQL',
+          'Docker', 'Kubernetes', 'AWS', 'Git', 'Machine Learning', 'TensorFlow', 'PyTorch',
+          'GraphQL', 'CI/CD', 'React', 'Django', 'Flask', 'Redis', 'Terraform']
+LANGUAGES = ['Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C++', 'Shell']
+TOPICS = ['api', 'machine-learning', 'devops', 'web-development', 'cli', 'security',
+          'data-science', 'docker', 'kubernetes', 'graphql']
+DEGREES = ['B.Tech', 'M.Tech', 'B.S.', 'M.S.', 'PhD', 'MBA', 'B.Sc.']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'Polytechnic University']
+COMPANIES = ['Initech', 'Globex', 'Hooli', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech', 'Acme Corp']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Data Engineer', 'Backend Developer',
+          'Machine Learning Engineer', 'DevOps Engineer', 'Full Stack Developer']
+EVENT_TYPES = ['PushEvent', 'PushEvent', 'PushEvent', 'PullRequestEvent', 'IssuesEvent', 'WatchEvent']
+
+
+def _rng(seed: int, username: str, kind: str) -> random.Random:
+    return random.Random(f"{seed}:{username}:{kind}")
+
+
+def fake_identity(seed: int, index: int) -> Dict[str, Any]:
+    """Return the deterministic identity of the ``index``-th synthetic candidate."""
+    rng = random.Random(f"{seed}:identity:{index}")
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    username = f"{first}-{last}-{index}".lower()
+    return {
+        'name': f"{first} {last}",
+        'username': username,
+        'email': f"{first}.{last}{index}@example.com".lower(),
+        'skills': sorted(rng.sample(SKILLS, rng.randint(3, 10))),
+        'experience_years': rng.randint(0, 15),
+        'degree': rng.choice(DEGREES),
+        'school': rng.choice(SCHOOLS),
+    }
+
+
+def fake_github_user(seed: int, username: str) -> Dict[str, Any]:
+    rng = _rng(seed, username, 'user')
+    return {
+        'login': username,
+        'id': rng.randint(1000, 10 ** 8),
+        'type': 'User',
+        'name': username.replace('-', ' ').title(),
+        'public_repos': rng.randint(0, 60),
+        'followers': rng.randint(0, 500),
+        'following': rng.randint(0, 200),
+        'created_at': (FIXTURE_EPOCH - timedelta(days=rng.randint(100, 4000))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+    }
+
+
+def fake_github_repos(seed: int, username: str) -> List[Dict[str, Any]]:
+    rng = _rng(seed, username, 'repos')
+    repos = []
+    for i in range(rng.randint(0, 30)):
+        language = rng.choice(LANGUAGES) if rng.random() < 0.85 else None
+        topics = rng.sample(TOPICS, rng.randint(0, 3))
+        repos.append({
+            'name': f"project-{i}",
+            'full_name': f"{username}/project-{i}",
+            'fork': rng.random() < 0.2,
+            'language': language,
+            'topics': topics,
+            'description': f"A {language or 'polyglot'} project using {', '.join(rng.sample(SKILLS, 2))}",
+            'stargazers_count': int(rng.paretovariate(1.5)) - 1,
+            'forks_count': rng.randint(0, 10),
+            'updated_at': (FIXTURE_EPOCH - timedelta(days=rng.randint(0, 900))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        })
+    return repos
+
+
+def fake_github_events(seed: int, username: str) -> List[Dict[str, Any]]:
+    rng = _rng(seed, username, 'events')
+    events = []
+    for i in range(rng.randint(0, 90)):
+        event_type = rng.choice(EVENT_TYPES)
+        payload = {}
+        if event_type == 'PushEvent':
+            payload['commits'] = [{'sha': f"{rng.getrandbits(40):010x}"} for _ in range(rng.randint(1, 5))]
+        events.append({
+            'id': str(i),
+            'type': event_type,
+            'repo': {'name': f"{username}/project-{rng.randint(0, 9)}"},
+            'payload': payload,
+            'created_at': (FIXTURE_EPOCH - timedelta(hours=rng.randint(0, 24 * 120))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        })
+    return events
+
+
+def fake_linkedin_html(seed: int, username: str) -> str:
+    """Render a public-profile page using the markup LinkedInAgent scrapes."""
+    rng = _rng(seed, username, 'linkedin')
+    name = escape(username.rsplit('-', 1)[0].replace('-', ' ').title())
+    skills = ''.join(
+        f'<li><span class="mr1 t-bold">{escape(skill)}</span></li>'
+        for skill in rng.sample(SKILLS, rng.randint(0, 12))
+    )
+    positions = ''.join(
+        '<li class="pv-entity__position-group-pager">'
+        f'<h3 class="pv-entity__name">{escape(rng.choice(TITLES))}</h3>'
+        f'<p class="pv-entity__secondary-title">{escape(rng.choice(COMPANIES))}</p>'
+        f'<span class="pv-entity__date-range">{2010 + i} - {2012 + i}</span>'
+        '</li>'
+        for i in range(rng.randint(0, 5))
+    )
+    schools = ''.join(
+        '<li class="pv-education-entity">'
+        f'<h3 class="pv-entity__school-name">{escape(rng.choice(SCHOOLS))}</h3>'
+        f'<p class="pv-entity__degree-name">{escape(rng.choice(DEGREES))}</p>'
+        '<p class="pv-entity__fos">Computer Science</p>'
+        '</li>'
+        for _ in range(rng.randint(0, 2))
+    )
+    return (
+        '<!DOCTYPE html><html><head><title>LinkedIn</title></head><body>'
+        f'<h1 class="text-heading-xlarge">{name}</h1>'
+        f'<div class="text-body-medium">{escape(rng.choice(TITLES))} at {escape(rng.choice(COMPANIES))}</div>'
+        '<span class="text-body-small">Remote</span>'
+        f'<section id="skills-section"><ul>{skills}</ul></section>'
+        f'<section id="experience-section"><ul>{positions}</ul></section>'
+        f'<section id="education-section"><ul>{schools}</ul></section>'
+        '</body></html>'
+    )
+
+
+def fake_portfolio_html(seed: int, username: str) -> str:
+    rng = _rng(seed, username, 'portfolio')
+    paragraphs = ''.join(
+        f"<p>Built a {rng.choice(TOPICS)} project with {escape(', '.join(rng.sample(SKILLS, 3)))}.</p>"
+        for _ in range(rng.randint(1, 8))
+    )
+    return f'<!DOCTYPE html><html><body><h1>{escape(username)}</h1>{paragraphs}</body></html>'
+
+
+def write_fixtures(fixtures_dir: str, seed: int, usernames: List[str]) -> None:
+    """Write GitHub JSON and LinkedIn/portfolio HTML fixtures for ``usernames``.
+
+    Layout: ``github/<user>/{user,repos,events}.json``, ``linkedin/<user>.html``
+    and ``portfolio/<user>.html``, the same layout ``MockServiceServer`` serves.
+    """
+    for username in usernames:
+        github_dir = os.path.join(fixtures_dir, 'github', username)
+        os.makedirs(github_dir, exist_ok=True)
+        for name, data in (('user', fake_github_user(seed, username)),
+                           ('repos', fake_github_repos(seed, username)),
+                           ('events', fake_github_events(seed, username))):
+            with open(os.path.join(github_dir, f"{name}.json"), 'w') as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+        for kind, render in (('linkedin', fake_linkedin_html), ('portfolio', fake_portfolio_html)):
+            os.makedirs(os.path.join(fixtures_dir, kind), exist_ok=True)
+            with open(os.path.join(fixtures_dir, kind, f"{username}.html"), 'w') as f:
+                f.write(render(seed, username))
+
+
+MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+NOT_FOUND = (404, 'application/json', b'{"message": "Not Found"}')
+
+
+class MockServiceServer:
+    """Local stand-in for Gmail, the GitHub API, LinkedIn public profiles and portfolio sites.
+
+    Routes (relative to ``url``)::
+
+        /gmail/v1/users/me/messages                       Gmail message list
+        /gmail/v1/users/me/messages/<id>                  Gmail message
+        /gmail/v1/users/me/messages/<id>/attachments/<a>  Gmail attachment
+        /github/users/<user>[/repos|/events]              GitHub JSON
+        /linkedin/in/<user>/                              LinkedIn public profile HTML
+        /portfolio/<user>                                 portfolio HTML
+        /web/<host>/<path>                                any other site, as portfolio HTML
+
+    Gmail serves one message per file in ``resumes_dir`` (no messages without
+    it). With ``fixtures_dir`` GitHub, LinkedIn and portfolio responses are
+    read from files written by ``write_fixtures`` (unknown users get a 404);
+    otherwise they are generated from ``seed``.
+
+    Load shaping, all off by default: every request is delayed by ``latency``
+    seconds +/- ``latency_jitter``, a fraction ``error_rate`` fail with a 5xx,
+    and ``rate_limit`` requests per ``rate_limit_window`` seconds are allowed
+    before a 429 with ``Retry-After``. Injected failures are drawn from a
+    generator seeded with ``seed`` so runs are repeatable.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 fixtures_dir: Optional[str] = None, seed: int = 0, resumes_dir: Optional[str] = None,
+                 latency: float = 0.0, latency_jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit: Optional[int] = None, rate_limit_window: float = 60.0):
+        self.fixtures_dir = fixtures_dir
+        self.seed = seed
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.stats = {'requests': 0, 'errors_injected': 0, 'rate_limited': 0}
+        self.resumes = sorted(
+            name for name in os.listdir(resumes_dir) if os.path.splitext(name)[1].lower() in MIME_TYPES
+        ) if resumes_dir else []
+        self.resumes_dir = resumes_dir
+        self._rng = random.Random(seed)
+        self._window_start = time.time()
+        self._window_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def requests(self) -> int:
+        return self.stats['requests']
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def config_overrides(self) -> Dict[str, Dict[str, str]]:
+        """Config sections that route GitHub and LinkedIn requests to this server."""
+        return {
+            'github': {'api_url': f"{self.url}/github"},
+            'linkedin': {'base_url': f"{self.url}/linkedin"},
+        }
+
+    def linkedin_url(self, username: str) -> str:
+        return f"{self.url}/linkedin/in/{username}/"
+
+    def portfolio_url(self, username: str) -> str:
+        return f"{self.url}/portfolio/{username}"
+
+    def start(self) -> 'MockServiceServer':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='mock-services', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'MockServiceServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def admit(self) -> Tuple[Optional[int], float, Dict[str, str]]:
+        """Apply load shaping to one request.
+
+        Returns ``(status, delay, headers)``: ``status`` is set when the
+        request must fail (429 or an injected 5xx), ``delay`` is the latency to
+        add and ``headers`` are the rate-limit headers to send.
+        """
+        headers = {}
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = max(self.latency + self._rng.uniform(-self.latency_jitter, self.latency_jitter), 0.0)
+            if self.rate_limit is not None:
+                now = time.time()
+                if now - self._window_start >= self.rate_limit_window:
+                    self._window_start = now
+                    self._window_count = 0
+                self._window_count += 1
+                reset = self._window_start + self.rate_limit_window
+                headers = {
+                    'X-RateLimit-Limit': str(self.rate_limit),
+                    'X-RateLimit-Remaining': str(max(self.rate_limit - self._window_count, 0)),
+                    'X-RateLimit-Reset': str(int(math.ceil(reset))),
+                }
+                if self._window_count > self.rate_limit:
+                    self.stats['rate_limited'] += 1
+                    headers['Retry-After'] = str(max(int(math.ceil(reset - now)), 1))
+                    return 429, 0.0, headers
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.stats['errors_injected'] += 1
+                return self._rng.choice((500, 502, 503)), delay, headers
+        return None, delay, headers
+
+    def resolve(self, path: str) -> Tuple[int, str, bytes]:
+        """Map a request path to ``(status, content_type, body)``."""
+        split = urlsplit(path)
+        parts = [part for part in split.path.split('/') if part]
+        if parts[:4] == ['gmail', 'v1', 'users', 'me'] and len(parts) > 4 and parts[4] == 'messages':
+            return self._gmail(parts[5:], parse_qs(split.query))
+        if len(parts) >= 3 and parts[0] == 'github' and parts[1] == 'users':
+            username = parts[2]
+            kind = parts[3] if len(parts) > 3 else 'user'
+            builders = {'user': fake_github_user, 'repos': fake_github_repos, 'events': fake_github_events}
+            if kind in builders and len(parts) <= 4:
+                return self._fixture(os.path.join('github', username, f"{kind}.json"),
+                                     'application/json', lambda: json.dumps(builders[kind](self.seed, username)))
+        elif len(parts) == 3 and parts[:2] == ['linkedin', 'in']:
+            username = parts[2]
+            return self._fixture(os.path.join('linkedin', f"{username}.html"),
+                                 'text/html; charset=utf-8', lambda: fake_linkedin_html(self.seed, username))
+        elif len(parts) == 2 and parts[0] == 'portfolio':
+            username = parts[1]
+            return self._fixture(os.path.join('portfolio', f"{username}.html"),
+                                 'text/html; charset=utf-8', lambda: fake_portfolio_html(self.seed, username))
+        elif len(parts) >= 2 and parts[0] == 'web':
+            page = '/'.join(parts[1:])
+            return 200, 'text/html; charset=utf-8', fake_portfolio_html(self.seed, page).encode('utf-8')
+        return NOT_FOUND
+
+    def _fixture(self, relative_path: str, content_type: str, generate) -> Tuple[int, str, bytes]:
+        if self.fixtures_dir is None:
+            return 200, content_type, generate().encode('utf-8')
+        try:
+            with open(os.path.join(self.fixtures_dir, relative_path), 'rb') as f:
+                return 200, content_type, f.read()
+        except FileNotFoundError:
+            return NOT_FOUND
+
+    def _gmail(self, parts: List[str], query: Dict[str, List[str]]) -> Tuple[int, str, bytes]:
+        if not parts:
+            max_results = int(query.get('maxResults', ['100'])[0])
+            start = int(query.get('pageToken', ['0'])[0])
+            end = min(len(self.resumes), start + max_results)
+            messages = [{'id': f"msg{i:06d}", 'threadId': f"msg{i:06d}"} for i in range(start, end)]
+            body = {'messages': messages, 'resultSizeEstimate': len(messages)} if messages else {'resultSizeEstimate': 0}
+            if end < len(self.resumes):
+                body['nextPageToken'] = str(end)
+            return 200, 'application/json', json.dumps(body).encode('utf-8')
+
+        index = self._gmail_index(parts[0], 'msg')
+        if index is None:
+            return NOT_FOUND
+        filename = self.resumes[index]
+        path = os.path.join(self.resumes_dir, filename)
+        if len(parts) == 1:
+            message = self._gmail_message(index, filename, os.path.getsize(path))
+            return 200, 'application/json', json.dumps(message).encode('utf-8')
+        if len(parts) == 3 and parts[1] == 'attachments' and self._gmail_index(parts[2], 'att') == index:
+            with open(path, 'rb') as f:
+                data = f.read()
+            body = {'size': len(data), 'data': base64.urlsafe_b64encode(data).decode('ascii')}
+            return 200, 'application/json', json.dumps(body).encode('utf-8')
+        return NOT_FOUND
+
+    def _gmail_index(self, identifier: str, prefix: str) -> Optional[int]:
+        if not identifier.startswith(prefix) or not identifier[len(prefix):].isdigit():
+            return None
+        index = int(identifier[len(prefix):])
+        return index if index < len(self.resumes) else None
+
+    def _gmail_message(self, index: int, filename: str, size: int) -> Dict[str, Any]:
+        identity = fake_identity(self.seed, index)
+        text = base64.urlsafe_b64encode(b'Please find my resume attached.').decode('ascii')
+        return {
+            'id': f"msg{index:06d}",
+            'threadId': f"msg{index:06d}",
+            'labelIds': ['INBOX'],
+            'sizeEstimate': size,
+            'payload': {
+                'mimeType': 'multipart/mixed',
+                'headers': [
+                    {'name': 'From', 'value': f"{identity['name']} <{identity['email']}>"},
+                    {'name': 'To', 'value': 'recruiting@example.com'},
+                    {'name': 'Subject', 'value': f"Resume - {identity['name']}"},
+                ],
+                'parts': [
+                    {'partId': '0', 'mimeType': 'text/plain', 'filename': '',
+                     'body': {'size': 31, 'data': text}},
+                    {'partId': '1', 'mimeType': MIME_TYPES[os.path.splitext(filename)[1].lower()],
+                     'filename': filename, 'body': {'attachmentId': f"att{index:06d}", 'size': size}},
+                ],
+            },
+        }
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status, delay, headers = service.admit()
+                if delay:
+                    time.sleep(delay)
+                if status is None:
+                    status, content_type, body = service.resolve(self.path)
+                else:
+                    content_type = 'application/json'
+                    body = json.dumps({'message': self.responses.get(status, ('Error',))[0]}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class _GmailCall:
+    """Deferred request with the ``execute()`` interface of googleapiclient requests."""
+
+    def __init__(self, service: 'LocalGmailService', path: str, params: Dict[str, Any]):
+        self.service = service
+        self.path = path
+        self.params = {key: value for key, value in params.items() if value is not None}
+
+    def execute(self) -> Dict[str, Any]:
+        response = self.service.transport.get(f"{self.service.base_url}{self.path}", params=self.params)
+        response.raise_for_status()
+        return response.json()
+
+
+class _GmailAttachments:
+    def __init__(self, service: 'LocalGmailService'):
+        self.service = service
+
+    def get(self, userId: str, messageId: str, id: str, **params) -> _GmailCall:
+        return _GmailCall(self.service, f"/users/{userId}/messages/{messageId}/attachments/{id}", params)
+
+
+class _GmailMessages:
+    def __init__(self, service: 'LocalGmailService'):
+        self.service = service
+
+    def list(self, userId: str, **params) -> _GmailCall:
+        return _GmailCall(self.service, f"/users/{userId}/messages", params)
+
+    def get(self, userId: str, id: str, **params) -> _GmailCall:
+        return _GmailCall(self.service, f"/users/{userId}/messages/{id}", params)
+
+    def attachments(self) -> _GmailAttachments:
+        return _GmailAttachments(self.service)
+
+
+class LocalGmailService:
+    """Gmail client speaking the REST API over a transport, for use with MockServiceServer.
+
+    Implements the subset of the googleapiclient Gmail service EmailAgent
+    uses (``users().messages().list/get`` and ``attachments().get``), so it
+    can be passed to EmailAgent in place of the real service. With the
+    ``mock`` transport the Gmail host is rewritten to the local server.
+    """
+
+    def __init__(self, transport, base_url: str = 'https://gmail.googleapis.com/gmail/v1'):
+        self.transport = transport
+        self.base_url = base_url.rstrip('/')
+
+    def users(self) -> 'LocalGmailService':
+        return self
+
+    def messages(self) -> _GmailMessages:
+        return _GmailMessages(self)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the local Gmail/GitHub/LinkedIn stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixtures-dir', help='serve GitHub/LinkedIn/portfolio fixtures from this directory')
+    parser.add_argument('--resumes-dir', help='serve one Gmail message per resume in this directory')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests failing with a 5xx')
+    parser.add_argument('--rate-limit', type=int, help='requests allowed per window before 429')
+    parser.add_argument('--rate-limit-window', type=float, default=60.0)
+    args = parser.parse_args()
+
+    server = MockServiceServer(
+        host=args.host, port=args.port, fixtures_dir=args.fixtures_dir, seed=args.seed,
+        resumes_dir=args.resumes_dir, latency=args.latency, latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate, rate_limit=args.rate_limit, rate_limit_window=args.rate_limit_window
+    )
+    print(f"Mock services listening on {server.url} (Ctrl+C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+OCR fallback for PDF pages without a text layer.
+
+Scanned resumes are image-only, so PyMuPDF extracts no text from them. Only
+those pages are rendered (at ``[ocr] dpi``) and recognized with Tesseract via
+pytesseract, one page per task in a process pool. Results are cached on disk
+keyed by a hash of the page's content stream and embedded images, so a scanned
+resume that arrives again is never rendered or recognized twice.
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Optional
+
+from src.utils.logger import get_logger
+
+
+DEFAULT_DPI = 300
+DEFAULT_LANGUAGE = 'eng'
+DEFAULT_CACHE_DIR = 'outputs/ocr_cache'
+
+
+def recognize_png(png: bytes, language: str = DEFAULT_LANGUAGE) -> str:
+    """OCR one rendered page. Top level so it can run in a worker process."""
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as image:
+        return pytesseract.image_to_string(image, lang=language)
+
+
+class PageOCR:
+    """Recognizes textless PDF pages in parallel with a persistent result cache.
+
+    Settings come from the optional ``[ocr]`` config section. The process
+    pool is started on first use and reused for later documents.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        settings = (config or {}).get('ocr', {})
+        self.enabled = settings.get('enabled', True)
+        self.dpi = settings.get('dpi', DEFAULT_DPI)
+        self.language = settings.get('language', DEFAULT_LANGUAGE)
+        self.processes = settings.get('processes') or os.cpu_count() or 1
+        self.cache_dir = settings.get('cache_dir', DEFAULT_CACHE_DIR)
+        self.logger = get_logger('ocr')
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._available: Optional[bool] = None
+
+    def available(self) -> bool:
+        """True if OCR is enabled and pytesseract and the tesseract binary are installed.
+
+        Checked once; enabled but unavailable OCR is logged as a warning, since
+        scanned resumes then come back without text.
+        """
+        if not self.enabled:
+            return False
+        if self._available is None:
+            try:
+                import pytesseract
+                pytesseract.get_tesseract_version()
+                self._available = True
+            except Exception as e:
+                self.logger.warning("OCR is enabled but unavailable, scanned PDF pages will have no text: %s "
+                                    "(install pytesseract and tesseract, or set [ocr] enabled = false)", e)
+                self._available = False
+        return self._available
+
+    def page_key(self, doc, page) -> str:
+        """Hash of what a page draws: its content stream and the raw bytes of its images."""
+        digest = hashlib.sha256(f"{self.dpi}:{self.language}".encode())
+        digest.update(page.read_contents())
+        for image in page.get_images(full=True):
+            digest.update(doc.xref_stream_raw(image[0]) or b'')
+        return digest.hexdigest()
+
+    def recognize(self, doc, page_numbers: Iterable[int]) -> Dict[int, str]:
+        """Return OCR text for the given 0-based page numbers of an open document."""
+        results: Dict[int, str] = {}
+        pending = {}
+        for number in page_numbers:
+            page = doc[number]
+            key = self.page_key(doc, page)
+            cached = self._load(key)
+            if cached is not None:
+                results[number] = cached
+                continue
+            png = page.get_pixmap(dpi=self.dpi).tobytes('png')
+            pending[number] = (key, png)
+        if not pending:
+            return results
+
+        self.logger.debug("OCR of %d pages (%d cached)", len(pending), len(results))
+        if len(pending) == 1 or self.processes == 1:
+            texts = [recognize_png(png, self.language) for _, png in pending.values()]
+        else:
+            pool = self._get_pool()
+            texts = list(pool.map(recognize_png, [png for _, png in pending.values()],
+                                  [self.language] * len(pending)))
+        for (number, (key, _)), text in zip(pending.items(), texts):
+            self._store(key, text)
+            results[number] = text
+        return results
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        return self._pool
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def _load(self, key: str) -> Optional[str]:
+        path = self._cache_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def _store(self, key: str, text: str) -> None:
+        path = self._cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
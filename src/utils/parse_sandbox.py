@@ -0,0 +1,175 @@
+"""
+Sandboxed resume parsing.
+
+A malformed or enormous document can hang PyMuPDF (``find_tables`` on a
+pathological page) or exhaust memory. ``SandboxedParser`` runs
+``ResumeParser`` in a separate worker process with an address-space limit
+and gives every document a wall-clock budget. A document that times out,
+runs out of memory or crashes the worker is returned as a structured parse
+error, the worker is replaced, and the rest of the batch carries on. PDFs
+over ``[parsing] max_pages`` are rejected by the parser before extraction.
+
+The worker stays up between documents, so the only per-document overhead is
+sending the filename and the path (spilled attachments) or bytes.
+"""
+
+import multiprocessing
+import multiprocessing.util
+import time
+from typing import Dict, Any, Optional
+
+from src.utils.attachment_store import StoredAttachment, as_stored
+from src.utils.logger import get_logger
+from src.utils.profiling import ParseProfiler
+
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_MEMORY_LIMIT_MB = 2048
+
+
+def parse_error(filename: str, kind: str, message: str, seconds: float) -> Dict[str, Any]:
+    """Candidate record for a document the sandbox had to give up on."""
+    return {
+        'filename': filename,
+        'error': message,
+        'parse_error': {'type': kind, 'seconds': round(seconds, 3)},
+    }
+
+
+def _limit_memory(limit_mb: int) -> None:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _serve(conn, config: Dict[str, Any], memory_limit_mb: Optional[int]) -> None:
+    """Worker loop: parse (filename, path, data) requests until told to stop."""
+    if memory_limit_mb:
+        _limit_memory(memory_limit_mb)
+    from src.utils.parsers import ResumeParser
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False), config=config)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        filename, path, data = request
+        start = time.perf_counter()
+        # The parent owns spilled files; the worker must not delete them
+        content = StoredAttachment(data=data, path=path, owned=False)
+        try:
+            result = parser.parse_resume(filename, content)
+        except MemoryError:
+            conn.send(parse_error(filename, 'memory', f"Parsing {filename} exceeded the "
+                                  f"{memory_limit_mb}MB memory limit", time.perf_counter() - start))
+            # The heap may be in a bad state; let the parent start a fresh worker
+            break
+        except Exception as e:
+            result = parse_error(filename, 'exception', f"Parsing {filename} failed: {e}",
+                                 time.perf_counter() - start)
+        conn.send(result)
+
+
+def _stop_process(process, conn) -> None:
+    """Ask the worker to exit, killing it if it does not within a few seconds."""
+    try:
+        conn.send(None)
+    except OSError:
+        pass
+    process.join(5)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    conn.close()
+
+
+class SandboxedParser:
+    """Drop-in for ResumeParser.parse_resume that parses in a supervised worker process.
+
+    Settings come from the ``[parsing]`` config section.
+    """
+
+    def __init__(self, config: Dict[str, Any], profiler: Optional[ParseProfiler] = None):
+        settings = config.get('parsing', {})
+        self.config = config
+        self.timeout = settings.get('timeout', DEFAULT_TIMEOUT)
+        self.memory_limit_mb = settings.get('memory_limit_mb', DEFAULT_MEMORY_LIMIT_MB)
+        self.profiler = profiler or ParseProfiler(enabled=False)
+        self.logger = get_logger('parse_sandbox')
+        # Spawn: the parent may run threads (HTTP pools, the daemon control server)
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._conn = None
+        self._finalizer = None
+
+    def parse_resume(self, filename: str, content) -> Dict[str, Any]:
+        content = as_stored(content)
+        with self.profiler.document(filename):
+            return self._parse(filename, content)
+
+    def _parse(self, filename: str, content: StoredAttachment) -> Dict[str, Any]:
+        self._ensure_worker()
+        # Spilled attachments are passed by path; the worker opens the same file
+        request = (filename, content.path, None if content.on_disk else content.getvalue())
+        start = time.perf_counter()
+        try:
+            self._conn.send(request)
+            if self._conn.poll(self.timeout):
+                return self._conn.recv()
+            kind, message = 'timeout', f"Parsing {filename} timed out after {self.timeout}s"
+        except (EOFError, OSError):
+            # The worker died mid-document (segfault, OOM killer)
+            self._process.join(1)
+            kind, message = 'crashed', f"Parser process crashed on {filename} (exit code {self._process.exitcode})"
+        elapsed = time.perf_counter() - start
+        self.logger.warning("%s; restarting the parser process", message)
+        self._stop_worker(kill=True)
+        return parse_error(filename, kind, message, elapsed)
+
+    def _ensure_worker(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            return
+        if self._process is not None:
+            # Exited on its own, e.g. after a MemoryError
+            self._stop_worker(kill=True)
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_serve, args=(child_conn, self.config, self.memory_limit_mb),
+            name='resume-parser', daemon=False
+        )
+        try:
+            self._process.start()
+        except BaseException:
+            self._process = None
+            parent_conn.close()
+            raise
+        finally:
+            child_conn.close()
+        self._conn = parent_conn
+        # multiprocessing's exit handler joins non-daemon children before atexit runs (and a
+        # multiprocessing child never runs atexit), so stop the worker from a finalizer with an
+        # exit priority; it also runs if this parser is garbage collected
+        self._finalizer = multiprocessing.util.Finalize(
+            self, _stop_process, args=(self._process, parent_conn), exitpriority=10
+        )
+
+    def _stop_worker(self, kill: bool = False) -> None:
+        process, finalizer = self._process, self._finalizer
+        self._process = self._conn = self._finalizer = None
+        if process is None:
+            return
+        if kill:
+            process.kill()
+        finalizer()
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        self._stop_worker()
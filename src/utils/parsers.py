@@ -1,76 +1,189 @@
-import fitz
-import docx
 import re
 import io
 import os
-import pandas as pd
+import json
+import hashlib
+from xml.etree.ElementTree import ParseError
+from src.utils.logger import get_logger
+from src.utils.profiling import ParseProfiler
+from src.utils.ocr import PageOCR
+from src.utils.attachment_store import as_stored
+from src.utils.docx_text import DocxFormatError, check_docx, extract_docx_text
+from src.utils.profile_links import classify_links, text_urls
+from src.utils.screening import ResumeScreener
+from src.utils.sections import (
+    EDUCATION_SECTIONS, EXPERIENCE_SECTIONS, SKILL_SECTIONS,
+    pdf_layout_headings, pdf_page_lines, segment_text, select
+)
+
+# Bump when a parser change alters results; `main.py reparse` recomputes results from older versions
+PARSER_VERSION = 1
+# Config sections that change what the parser returns
+PARSER_CONFIG_SECTIONS = ('parsing', 'ocr', 'screening')
+
+
+def parser_version(config):
+    """PARSER_VERSION plus a fingerprint of the config the parser reads"""
+    config = config or {}
+    settings = {section: config.get(section, {}) for section in PARSER_CONFIG_SECTIONS}
+    # Skill extraction does not use the criteria; only the screener reads the required skills,
+    # so other edits to [skills] leave the cached results valid
+    if settings['screening'].get('enabled', False):
+        settings['required_skills'] = config.get('skills', {}).get('required', [])
+    fingerprint = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{PARSER_VERSION}-{fingerprint[:12]}"
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, profiler=None, config=None):
         self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.github_pattern = r'github\.com/([a-zA-Z0-9_-]+)'
+        self.experience_patterns = [re.compile(pattern) for pattern in (
+            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+            # At most a few words between "experience" and the number, so it cannot
+            # pair a heading with a year or phone number far down the document
+            r'experience\W+(?:\w+\W+){0,4}?(\d+)\+?\s*years?',
+            r'(\d+)\+?\s*yrs?\s*experience',
+            r'(\d+)\+?\s*years?\s*in\s*the\s*field',
+            r'(\d+)\+?\s*years?\s*of\s*professional',
+            r'(\d+)\+?\s*years?\s*working\s*experience'
+        )]
         self.max_file_size = 10 * 1024 * 1024  # 10MB
         self.supported_formats = ['.pdf', '.docx']
+        self.max_pages = (config or {}).get('parsing', {}).get('max_pages')
+        self.logger = get_logger('parser')
+        self.profiler = profiler or ParseProfiler.from_env()
+        self.ocr = PageOCR(config)
+        self.screener = ResumeScreener(config)
+        self._ocr_available = None
 
     def validate_file(self, content, filename):
-        if len(content.getvalue()) > self.max_file_size:
-            print(f"[DEBUG] File {filename} exceeds 10MB limit")
+        if content.size > self.max_file_size:
+            self.logger.debug("File %s exceeds 10MB limit", filename)
             return f"File {filename} exceeds 10MB limit"
         file_format = os.path.splitext(filename)[1].lower()
         if file_format not in self.supported_formats:
-            print(f"[DEBUG] Unsupported file format: {file_format}")
+            self.logger.debug("Unsupported file format: %s", file_format)
             return f"Unsupported file format: {file_format}"
         try:
             if file_format == '.pdf':
-                fitz.open(stream=content.getvalue(), filetype="pdf")
+                doc = content.open_pdf()
+                page_count = doc.page_count
+                doc.close()
+                if self.max_pages and page_count > self.max_pages:
+                    self.logger.debug("File %s has %d pages, limit is %d", filename, page_count, self.max_pages)
+                    return f"File {filename} has {page_count} pages, more than the {self.max_pages} page limit"
             else:
-                docx.Document(content)
+                self.check_docx(content)
         except Exception as e:
-            print(f"[DEBUG] File {filename} appears to be corrupted: {str(e)}")
+            self.logger.debug("File %s appears to be corrupted: %s", filename, e)
             return f"File {filename} appears to be corrupted: {str(e)}"
         return None
 
-    def extract_from_pdf(self, content):
+    def extract_from_pdf(self, content, headings=None, links=None):
+        """Extract PDF text; lines set in a heading font are added to ``headings``, link URIs to ``links``"""
         try:
-            doc = fitz.open(stream=content.getvalue(), filetype="pdf")
+            with self.profiler.phase('open_pdf'):
+                doc = content.open_pdf()
             if doc.is_encrypted:
-                print("[DEBUG] PDF is password-protected")
+                self.logger.debug("PDF is password-protected")
                 return "", "Password-protected PDF"
-            text = ""
+            import fitz
+            page_texts = []
+            textless_pages = []
+            layout_lines = []
             for page in doc:
-                page_text = page.get_text("text", sort=True)
-                if not page_text:
-                    print("[DEBUG] No text found on a PDF page")
-                text += page_text
-                tables = page.find_tables()
+                with self.profiler.phase('get_text'):
+                    # One pass gives both the text and the font of every line
+                    lines = pdf_page_lines(page.get_text("dict", sort=True, flags=fitz.TEXTFLAGS_TEXT))
+                    page_text = "".join(line[0] + "\n" for line in lines)
+                layout_lines.extend(lines)
+                if links is not None:
+                    with self.profiler.phase('get_links'):
+                        links.extend(link['uri'] for link in page.get_links() if link.get('uri'))
+                if not page_text.strip():
+                    self.logger.debug("No text found on PDF page %d", page.number + 1)
+                    textless_pages.append(page.number)
+                with self.profiler.phase('find_tables'):
+                    tables = page.find_tables()
                 for table in tables:
-                    df = table.to_pandas()
-                    text += "\n" + df.to_string()
+                    with self.profiler.phase('to_pandas'):
+                        df = table.to_pandas()
+                        page_text += "\n" + df.to_string()
+                page_texts.append(page_text)
+            if textless_pages and self.ocr_available():
+                # Scanned pages: OCR only the pages without a text layer
+                with self.profiler.phase('ocr'):
+                    for number, page_text in self.ocr.recognize(doc, textless_pages).items():
+                        page_texts[number] += page_text
+            text = "".join(page_texts)
             doc.close()
+            if headings is not None:
+                headings.update(pdf_layout_headings(layout_lines))
             if not text.strip():
-                print("[DEBUG] No text extracted from PDF")
+                self.logger.debug("No text extracted from PDF")
                 return "", "No text extracted from PDF"
             return text, None
         except Exception as e:
-            print(f"[DEBUG] PDF extraction failed: {e}")
+            self.logger.debug("PDF extraction failed: %s", e)
             return "", f"PDF extraction failed: {e}"
 
-    def extract_from_docx(self, content):
+    def ocr_available(self):
+        """Check once whether the OCR fallback can run"""
+        if self._ocr_available is None:
+            self._ocr_available = self.ocr.available()
+        return self._ocr_available
+
+    def check_docx(self, content):
+        """Validate a DOCX from its zip directory instead of building a Document"""
+        try:
+            check_docx(content.path or content.open())
+        except DocxFormatError:
+            # Unusual package layout: let python-docx resolve the main document part
+            import docx
+            docx.Document(content.path or content.open())
+
+    def extract_from_docx(self, content, headings=None, links=None):
+        """Extract DOCX text; heading and all-bold paragraphs are added to ``headings``, hyperlinks to ``links``"""
+        try:
+            with self.profiler.phase('docx_stream'):
+                text = extract_docx_text(content.path or content.open(), headings=headings, links=links)
+        except (DocxFormatError, ParseError) as e:
+            self.logger.debug("Streaming DOCX extraction failed (%s); falling back to python-docx", e)
+            return self.extract_from_docx_document(content, headings, links)
+        except Exception as e:
+            self.logger.debug("DOCX extraction failed: %s", e)
+            return "", f"DOCX extraction failed: {e}"
+        if not text.strip():
+            self.logger.debug("No text extracted from DOCX")
+            return "", "No text extracted from DOCX"
+        return text, None
+
+    def extract_from_docx_document(self, content, headings=None, links=None):
+        """Extract DOCX text through the python-docx object model (fallback)"""
         try:
-            doc = docx.Document(content)
+            import docx
+            with self.profiler.phase('docx_document'):
+                doc = docx.Document(content.path or content.open())
             text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = " | ".join(cell.text for cell in row.cells)
-                    text += row_text + "\n"
+            with self.profiler.phase('docx_paragraphs'):
+                for paragraph in doc.paragraphs:
+                    text += paragraph.text + "\n"
+                    if headings is not None and paragraph.text.strip() and \
+                            paragraph.style.name.lower().startswith(('heading', 'title')):
+                        headings.add(paragraph.text.strip())
+            if links is not None:
+                links.extend(rel.target_ref for rel in doc.part.rels.values()
+                             if rel.is_external and rel.reltype.endswith('/hyperlink'))
+            with self.profiler.phase('docx_tables'):
+                for table in doc.tables:
+                    for row in table.rows:
+                        row_text = " | ".join(cell.text for cell in row.cells)
+                        text += row_text + "\n"
             if not text.strip():
-                print("[DEBUG] No text extracted from DOCX")
+                self.logger.debug("No text extracted from DOCX")
                 return "", "No text extracted from DOCX"
             return text, None
         except Exception as e:
-            print(f"[DEBUG] DOCX extraction failed: {e}")
+            self.logger.debug("DOCX extraction failed: %s", e)
             return "", f"DOCX extraction failed: {e}"
 
     def clean_text(self, text):
@@ -82,10 +195,6 @@ class ResumeParser:
         emails = re.findall(self.email_pattern, text)
         return emails[0] if emails else ""
 
-    def extract_github(self, text):
-        matches = re.findall(self.github_pattern, text.lower())
-        return matches[0] if matches else ""
-
     def extract_skills(self, text):
         common_skills = [
             'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Ruby', 'PHP', 'Go', 'Rust',
@@ -104,19 +213,12 @@ class ResumeParser:
         return found_skills
 
     def extract_experience(self, text):
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'experience.*?(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*experience',
-            r'(\d+)\+?\s*years?\s*in\s*the\s*field',
-            r'(\d+)\+?\s*years?\s*of\s*professional',
-            r'(\d+)\+?\s*years?\s*working\s*experience'
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
+        text_lower = text.lower()
+        for pattern in self.experience_patterns:
+            match = pattern.search(text_lower)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except ValueError:
                     continue
         return 0
@@ -134,33 +236,74 @@ class ResumeParser:
         return ""
 
     def parse_resume(self, filename, content):
-        print(f"[DEBUG] Parsing {filename}")
-        error = self.validate_file(content, filename)
+        with self.profiler.document(filename):
+            return self._parse_resume(filename, content)
+
+    def _parse_resume(self, filename, content):
+        self.logger.debug("Parsing %s", filename)
+        # Spilled attachments are opened by path; bytes and BytesIO are wrapped without copying to disk
+        content = as_stored(content)
+        with self.profiler.phase('validate_file'):
+            error = self.validate_file(content, filename)
         if error:
-            print(f"[DEBUG] Validation error: {error}")
+            self.logger.debug("Validation error: %s", error)
             return {'filename': filename, 'error': error}
+        screening = None
+        if self.screener.enabled:
+            # Cheap look at the first pages before the full parse
+            with self.profiler.phase('screen'):
+                try:
+                    screening = self.screener.screen(filename, content)
+                except Exception as e:
+                    # Screening is only a shortcut; the full parse decides
+                    self.logger.debug("Screening of %s failed: %s", filename, e)
+            if screening and not screening['passed'] and self.screener.action == 'reject':
+                self.logger.debug("Screened out %s: %s", filename, screening['reasons'])
+                return {'filename': filename, 'error': f"Screened out: {'; '.join(screening['reasons'])}",
+                        'screening': screening}
+        headings = set()
+        links = []
         if filename.lower().endswith('.pdf'):
-            text, error = self.extract_from_pdf(content)
+            text, error = self.extract_from_pdf(content, headings, links)
         elif filename.lower().endswith('.docx'):
-            text, error = self.extract_from_docx(content)
+            text, error = self.extract_from_docx(content, headings, links)
         else:
-            print(f"[DEBUG] Unsupported file type for {filename}")
+            self.logger.debug("Unsupported file type for %s", filename)
             return {'filename': filename, 'error': 'Unsupported file type'}
         if error:
-            print(f"[DEBUG] Extraction error: {error}")
+            self.logger.debug("Extraction error: %s", error)
             return {'filename': filename, 'error': error}
         if not text:
-            print(f"[DEBUG] No text extracted from {filename}")
+            self.logger.debug("No text extracted from %s", filename)
             return {'filename': filename, 'error': 'No text extracted'}
-        text = self.clean_text(text)
-        print(f"[DEBUG] Cleaned text length for {filename}: {len(text)}")
+        # Sections come from the line structure, which cleaning flattens
+        with self.profiler.phase('segment'):
+            sections = segment_text(text, headings)
+        # Document hyperlinks first, then URLs written out in the text (cleaning drops the '/')
+        with self.profiler.phase('extract_links'):
+            profile_links = classify_links(links + text_urls(text))
+        with self.profiler.phase('clean_text'):
+            text = self.clean_text(text)
+            sections = {name: self.clean_text(section) for name, section in sections.items()}
+        self.logger.debug("Cleaned text length for %s: %d", filename, len(text))
+        with self.profiler.phase('extract_email'):
+            email = self.extract_email(text)
+        with self.profiler.phase('extract_skills'):
+            skills = self.extract_skills(select(sections, SKILL_SECTIONS) or text)
+        with self.profiler.phase('extract_experience'):
+            experience_years = self.extract_experience(select(sections, EXPERIENCE_SECTIONS) or text)
+        with self.profiler.phase('extract_education'):
+            education = self.extract_education(select(sections, EDUCATION_SECTIONS) or text)
         return {
             'filename': filename,
             'text': text,
-            'email': self.extract_email(text),
-            'github_username': self.extract_github(text),
-            'skills': self.extract_skills(text),
-            'experience_years': self.extract_experience(text),
-            'education': self.extract_education(text),
+            'email': email,
+            'github_username': profile_links['github_username'] or '',
+            'linkedin_url': profile_links['linkedin_url'],
+            'portfolio_url': profile_links['portfolio_url'],
+            'skills': skills,
+            'experience_years': experience_years,
+            'education': education,
+            'screening': screening,
             'error': None
         }
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Profile URLs harvested from resumes.
+
+Hyperlinks in the document (PDF link annotations, DOCX hyperlink
+relationships) come first, then URLs written out in the text, so enrichment
+only requests profiles the candidate actually linked to:
+
+- ``github_username``: the first ``github.com/<user>`` link
+- ``linkedin_url``: the first ``linkedin.com/in/<slug>`` link, normalized
+- ``portfolio_url``: the first other web link that is not a social, code
+  hosting or email link (``<user>.github.io`` sites count as portfolios)
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+
+TEXT_URL = re.compile(
+    r'(?:https?://|www\.)[^\s<>"\')\]|]+|'
+    r'\b(?:[a-z0-9-]+\.)*(?:github\.com|linkedin\.com|github\.io)/[^\s<>"\')\]|]*',
+    re.IGNORECASE
+)
+# github.com paths that are not user accounts
+GITHUB_RESERVED = {
+    'about', 'apps', 'collections', 'contact', 'enterprise', 'explore', 'features', 'login', 'marketplace',
+    'orgs', 'pricing', 'settings', 'sponsors', 'topics', 'trending', 'join', 'site', 'security',
+}
+GITHUB_USERNAME = re.compile(r'^[a-z0-9](?:[a-z0-9-]{0,37}[a-z0-9])?$', re.IGNORECASE)
+LINKEDIN_PROFILE = re.compile(r'^/(?:in|pub)/([^/?#]+)', re.IGNORECASE)
+# Hosts whose links say nothing about the candidate's own work
+NOT_PORTFOLIO_HOSTS = (
+    'linkedin.com', 'github.com', 'gitlab.com', 'bitbucket.org', 'twitter.com', 'x.com', 'facebook.com',
+    'instagram.com', 'youtube.com', 'google.com', 'goo.gl', 'bit.ly', 'wa.me', 'calendly.com',
+)
+
+
+def text_urls(text: str) -> List[str]:
+    """URLs written out in resume text, trailing punctuation stripped."""
+    return [match.rstrip('.,;:') for match in TEXT_URL.findall(text)]
+
+
+def _split(url: str):
+    url = url.strip()
+    if not re.match(r'^[a-z][a-z0-9+.-]*:', url, re.IGNORECASE):
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or '').lower()
+    except ValueError:
+        # Malformed link annotation or template placeholder ("https://[your-site].com")
+        return None
+    if parts.scheme.lower() not in ('http', 'https'):
+        return None
+    if host.startswith('www.'):
+        host = host[4:]
+    return host, parts.path
+
+
+def _on_host(host: str, domain: str) -> bool:
+    return host == domain or host.endswith('.' + domain)
+
+
+def github_username(url: str) -> Optional[str]:
+    parts = _split(url)
+    if not parts or parts[0] != 'github.com':
+        return None
+    segments = [segment for segment in parts[1].split('/') if segment]
+    if not segments or segments[0].lower() in GITHUB_RESERVED or not GITHUB_USERNAME.match(segments[0]):
+        return None
+    return segments[0].lower()
+
+
+def linkedin_url(url: str) -> Optional[str]:
+    parts = _split(url)
+    if not parts or not _on_host(parts[0], 'linkedin.com'):
+        return None
+    match = LINKEDIN_PROFILE.match(parts[1])
+    if not match:
+        return None
+    return f"https://www.linkedin.com/in/{match.group(1).lower()}"
+
+
+def portfolio_url(url: str) -> Optional[str]:
+    parts = _split(url)
+    if not parts or '.' not in parts[0]:
+        return None
+    if any(_on_host(parts[0], host) for host in NOT_PORTFOLIO_HOSTS):
+        return None
+    return url if '://' in url else 'https://' + url
+
+
+def classify_links(links: Iterable[str]) -> Dict[str, Optional[str]]:
+    """First GitHub username, LinkedIn profile URL and portfolio URL among ``links``."""
+    found: Dict[str, Optional[str]] = {'github_username': None, 'linkedin_url': None, 'portfolio_url': None}
+    for link in links:
+        for field, classify in (('github_username', github_username), ('linkedin_url', linkedin_url),
+                                ('portfolio_url', portfolio_url)):
+            if found[field] is None:
+                value = classify(link)
+                if value:
+                    found[field] = value
+                    break
+    return found
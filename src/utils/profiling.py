@@ -0,0 +1,94 @@
+"""
+Opt-in profiling of ResumeParser hot paths.
+
+Enable with ``--profile`` on the command line or ``RESUME_PROFILE=1`` in the
+environment. When enabled, a cProfile run covers every parsed document and
+each document gets a per-phase timing breakdown (validate_file, get_text,
+find_tables, to_pandas, segment, clean_text, the extractors, ...). When disabled the
+hooks do nothing.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+
+
+PROFILE_ENV_VAR = 'RESUME_PROFILE'
+
+
+class ParseProfiler:
+    """Collects cumulative cProfile stats and per-document phase timings."""
+
+    def __init__(self, enabled: bool = False, output_dir: str = 'outputs/profile'):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.documents: List[Dict[str, Any]] = []
+        self._profile = None
+        if enabled:
+            # cProfile and pstats are only imported when profiling is switched on
+            import cProfile
+            self._profile = cProfile.Profile()
+        self._phases: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def from_env(cls, output_dir: str = 'outputs/profile') -> 'ParseProfiler':
+        """Create a profiler enabled by the RESUME_PROFILE environment variable."""
+        enabled = os.getenv(PROFILE_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+        return cls(enabled=enabled, output_dir=output_dir)
+
+    @contextmanager
+    def document(self, filename: str) -> Iterator[None]:
+        """Profile the parse of a single document."""
+        if not self.enabled or self._phases is not None:
+            yield
+            return
+        self._phases = {}
+        start = time.perf_counter()
+        self._profile.enable()
+        try:
+            yield
+        finally:
+            self._profile.disable()
+            total = time.perf_counter() - start
+            phases = self._phases
+            self._phases = None
+            self.documents.append({
+                'filename': filename,
+                'total_seconds': round(total, 6),
+                'phases': {name: round(seconds, 6) for name, seconds in
+                           sorted(phases.items(), key=lambda x: x[1], reverse=True)}
+            })
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a parse phase; repeated phases (e.g. per page) accumulate."""
+        if self._phases is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + time.perf_counter() - start
+
+    def dump(self) -> Optional[Dict[str, str]]:
+        """Write parse.pstats and phases.ndjson to the output directory."""
+        if not self.enabled or not self.documents:
+            return None
+        import pstats
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stats_path = os.path.join(self.output_dir, 'parse.pstats')
+        phases_path = os.path.join(self.output_dir, 'phases.ndjson')
+
+        pstats.Stats(self._profile).dump_stats(stats_path)
+        with open(phases_path, 'w') as f:
+            for document in self.documents:
+                f.write(json.dumps(document) + '\n')
+        return {'pstats': stats_path, 'phases': phases_path}
+
+    def slowest_documents(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Return the slowest profiled documents, slowest first."""
+        return sorted(self.documents, key=lambda d: d['total_seconds'], reverse=True)[:limit]
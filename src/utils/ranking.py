@@ -0,0 +1,95 @@
+"""
+Deterministic candidate ranking with bounded top-K selection.
+"""
+
+import heapq
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+
+# Scores compared in order; later fields only break ties in earlier ones
+RANK_SCORE_FIELDS = (
+    'total_score',
+    'skills_score',
+    'github_score',
+    'experience_score',
+    'education_score',
+)
+
+
+def rank_key(candidate: Dict[str, Any]) -> Tuple:
+    """Sort key that orders candidates best-first.
+
+    Scores are compared descending, falling back to the secondary scores and
+    finally to email and filename so equal scores always rank the same way
+    regardless of the order candidates arrived in.
+    """
+    scores = tuple(-float(candidate.get(field) or 0) for field in RANK_SCORE_FIELDS)
+    return scores + (candidate.get('email') or '', candidate.get('filename') or '')
+
+
+class _HeapEntry:
+    """Heap entry that inverts ordering so the heap root is the worst kept candidate."""
+    __slots__ = ('key', 'seq', 'candidate')
+
+    def __init__(self, key: Tuple, seq: int, candidate: Dict[str, Any]):
+        self.key = key
+        self.seq = seq
+        self.candidate = candidate
+
+    def __lt__(self, other: '_HeapEntry') -> bool:
+        return (self.key, self.seq) > (other.key, other.seq)
+
+
+class CandidateRanker:
+    """Ranks candidates as they stream in.
+
+    A bounded heap keeps the best ``top_k`` candidates at O(log k) per
+    candidate, so the top of the ranking is available without sorting the
+    whole pool. A full ordering is only produced when ``ranked()`` is called,
+    and only if the ranker was asked to keep every candidate.
+    """
+
+    def __init__(self, top_k: int = 10, keep_all: bool = True):
+        self.top_k = max(int(top_k), 0)
+        self.keep_all = keep_all
+        self._heap: List[_HeapEntry] = []
+        self._all: List[Dict[str, Any]] = []
+        self._ranked: Optional[List[Dict[str, Any]]] = None
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return self._seq
+
+    def add(self, candidate: Dict[str, Any]) -> None:
+        """Add a single candidate to the ranking."""
+        seq = self._seq
+        self._seq += 1
+        if self.keep_all:
+            self._all.append(candidate)
+            self._ranked = None
+
+        if not self.top_k:
+            return
+        entry = _HeapEntry(rank_key(candidate), seq, candidate)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        elif (entry.key, seq) < (self._heap[0].key, self._heap[0].seq):
+            heapq.heapreplace(self._heap, entry)
+
+    def add_all(self, candidates: Iterable[Dict[str, Any]]) -> None:
+        """Add every candidate of an iterable to the ranking."""
+        for candidate in candidates:
+            self.add(candidate)
+
+    def top(self) -> List[Dict[str, Any]]:
+        """Return the best ``top_k`` candidates, best first."""
+        entries = sorted(self._heap, key=lambda e: (e.key, e.seq))
+        return [entry.candidate for entry in entries]
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """Return every candidate in rank order, sorting on first use."""
+        if not self.keep_all:
+            raise ValueError("CandidateRanker was created with keep_all=False; only top() is available")
+        if self._ranked is None:
+            self._ranked = sorted(self._all, key=rank_key)
+        return self._ranked
@@ -1,135 +1,170 @@
 import json
 import os
 from datetime import datetime
+from src.utils.report_stats import ReportStatistics
+from src.utils.ranking import CandidateRanker
 
 class ReportGenerator:
     def __init__(self, config):
         self.config = config
         self.timestamp = datetime.now().isoformat()
     
-    def generate_reports(self, candidates):
-        """Generate both JSON and Markdown reports"""
+    def generate_reports(self, candidates, stats=None):
+        """Generate the JSON/NDJSON and Markdown reports
+        
+        Candidates are ranked and folded into the summary statistics in a
+        single pass (``stats`` may be supplied when the caller has been
+        accumulating them incrementally). A full ordering is only produced
+        when the configured output format lists every candidate; otherwise
+        only the top ``output.top_candidates`` are kept in a bounded heap.
+        """
         # Ensure output directory exists
         os.makedirs('outputs', exist_ok=True)
         
-        # Sort candidates by total score
-        sorted_candidates = sorted(candidates, key=lambda x: x.get('total_score', 0), reverse=True)
+        output_config = self.config.get('output', {})
+        output_format = output_config.get('format', 'json')
+        columnar_format = output_config.get('columnar_format')
+        full_ranking = output_format in ('json', 'ndjson') or bool(columnar_format)
+        
+        # Rank candidates and accumulate statistics in one pass
+        ranker = CandidateRanker(output_config.get('top_candidates', 10), keep_all=full_ranking)
+        accumulate = stats is None
+        if accumulate:
+            stats = ReportStatistics()
+        merged = []
+        for candidate in candidates:
+            ranker.add(candidate)
+            if accumulate:
+                stats.add(candidate)
+            if candidate.get('merged_from'):
+                merged.append(candidate)
+        
+        # Generate JSON or NDJSON report depending on output.format
+        if output_format == 'ndjson':
+            self.generate_ndjson_report(ranker.ranked(), stats)
+        elif output_format == 'json':
+            self.generate_json_report(ranker.ranked(), stats)
         
-        # Generate JSON report
-        self.generate_json_report(sorted_candidates)
+        # Generate columnar (Parquet/Arrow) export for analytics
+        if columnar_format:
+            self.generate_columnar_report(ranker.ranked(), columnar_format)
         
         # Generate Markdown summary
-        self.generate_markdown_report(sorted_candidates)
+        self.generate_markdown_report(ranker.top(), stats, merged)
         
-        return sorted_candidates
+        return ranker.ranked() if full_ranking else ranker.top()
     
-    def generate_json_report(self, candidates):
+    def generate_json_report(self, candidates, stats=None):
         """Generate JSON format report"""
-        # Calculate summary statistics
-        github_candidates = [c for c in candidates if c.get('github_username')]
-        total_repos = sum(c.get('github_data', {}).get('repo_stats', {}).get('total_repos', 0) for c in github_candidates)
-        total_contributions = sum(c.get('github_data', {}).get('contribution_stats', {}).get('total_contributions', 0) for c in github_candidates)
-        total_stars = sum(c.get('github_data', {}).get('repo_stats', {}).get('total_stars', 0) for c in github_candidates)
-        
-        # Collect all languages and topics
-        all_languages = {}
-        all_topics = {}
-        for candidate in github_candidates:
-            languages = candidate.get('github_data', {}).get('repo_stats', {}).get('languages', {})
-            topics = candidate.get('github_data', {}).get('repo_stats', {}).get('topics', {})
-            for lang, count in languages.items():
-                all_languages[lang] = all_languages.get(lang, 0) + count
-            for topic, count in topics.items():
-                all_topics[topic] = all_topics.get(topic, 0) + count
-        
-        # Collect all skills
-        all_skills = {}
-        for candidate in candidates:
-            for skill in candidate.get('skills', []):
-                all_skills[skill] = all_skills.get(skill, 0) + 1
+        if stats is None:
+            stats = ReportStatistics.from_candidates(candidates)
         
         # Create summary report
         summary = {
             'timestamp': self.timestamp,
-            'summary': {
-                'total_candidates': len(candidates),
-                'candidates_with_github': len(github_candidates),
-                'average_total_score': sum(c.get('total_score', 0) for c in candidates) / len(candidates),
-                'github_statistics': {
-                    'total_repositories': total_repos,
-                    'total_contributions': total_contributions,
-                    'total_stars': total_stars,
-                    'average_repos_per_profile': total_repos / len(github_candidates) if github_candidates else 0,
-                    'average_contributions_per_profile': total_contributions / len(github_candidates) if github_candidates else 0
-                },
-                'top_languages': dict(sorted(all_languages.items(), key=lambda x: x[1], reverse=True)[:5]),
-                'top_topics': dict(sorted(all_topics.items(), key=lambda x: x[1], reverse=True)[:5]),
-                'top_skills': dict(sorted(all_skills.items(), key=lambda x: x[1], reverse=True)[:10])
-            },
+            'summary': stats.summary(),
             'candidates': []
         }
         
         # Add candidate details
         for i, candidate in enumerate(candidates):
-            github_data = candidate.get('github_data', {})
-            contribution_stats = github_data.get('contribution_stats', {})
-            repo_stats = github_data.get('repo_stats', {})
-            
-            candidate_data = {
-                'rank': i + 1,
-                'email': candidate.get('email', ''),
-                'github_username': candidate.get('github_username', ''),
-                'scores': {
-                    'total': candidate.get('total_score', 0),
-                    'skills': candidate.get('skills_score', 0),
-                    'experience': candidate.get('experience_score', 0),
-                    'education': candidate.get('education_score', 0),
-                    'github': candidate.get('github_score', 0)
-                },
-                'experience_years': candidate.get('experience_years', 0),
-                'education': candidate.get('education', ''),
-                'skills': candidate.get('skills', []),
-                'github_stats': {
-                    'total_repos': repo_stats.get('total_repos', 0),
-                    'total_stars': repo_stats.get('total_stars', 0),
-                    'total_forks': repo_stats.get('total_forks', 0),
-                    'total_contributions': contribution_stats.get('total_contributions', 0),
-                    'commits': contribution_stats.get('commits', 0),
-                    'pull_requests': contribution_stats.get('pull_requests', 0),
-                    'issues': contribution_stats.get('issues', 0),
-                    'recent_activity': contribution_stats.get('recent_activity', 0),
-                    'languages': repo_stats.get('languages', {}),
-                    'topics': repo_stats.get('topics', {})
-                }
-            }
-            summary['candidates'].append(candidate_data)
+            summary['candidates'].append(self.build_candidate_record(i + 1, candidate))
         
         # Write to JSON file
         with open('outputs/summary.json', 'w') as f:
             json.dump(summary, f, indent=2)
     
-    def generate_markdown_report(self, candidates):
-        """Generate Markdown summary report"""
-        top_candidates = candidates[:self.config['output']['top_candidates']]
+    def build_candidate_record(self, rank, candidate):
+        """Build the report entry for a single ranked candidate"""
+        github_data = candidate.get('github_data') or {}
+        contribution_stats = github_data.get('contribution_stats', {})
+        repo_stats = github_data.get('repo_stats', {})
+        
+        return {
+            'rank': rank,
+            'email': candidate.get('email', ''),
+            'github_username': candidate.get('github_username', ''),
+            'scores': {
+                'total': candidate.get('total_score', 0),
+                'skills': candidate.get('skills_score', 0),
+                'experience': candidate.get('experience_score', 0),
+                'education': candidate.get('education_score', 0),
+                'github': candidate.get('github_score', 0)
+            },
+            'experience_years': candidate.get('experience_years', 0),
+            'education': candidate.get('education', ''),
+            'skills': candidate.get('skills', []),
+            'merged_from': candidate.get('merged_from', []),
+            'merge_reasons': candidate.get('merge_reasons', []),
+            'github_stats': {
+                'total_repos': repo_stats.get('total_repos', 0),
+                'total_stars': repo_stats.get('total_stars', 0),
+                'total_forks': repo_stats.get('total_forks', 0),
+                'total_contributions': contribution_stats.get('total_contributions', 0),
+                'commits': contribution_stats.get('commits', 0),
+                'pull_requests': contribution_stats.get('pull_requests', 0),
+                'issues': contribution_stats.get('issues', 0),
+                'recent_activity': contribution_stats.get('recent_activity', 0),
+                'languages': repo_stats.get('languages', {}),
+                'topics': repo_stats.get('topics', {})
+            }
+        }
+    
+    def generate_ndjson_report(self, candidates, stats=None):
+        """Stream one NDJSON line per ranked candidate and write the summary separately.
+        
+        Candidates are consumed as an iterable. When no precomputed ``stats``
+        are given they are accumulated in the same pass that writes the file,
+        so only the running aggregates are held in memory.
+        """
+        accumulate = stats is None
+        if accumulate:
+            stats = ReportStatistics()
+        with open('outputs/candidates.ndjson', 'w') as f:
+            for i, candidate in enumerate(candidates):
+                if accumulate:
+                    stats.add(candidate)
+                f.write(json.dumps(self.build_candidate_record(i + 1, candidate)))
+                f.write('\n')
+        
+        summary = {
+            'timestamp': self.timestamp,
+            'summary': stats.summary(),
+            'candidates_file': 'candidates.ndjson'
+        }
+        with open('outputs/summary.json', 'w') as f:
+            json.dump(summary, f, indent=2)
+    
+    def generate_columnar_report(self, candidates, columnar_format='parquet'):
+        """Write flattened per-candidate scores, GitHub stats and skill flags as Parquet or Arrow IPC"""
+        from src.utils.columnar_export import ColumnarExporter
+        
+        exporter = ColumnarExporter(self.config)
+        return exporter.export(candidates, run_id=self.timestamp, output_format=columnar_format)
+    
+    def generate_markdown_report(self, candidates, stats=None, merged=None):
+        """Generate Markdown summary report
+        
+        ``merged`` lists the candidates that absorbed duplicate applications;
+        their merge decisions are written in their own section.
+        """
+        if stats is None:
+            stats = ReportStatistics.from_candidates(candidates)
+        top_candidates = candidates[:self.config.get('output', {}).get('top_candidates', 10)]
         
         with open('outputs/summary.md', 'w') as f:
             f.write(f"# Resume Evaluation Report\n\n")
             f.write(f"**Generated:** {self.timestamp}\n\n")
             
             # GitHub Statistics Summary
-            github_candidates = [c for c in candidates if c.get('github_username')]
-            if github_candidates:
+            if stats.candidates_with_github:
                 f.write("## GitHub Statistics Summary\n\n")
-                total_repos = sum(c.get('github_data', {}).get('repo_stats', {}).get('total_repos', 0) for c in github_candidates)
-                total_contributions = sum(c.get('github_data', {}).get('contribution_stats', {}).get('total_contributions', 0) for c in github_candidates)
-                total_stars = sum(c.get('github_data', {}).get('repo_stats', {}).get('total_stars', 0) for c in github_candidates)
-                
-                f.write(f"- **Total GitHub Profiles:** {len(github_candidates)}\n")
-                f.write(f"- **Total Repositories:** {total_repos}\n")
-                f.write(f"- **Total Contributions:** {total_contributions}\n")
-                f.write(f"- **Total Stars:** {total_stars}\n")
-                f.write(f"- **Average Repositories per Profile:** {total_repos/len(github_candidates):.1f}\n")
-                f.write(f"- **Average Contributions per Profile:** {total_contributions/len(github_candidates):.1f}\n\n")
+                f.write(f"- **Total GitHub Profiles:** {stats.candidates_with_github}\n")
+                f.write(f"- **Total Repositories:** {stats.total_repos}\n")
+                f.write(f"- **Total Contributions:** {stats.total_contributions}\n")
+                f.write(f"- **Total Stars:** {stats.total_stars}\n")
+                f.write(f"- **Average Repositories per Profile:** {stats.average_repos_per_profile:.1f}\n")
+                f.write(f"- **Average Contributions per Profile:** {stats.average_contributions_per_profile:.1f}\n\n")
             
             f.write(f"## Top {len(top_candidates)} Candidates\n\n")
             f.write("| Rank | Email | Total Score | Skills | Experience | GitHub | Years Exp | Repos | Contributions |\n")
@@ -144,7 +179,7 @@ class ReportGenerator:
                 experience_years = candidate.get('experience_years', 0)
                 
                 # GitHub statistics
-                github_data = candidate.get('github_data', {})
+                github_data = candidate.get('github_data') or {}
                 repo_stats = github_data.get('repo_stats', {})
                 contribution_stats = github_data.get('contribution_stats', {})
                 total_repos = repo_stats.get('total_repos', 0)
@@ -153,51 +188,40 @@ class ReportGenerator:
                 f.write(f"| {rank} | {email} | {total_score} | {skills_score} | {experience_years} years | {github_score} | {experience_years} | {total_repos} | {total_contributions} |\n")
             
             f.write(f"\n## Processing Summary\n\n")
-            f.write(f"- **Total Resumes Processed:** {len(candidates)}\n")
-            f.write(f"- **Candidates with GitHub:** {len(github_candidates)}\n")
-            f.write(f"- **Average Total Score:** {sum(c.get('total_score', 0) for c in candidates) / len(candidates):.1f}/100\n")
+            f.write(f"- **Total Resumes Processed:** {stats.total_candidates}\n")
+            f.write(f"- **Candidates with GitHub:** {stats.candidates_with_github}\n")
+            if stats.merged_applications:
+                f.write(f"- **Duplicate Applications Merged:** {stats.merged_applications}\n")
+            f.write(f"- **Average Total Score:** {stats.average_total_score:.1f}/100\n")
             
             # GitHub Detailed Statistics
-            if github_candidates:
+            if stats.candidates_with_github:
                 f.write(f"\n## GitHub Detailed Statistics\n\n")
                 
                 # Most common languages
-                all_languages = {}
-                for candidate in github_candidates:
-                    languages = candidate.get('github_data', {}).get('repo_stats', {}).get('languages', {})
-                    for lang, count in languages.items():
-                        all_languages[lang] = all_languages.get(lang, 0) + count
-                
-                if all_languages:
+                if stats.languages:
                     f.write("### Most Common Languages\n\n")
-                    sorted_languages = sorted(all_languages.items(), key=lambda x: x[1], reverse=True)[:5]
-                    for lang, count in sorted_languages:
+                    for lang, count in stats.top_languages(5):
                         f.write(f"- **{lang}:** {count} repositories\n")
                 
                 # Most common topics
-                all_topics = {}
-                for candidate in github_candidates:
-                    topics = candidate.get('github_data', {}).get('repo_stats', {}).get('topics', {})
-                    for topic, count in topics.items():
-                        all_topics[topic] = all_topics.get(topic, 0) + count
-                
-                if all_topics:
+                if stats.topics:
                     f.write("\n### Most Common Topics\n\n")
-                    sorted_topics = sorted(all_topics.items(), key=lambda x: x[1], reverse=True)[:5]
-                    for topic, count in sorted_topics:
+                    for topic, count in stats.top_topics(5):
                         f.write(f"- **{topic}:** {count} repositories\n")
             
             # Skills breakdown
-            all_skills = []
-            for candidate in candidates:
-                all_skills.extend(candidate.get('skills', []))
-            
-            if all_skills:
-                skill_counts = {}
-                for skill in all_skills:
-                    skill_counts[skill] = skill_counts.get(skill, 0) + 1
-                
+            if stats.skills:
                 f.write(f"\n## Most Common Skills\n\n")
-                sorted_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-                for skill, count in sorted_skills:
-                    f.write(f"- **{skill}:** {count} candidates\n") 
\ No newline at end of file
+                for skill, count in stats.top_skills(10):
+                    f.write(f"- **{skill}:** {count} candidates\n")
+            
+            # Duplicate applications merged before enrichment
+            if merged:
+                f.write(f"\n## Merged Duplicate Applications\n\n")
+                for candidate in merged:
+                    sources = ", ".join(source['filename'] for source in candidate['merged_from'])
+                    f.write(f"- **{candidate.get('email') or candidate['filename']}:** kept {candidate['filename']}, "
+                            f"merged {sources}\n")
+                    for reason in candidate.get('merge_reasons', []):
+                        f.write(f"  - {reason}\n")
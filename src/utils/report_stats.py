@@ -0,0 +1,109 @@
+"""
+Report statistics shared by every report format.
+"""
+
+from typing import Dict, Any, Iterable, List, Tuple
+
+
+class ReportStatistics:
+    """Running aggregates over evaluated candidates.
+
+    Candidates are folded in one at a time with ``add`` so the statistics can
+    be computed in the same pass that writes a streaming report, or updated
+    incrementally as new candidates arrive. JSON, NDJSON and Markdown reports
+    all render their summary sections from a single instance.
+    """
+
+    def __init__(self):
+        self.total_candidates = 0
+        self.candidates_with_github = 0
+        self.total_score = 0
+        self.total_repos = 0
+        self.total_contributions = 0
+        self.total_stars = 0
+        self.languages: Dict[str, int] = {}
+        self.topics: Dict[str, int] = {}
+        self.skills: Dict[str, int] = {}
+        self.merged_applications = 0
+
+    @classmethod
+    def from_candidates(cls, candidates: Iterable[Dict[str, Any]]) -> 'ReportStatistics':
+        """Build statistics from an iterable of candidates in one pass."""
+        stats = cls()
+        stats.add_all(candidates)
+        return stats
+
+    def add_all(self, candidates: Iterable[Dict[str, Any]]) -> None:
+        """Fold every candidate of an iterable into the running totals."""
+        for candidate in candidates:
+            self.add(candidate)
+
+    def add(self, candidate: Dict[str, Any]) -> None:
+        """Fold a single candidate into the running totals."""
+        self.total_candidates += 1
+        self.total_score += candidate.get('total_score', 0)
+        self.merged_applications += len(candidate.get('merged_from') or ())
+        skills = self.skills
+        for skill in candidate.get('skills', []):
+            skills[skill] = skills.get(skill, 0) + 1
+
+        if not candidate.get('github_username'):
+            return
+        self.candidates_with_github += 1
+        github_data = candidate.get('github_data') or {}
+        repo_stats = github_data.get('repo_stats') or {}
+        contribution_stats = github_data.get('contribution_stats') or {}
+        self.total_repos += repo_stats.get('total_repos', 0)
+        self.total_stars += repo_stats.get('total_stars', 0)
+        self.total_contributions += contribution_stats.get('total_contributions', 0)
+
+        languages = self.languages
+        for lang, count in repo_stats.get('languages', {}).items():
+            languages[lang] = languages.get(lang, 0) + count
+        topics = self.topics
+        for topic, count in repo_stats.get('topics', {}).items():
+            topics[topic] = topics.get(topic, 0) + count
+
+    @property
+    def average_total_score(self) -> float:
+        return self.total_score / self.total_candidates if self.total_candidates else 0
+
+    @property
+    def average_repos_per_profile(self) -> float:
+        return self.total_repos / self.candidates_with_github if self.candidates_with_github else 0
+
+    @property
+    def average_contributions_per_profile(self) -> float:
+        return self.total_contributions / self.candidates_with_github if self.candidates_with_github else 0
+
+    @staticmethod
+    def _top(counts: Dict[str, int], limit: int) -> List[Tuple[str, int]]:
+        return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+
+    def top_languages(self, limit: int = 5) -> List[Tuple[str, int]]:
+        return self._top(self.languages, limit)
+
+    def top_topics(self, limit: int = 5) -> List[Tuple[str, int]]:
+        return self._top(self.topics, limit)
+
+    def top_skills(self, limit: int = 10) -> List[Tuple[str, int]]:
+        return self._top(self.skills, limit)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the summary section used by the JSON and NDJSON reports."""
+        return {
+            'total_candidates': self.total_candidates,
+            'candidates_with_github': self.candidates_with_github,
+            'merged_applications': self.merged_applications,
+            'average_total_score': self.average_total_score,
+            'github_statistics': {
+                'total_repositories': self.total_repos,
+                'total_contributions': self.total_contributions,
+                'total_stars': self.total_stars,
+                'average_repos_per_profile': self.average_repos_per_profile,
+                'average_contributions_per_profile': self.average_contributions_per_profile
+            },
+            'top_languages': dict(self.top_languages()),
+            'top_topics': dict(self.top_topics()),
+            'top_skills': dict(self.top_skills())
+        }
@@ -0,0 +1,109 @@
+"""
+Candidate scoring from parsed resume fields and GitHub statistics.
+
+Scoring only depends on the configuration, so it lives apart from the agents
+and can rescore persisted candidates without loading any HTTP or parsing
+dependencies.
+"""
+
+from typing import Dict, Any, Optional
+
+from src.utils.criteria import CompiledCriteria
+
+
+class CandidateScorer:
+    """Computes the skills, experience, education, GitHub and weighted total scores."""
+
+    def __init__(self, config: Dict[str, Any], criteria: Optional[CompiledCriteria] = None):
+        self.config = config
+        self.criteria = criteria or CompiledCriteria(config)
+
+    def score(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        """Set every score on ``candidate`` in place and return it."""
+        candidate['github_score'] = self.calculate_github_score(candidate.get('github_data'))
+        candidate['skills_score'] = self.calculate_skills_score(candidate.get('skills', []))
+        candidate['experience_score'] = self.calculate_experience_score(candidate.get('experience_years', 0))
+        candidate['education_score'] = self.calculate_education_score(candidate.get('education', ''))
+        self.calculate_total_score(candidate)
+        return candidate
+
+    def calculate_github_score(self, github_data):
+        """Calculate GitHub contribution score"""
+        if not github_data:
+            return 0
+
+        score = 0
+        contribution_stats = github_data.get('contribution_stats', {})
+        repo_stats = github_data.get('repo_stats', {})
+
+        # Repository score (30 points)
+        total_repos = repo_stats.get('total_repos', 0)
+        min_repos = self.config.get('github', {}).get('min_repos', 3)
+        if total_repos >= min_repos:
+            score += 30
+        elif total_repos > 0:
+            score += (total_repos / min_repos) * 30
+
+        # Contribution score (40 points)
+        total_contributions = contribution_stats.get('total_contributions', 0)
+        if total_contributions >= 50:
+            score += 40
+        elif total_contributions > 0:
+            score += (total_contributions / 50) * 40
+
+        # Recent activity score (20 points)
+        recent_activity = contribution_stats.get('recent_activity', 0)
+        if recent_activity >= 10:
+            score += 20
+        elif recent_activity > 0:
+            score += (recent_activity / 10) * 20
+
+        # Repository quality score (10 points)
+        total_stars = repo_stats.get('total_stars', 0)
+        if total_stars >= 100:
+            score += 10
+        elif total_stars > 0:
+            score += (total_stars / 100) * 10
+
+        return min(score, 100)
+
+    def calculate_skills_score(self, skills):
+        """Calculate skills score based on criteria"""
+        return self.criteria.score_skills(skills)
+
+    def calculate_experience_score(self, years):
+        """Calculate experience score"""
+        if years < self.config['experience']['minimum_years']:
+            return 0
+        senior_threshold = self.config['experience']['senior_threshold']
+        if years >= senior_threshold:
+            return 100
+        return (years / senior_threshold) * 100
+
+    def calculate_education_score(self, education):
+        """Calculate education score"""
+        if not education:
+            return 0
+        accepted_degrees = self.config['education']['accepted_degrees']
+        for degree in accepted_degrees:
+            if degree.lower() in education.lower():
+                return 100
+        return 50  # Partial credit for other education
+
+    def calculate_total_score(self, candidate):
+        """Calculate weighted total score"""
+        github_config = self.config.get('github', {})
+        experience_config = self.config.get('experience', {})
+        education_config = self.config.get('education', {})
+        skills_weight = 0.4  # Default for skills
+        experience_weight = experience_config.get('weight', 0.3)
+        education_weight = education_config.get('weight', 0.3)
+        github_weight = github_config.get('weight', 0.4)
+        total = (
+            candidate.get('skills_score', 0) * skills_weight +
+            candidate.get('experience_score', 0) * experience_weight +
+            candidate.get('education_score', 0) * education_weight +
+            candidate.get('github_score', 0) * github_weight
+        )
+        candidate['total_score'] = round(total, 2)
+        return candidate['total_score']
@@ -0,0 +1,117 @@
+"""
+Cheap first-page screening before the full resume parse.
+
+Cover letters, transcripts and resumes without any required skill are common
+attachments. When ``[screening] enabled`` is set, only the first pages of a
+PDF (no table detection, no OCR) or the first few thousand characters of a
+DOCX are read and checked for:
+
+- required skills from ``skills.required`` (at least ``min_required_skills``)
+- resume-likeness: distinct section headings and contact details count for
+  a document, cover-letter and transcript phrasing count against it
+
+A failing document is rejected before the full parse (``action = "reject"``),
+or fully parsed but flagged so queue workers enrich it only after everything
+else (``action = "deprioritize"``).
+"""
+
+import re
+from typing import Dict, Any, Optional
+
+from src.utils.criteria import CompiledCriteria
+from src.utils.docx_text import extract_docx_text
+
+
+DEFAULT_PAGES = 2
+DEFAULT_DOCX_CHARS = 6000  # about two pages of text
+DEFAULT_MIN_REQUIRED_SKILLS = 1
+DEFAULT_MIN_RESUME_SIGNALS = 3
+SCREENING_ACTIONS = ('reject', 'deprioritize')
+
+SECTION_HEADING = re.compile(
+    r'^\s*(work experience|professional experience|experience|employment(?: history)?|work history|'
+    r'education|technical skills|skills|projects|certifications|summary|objective|publications|'
+    r'achievements)\s*:?\s*$',
+    re.IGNORECASE | re.MULTILINE
+)
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE = re.compile(r'(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}')
+COVER_LETTER = re.compile(
+    r'\bdear\s+(?:hiring|recruit\w*|sir|madam|mr|ms|mrs|team)\b|\bi am writing to\b|'
+    r'\byours (?:truly|faithfully|sincerely)\b|^\s*sincerely,?\s*$',
+    re.IGNORECASE | re.MULTILINE
+)
+TRANSCRIPT = re.compile(
+    r'\b(?:academic |official )?transcript\b|\bcumulative gpa\b|\bgrade point average\b|'
+    r'\bcredits? (?:earned|attempted)\b|\bregistrar\b',
+    re.IGNORECASE
+)
+
+
+class ResumeScreener:
+    """Screens the first pages of a document against required skills and resume structure."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, criteria: Optional[CompiledCriteria] = None):
+        config = config or {}
+        settings = config.get('screening', {})
+        self.enabled = settings.get('enabled', False)
+        self.pages = settings.get('pages', DEFAULT_PAGES)
+        self.docx_chars = settings.get('docx_chars', DEFAULT_DOCX_CHARS)
+        self.min_required_skills = settings.get('min_required_skills', DEFAULT_MIN_REQUIRED_SKILLS)
+        self.min_resume_signals = settings.get('min_resume_signals', DEFAULT_MIN_RESUME_SIGNALS)
+        self.action = settings.get('action', 'reject')
+        if self.action not in SCREENING_ACTIONS:
+            raise ValueError(f"screening.action must be one of {', '.join(SCREENING_ACTIONS)}")
+        self.criteria = criteria or CompiledCriteria(config)
+
+    def preview_text(self, filename: str, content) -> str:
+        """Text of the first pages only; '' when there is no text layer to screen."""
+        if filename.lower().endswith('.pdf'):
+            doc = content.open_pdf()
+            try:
+                if doc.is_encrypted:
+                    return ''
+                return ''.join(doc[i].get_text('text') for i in range(min(self.pages, doc.page_count)))
+            finally:
+                doc.close()
+        return extract_docx_text(content.path or content.open(), max_chars=self.docx_chars)
+
+    def screen(self, filename: str, content) -> Optional[Dict[str, Any]]:
+        """Screen a validated attachment; None if the preview has no text to judge (e.g. scans)."""
+        text = self.preview_text(filename, content)
+        if not text.strip():
+            return None
+        return self.screen_text(text)
+
+    def screen_text(self, text: str) -> Dict[str, Any]:
+        headings = {match.lower() for match in SECTION_HEADING.findall(text)}
+        signals = len(headings) + bool(EMAIL.search(text)) + bool(PHONE.search(text))
+        reasons = []
+        if COVER_LETTER.search(text):
+            signals -= 2
+            reasons.append('reads like a cover letter')
+        if TRANSCRIPT.search(text):
+            signals -= 2
+            reasons.append('reads like a transcript')
+        if signals < self.min_resume_signals:
+            reasons.append(f"{max(signals, 0)} resume signals (need {self.min_resume_signals})")
+
+        required_skills = []
+        if self.criteria.required:
+            required_skills = [
+                skill for skill in self.criteria.find_in_text(text)
+                if self.criteria.category_of(skill) == 'required'
+            ]
+            if len(required_skills) < self.min_required_skills:
+                reasons.append(f"{len(required_skills)} required skills on the first pages "
+                               f"(need {self.min_required_skills})")
+
+        passed = signals >= self.min_resume_signals and (
+            not self.criteria.required or len(required_skills) >= self.min_required_skills
+        )
+        return {
+            'passed': passed,
+            'resume_signals': signals,
+            'required_skills': required_skills,
+            'reasons': [] if passed else reasons,
+        }
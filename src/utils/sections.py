@@ -0,0 +1,145 @@
+"""
+Resume section segmentation.
+
+Splits extracted resume text into sections (``skills``, ``experience``,
+``education``, ``projects``, ``summary``, ``other``, plus ``header`` for
+everything before the first heading) in one pass over its lines, so each
+extractor only reads the part of the resume it is about.
+
+A line is a heading when, on its own, it is one of the known section names
+("Work Experience", "TECHNICAL SKILLS:", "E D U C A T I O N"). Lines the
+document sets apart by layout (a larger or bold font in a PDF, a heading
+style or bold paragraph in a DOCX) only need to start with one
+("Experience & Leadership", "Skills and Tools").
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+SECTION_NAMES = {
+    'skills': (
+        'skills', 'technical skills', 'key skills', 'core skills', 'skill set', 'skills summary',
+        'core competencies', 'competencies', 'technologies', 'technical expertise', 'tech stack',
+        'tools', 'programming languages',
+    ),
+    'experience': (
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history', 'professional background',
+    ),
+    'education': (
+        'education', 'academic background', 'academics', 'academic qualifications',
+        'qualifications', 'education and training',
+    ),
+    'projects': (
+        'projects', 'personal projects', 'selected projects', 'key projects', 'academic projects',
+        'open source', 'open source contributions',
+    ),
+    'summary': ('summary', 'professional summary', 'profile', 'about me', 'objective', 'career objective'),
+    # Headings that only end the section before them
+    'other': (
+        'certifications', 'certificates', 'awards', 'honors', 'achievements', 'publications',
+        'languages', 'interests', 'hobbies', 'references', 'volunteering', 'volunteer experience',
+        'activities', 'leadership', 'courses', 'training',
+    ),
+}
+# Sections each extractor reads; the whole text is used when none of them has content
+SKILL_SECTIONS = ('skills', 'projects')
+EXPERIENCE_SECTIONS = ('header', 'summary', 'experience')
+EDUCATION_SECTIONS = ('education',)
+
+MAX_HEADING_CHARS = 60
+MAX_HEADING_WORDS = 6
+# Font size (relative to the body text) at which a PDF line counts as set apart
+HEADING_SIZE_RATIO = 1.15
+PDF_BOLD_FLAG = 16
+
+_SECTION_OF = {alias: section for section, aliases in SECTION_NAMES.items() for alias in aliases}
+# Letter-spaced headings ("E X P E R I E N C E") normalize to the alias without spaces
+_SECTION_OF_COMPACT = {alias.replace(' ', ''): section for alias, section in _SECTION_OF.items()}
+# Longest first so "work experience" wins over "experience" as a prefix
+_HEADING_PREFIX = re.compile(
+    r'(?:' + '|'.join(re.escape(alias) for alias in sorted(_SECTION_OF, key=len, reverse=True)) + r')\b'
+)
+
+
+def heading_section(line: str, set_apart: bool = False) -> Optional[str]:
+    """Section a heading line starts, or None if the line is not a heading."""
+    stripped = line.strip()
+    if not stripped or len(stripped) > MAX_HEADING_CHARS:
+        return None
+    words = re.findall(r'[a-z]+', stripped.lower())
+    key = ' '.join(words)
+    if key in _SECTION_OF:
+        return _SECTION_OF[key]
+    if len(words) > 3 and all(len(word) == 1 for word in words):
+        return _SECTION_OF_COMPACT.get(''.join(words))
+    if set_apart and len(words) <= MAX_HEADING_WORDS:
+        match = _HEADING_PREFIX.match(key)
+        if match:
+            return _SECTION_OF[match.group(0)]
+    return None
+
+
+def segment_text(text: str, headings: Iterable[str] = ()) -> Dict[str, str]:
+    """Split resume text into sections by heading lines.
+
+    ``headings`` are lines the document sets apart by layout; see
+    ``pdf_layout_headings`` and ``extract_docx_text``.
+    """
+    set_apart = set(headings)
+    lines: Dict[str, List[str]] = {'header': []}
+    current = 'header'
+    for line in text.splitlines():
+        section = heading_section(line, line.strip() in set_apart)
+        if section:
+            current = section
+            lines.setdefault(current, [])
+            continue
+        lines[current].append(line)
+    return {section: '\n'.join(section_lines) for section, section_lines in lines.items()}
+
+
+def select(sections: Dict[str, str], names: Iterable[str]) -> str:
+    """Text of the named sections that have content, '' if none has."""
+    return '\n'.join(sections[name] for name in names if sections.get(name, '').strip())
+
+
+def pdf_page_lines(page_dict: dict) -> List[Tuple[str, float, bool]]:
+    """(text, font size, bold) of each line of a ``page.get_text('dict')`` result."""
+    lines = []
+    for block in page_dict.get('blocks', []):
+        if block.get('type', 0) != 0:
+            continue
+        for line in block['lines']:
+            text = ''.join(span['text'] for span in line['spans'])
+            spans = [span for span in line['spans'] if span['text'].strip()]
+            if not spans:
+                lines.append((text, 0.0, False))
+                continue
+            lines.append((
+                text,
+                max(span['size'] for span in spans),
+                all(span['flags'] & PDF_BOLD_FLAG for span in spans),
+            ))
+    return lines
+
+
+def pdf_layout_headings(lines: Iterable[Tuple[str, float, bool]]) -> Set[str]:
+    """Lines set in a larger font than the body text, or bold where the body is not."""
+    lines = [line for line in lines if line[0].strip()]
+    if not lines:
+        return set()
+    # Body text: the size and weight most characters are set in
+    sizes: Counter = Counter()
+    weights: Counter = Counter()
+    for text, size, bold in lines:
+        sizes[round(size, 1)] += len(text)
+        weights[bold] += len(text)
+    body_size = sizes.most_common(1)[0][0]
+    body_bold = weights.most_common(1)[0][0]
+    return {
+        text.strip() for text, size, bold in lines
+        if size >= body_size * HEADING_SIZE_RATIO or (bold and not body_bold)
+    }
@@ -0,0 +1,119 @@
+"""
+Pluggable HTTP transport for the agents.
+
+Agents send every outbound HTTP request through a transport so the backend
+can be swapped without touching the agents:
+
+- ``live`` talks to the real services over a pooled ``requests.Session``.
+- ``mock`` rewrites the same URLs to a local ``MockServiceServer`` (see
+  ``src.utils.mock_services``) for offline end-to-end load tests.
+
+Select the backend with the ``[transport]`` config section.
+"""
+
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MOCK_URL = 'http://127.0.0.1:8765'
+
+RATE_LIMIT_HEADERS = {
+    'limit': 'X-RateLimit-Limit',
+    'remaining': 'X-RateLimit-Remaining',
+    'reset': 'X-RateLimit-Reset',
+}
+
+
+class HttpTransport:
+    """Sends requests to the real services over a shared, pooled session.
+
+    The most recent rate-limit headers seen for each host are kept in
+    ``rate_limits`` so callers can back off before running out.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, pool_size: int = DEFAULT_POOL_SIZE):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.rate_limits: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, url: str) -> str:
+        """Return the URL the request is actually sent to."""
+        return url
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> requests.Response:
+        """Issue a GET request; network errors propagate as ``requests`` exceptions."""
+        response = self.session.get(self.resolve(url), headers=headers, params=params,
+                                    timeout=timeout or self.timeout)
+        self._track_rate_limit(url, response)
+        return response
+
+    def rate_limit(self, url: str) -> Optional[Dict[str, int]]:
+        """Return the last rate-limit state seen for the URL's host, if any."""
+        with self._lock:
+            return self.rate_limits.get(urlsplit(url).netloc)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _track_rate_limit(self, url: str, response: requests.Response) -> None:
+        state = {}
+        for key, header in RATE_LIMIT_HEADERS.items():
+            value = response.headers.get(header)
+            if value is not None and value.isdigit():
+                state[key] = int(value)
+        if state:
+            with self._lock:
+                self.rate_limits[urlsplit(url).netloc] = state
+
+
+class MockTransport(HttpTransport):
+    """Sends every request to a local MockServiceServer instead of the real host.
+
+    Known hosts map to the server's service routes; any other host (e.g. a
+    candidate's portfolio site) is served under ``/web/<host>/<path>``.
+    """
+
+    HOST_ROUTES = {
+        'api.github.com': '/github',
+        'www.linkedin.com': '/linkedin',
+        'linkedin.com': '/linkedin',
+        'gmail.googleapis.com': '',
+    }
+
+    def __init__(self, base_url: str = DEFAULT_MOCK_URL, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip('/')
+
+    def resolve(self, url: str) -> str:
+        if url.startswith(self.base_url):
+            return url
+        parts = urlsplit(url)
+        prefix = self.HOST_ROUTES.get(parts.netloc.lower(), f"/web/{parts.netloc.lower()}")
+        resolved = f"{self.base_url}{prefix}{parts.path or '/'}"
+        return f"{resolved}?{parts.query}" if parts.query else resolved
+
+
+def create_transport(config: Dict[str, Any]) -> HttpTransport:
+    """Build the transport selected by the ``[transport]`` config section."""
+    settings = config.get('transport', {}) if isinstance(config, dict) else {}
+    backend = settings.get('backend', 'live')
+    options = {
+        'timeout': settings.get('timeout', DEFAULT_TIMEOUT),
+        'pool_size': settings.get('pool_size', DEFAULT_POOL_SIZE),
+    }
+    if backend == 'live':
+        return HttpTransport(**options)
+    if backend == 'mock':
+        return MockTransport(settings.get('mock_url', DEFAULT_MOCK_URL), **options)
+    raise ValueError(f"Unknown transport backend: {backend}")
@@ -0,0 +1,227 @@
+"""
+Queue-driven pipeline workers.
+
+The pipeline is split into four job kinds that any number of worker
+processes sharing the queue can claim:
+
+- ``fetch``: list the resume attachments of one Gmail message
+- ``parse``: download and parse one attachment
+- ``enrich``: GitHub, LinkedIn and skills verification for one candidate
+- ``score``: compute the final scores and store the candidate as a result
+
+Each stage enqueues the next one in the same transaction that completes it.
+Later stages have higher priority so candidates already in flight finish
+before new messages are started.
+
+A parsed candidate claims its identity (normalized email, GitHub username) in
+the queue. A later application from the same person skips enrichment and is
+scored with ``duplicate_of`` set; ``fold_duplicates`` merges it into the
+enriched candidate when the results are collected.
+"""
+
+import os
+import socket
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from utils.candidate_store import to_record
+from utils.dedup import PROFILE_FIELDS, CandidateDeduplicator, identity_keys
+from utils.logger import get_logger
+from utils.scoring import CandidateScorer
+
+
+STAGE_PRIORITY = {'fetch': 0, 'parse': 1, 'enrich': 2, 'score': 3}
+
+
+def candidate_key(message_id: str, filename: str) -> str:
+    return f"{message_id}:{filename}"
+
+
+def enqueue_inbox(queue, email_agent) -> Tuple[int, int]:
+    """Enqueue a fetch job per inbox message; returns (new, already queued).
+
+    Jobs are deduplicated on the message ID, so the queue itself records which
+    messages have been taken on and repeated runs only add new mail. Inbox
+    pages are followed until one whose messages are all queued already.
+    """
+    new = known = 0
+    for message_id in email_agent.list_message_ids(seen=lambda m: queue.has_job(f"fetch:{m}")):
+        job_id = queue.enqueue('fetch', {'message_id': message_id}, dedupe_key=f"fetch:{message_id}",
+                               priority=STAGE_PRIORITY['fetch'])
+        if job_id is None:
+            known += 1
+        else:
+            new += 1
+    return new, known
+
+
+def fold_duplicates(queue, config: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Stream the queue's results with each duplicate application merged into its owner's candidate.
+
+    A duplicate whose owner has no result (its enrichment failed or is still
+    running) is returned on its own.
+    """
+    duplicates: Dict[str, List[Dict[str, Any]]] = {}
+    for record in queue.iter_results():
+        if record.get('duplicate_of'):
+            duplicates.setdefault(record['duplicate_of'], []).append(record)
+    deduplicator = CandidateDeduplicator(config)
+    scorer = CandidateScorer(config)
+    for record in queue.iter_results():
+        if record.get('duplicate_of'):
+            continue
+        found = duplicates.pop(candidate_key(record.get('message_id'), record['filename']), None)
+        if not found:
+            yield record
+            continue
+        reasons = []
+        for duplicate in found:
+            shared = [f"same {kind}: {value}" for kind, value in identity_keys(record)
+                      if (kind, value) in identity_keys(duplicate)]
+            reasons.append(f"{record['filename']} ~ {duplicate['filename']}: {(shared or ['same person'])[0]}")
+        merged, _ = deduplicator.merge([record] + found, reasons)
+        merged.pop('duplicate_of', None)
+        if any(merged.get(field) != record.get(field) for field in PROFILE_FIELDS):
+            merged['needs_enrichment'] = True
+        yield scorer.score(merged)
+    for found in duplicates.values():
+        yield from found
+
+
+class PipelineWorker:
+    """Claims pipeline jobs from the queue and runs them with this process's agents."""
+
+    def __init__(self, queue, config: Dict[str, Any], email_agent, parse_task, analyze_task, linkedin_task,
+                 verify_task, metrics, worker_id: Optional[str] = None):
+        self.queue = queue
+        self.config = config
+        self.email_agent = email_agent
+        self.parse_task = parse_task
+        self.analyze_task = analyze_task
+        self.linkedin_task = linkedin_task
+        self.verify_task = verify_task
+        self.metrics = metrics
+        self.scorer = CandidateScorer(config)
+        self.deduplicator = CandidateDeduplicator(config)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.logger = get_logger('worker')
+        self.handlers = {
+            'fetch': self.handle_fetch,
+            'parse': self.handle_parse,
+            'enrich': self.handle_enrich,
+            'score': self.handle_score,
+        }
+        self.processed = 0
+
+    def run(self, stop_when_idle: bool = False, idle_sleep: float = 1.0, max_jobs: Optional[int] = None) -> int:
+        """Process jobs until the queue is empty (``stop_when_idle``) or ``max_jobs`` is reached."""
+        while max_jobs is None or self.processed < max_jobs:
+            if not self.run_one():
+                if stop_when_idle:
+                    break
+                time.sleep(idle_sleep)
+        return self.processed
+
+    def run_one(self) -> bool:
+        """Claim and run a single job; returns False if none was available."""
+        job = self.queue.claim(self.worker_id, kinds=list(self.handlers))
+        if job is None:
+            return False
+        try:
+            with self.metrics.timer(f'job.{job.kind}', items=1), self.keep_lease(job):
+                follow_ups, results = self.handlers[job.kind](job.payload)
+        except Exception as e:
+            retried = self.queue.fail(job, f"{type(e).__name__}: {e}\n{traceback.format_exc()}")
+            self.logger.warning("Job %s failed (attempt %d/%d, %s): %s", job.id, job.attempts, job.max_attempts,
+                                'will retry' if retried else 'giving up', e)
+        else:
+            if not self.queue.complete(job, follow_ups, results):
+                self.logger.warning("Lost the lease on job %s before it completed; its result was discarded", job.id)
+        self.processed += 1
+        return True
+
+    @contextmanager
+    def keep_lease(self, job):
+        """Renew the lease on ``job`` every third of ``lease_seconds`` while the block runs.
+
+        Parsing and enrichment can outlast a lease (rate-limited GitHub calls,
+        slow PDFs); without renewal another worker would claim the job and run
+        it a second time.
+        """
+        stop = threading.Event()
+
+        def renew():
+            while not stop.wait(self.queue.lease_seconds / 3):
+                try:
+                    if not self.queue.extend_lease(job):
+                        self.logger.warning("Lost the lease on job %s while it was running", job.id)
+                        return
+                except Exception as e:
+                    self.logger.warning("Could not renew the lease on job %s: %s", job.id, e)
+
+        thread = threading.Thread(target=renew, name=f"lease-{job.id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def handle_fetch(self, payload):
+        """List one message's resume parts and enqueue a parse job per part"""
+        message_id = payload['message_id']
+        follow_ups = [
+            ('parse', {'message_id': message_id, 'part': part},
+             f"parse:{candidate_key(message_id, part['filename'])}", STAGE_PRIORITY['parse'])
+            for part in self.email_agent.list_resume_parts(message_id)
+        ]
+        return follow_ups, None
+
+    def handle_parse(self, payload):
+        """Download and parse one attachment"""
+        message_id, part = payload['message_id'], payload['part']
+        key = candidate_key(message_id, part['filename'])
+        # Oversize and wrong-MIME parts were already dropped by list_resume_parts
+        content = self.email_agent.fetch_attachment(message_id, part)
+        if content is None:
+            raise RuntimeError(f"Attachment {part['filename']} of message {message_id} exceeds the size limit")
+        with self.metrics.timer('task.parse', items=1):
+            [candidate] = self.parse_task.execute([
+                {'filename': part['filename'], 'content': content, 'message_id': message_id}
+            ])
+        candidate['message_id'] = message_id
+        if candidate.get('error'):
+            return [], {key: candidate}
+        keys = [f"{kind}:{value}" for kind, value in identity_keys(candidate)]
+        if self.deduplicator.enabled and keys:
+            owner = self.queue.claim_identity(keys, key)
+            if owner != key:
+                # Same person as a candidate already taken on: merged into it by fold_duplicates
+                candidate['duplicate_of'] = owner
+                return [('score', {'candidate': candidate}, f"score:{key}", STAGE_PRIORITY['score'])], None
+        priority = STAGE_PRIORITY['enrich']
+        if candidate.get('screening') and not candidate['screening']['passed']:
+            # Deprioritized by screening: enrich once nothing else is waiting
+            priority = STAGE_PRIORITY['fetch'] - 1
+        return [('enrich', {'candidate': candidate}, f"enrich:{key}", priority)], None
+
+    def handle_enrich(self, payload):
+        """GitHub, LinkedIn and skills verification for one candidate"""
+        candidates: List[Dict[str, Any]] = [payload['candidate']]
+        with self.metrics.timer('task.github', items=1):
+            candidates = self.analyze_task.execute(candidates)
+        with self.metrics.timer('task.linkedin', items=1):
+            candidates = self.linkedin_task.execute(candidates)
+        with self.metrics.timer('task.verify', items=1):
+            candidates = self.verify_task.execute(candidates)
+        candidate = to_record(candidates[0])
+        key = candidate_key(candidate['message_id'], candidate['filename'])
+        return [('score', {'candidate': candidate}, f"score:{key}", STAGE_PRIORITY['score'])], None
+
+    def handle_score(self, payload):
+        """Compute the final scores and store the candidate as a result"""
+        candidate = self.scorer.score(payload['candidate'])
+        return [], {candidate_key(candidate['message_id'], candidate['filename']): candidate}
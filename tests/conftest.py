@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# The modules import each other as ``src.utils.x``; main, worker and daemon as ``utils.x``
+root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(root))
+sys.path.insert(1, str(root / 'src'))
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from src.utils.columnar_export import ColumnarExporter, read_runs
+
+
+def criteria(*skills):
+    return {'skills': {'required': list(skills), 'preferred': [], 'bonus': []}}
+
+
+@pytest.mark.parametrize('output_format', ['parquet', 'arrow'])
+def test_read_runs_unifies_skill_columns_across_runs(tmp_path, output_format):
+    candidate = {'email': 'jane@example.com', 'filename': 'jane.pdf', 'skills': ['Python', 'Go']}
+    ColumnarExporter(criteria('Python')).export([candidate], 'run-1', output_format, str(tmp_path))
+    ColumnarExporter(criteria('Python', 'Go')).export([candidate], 'run-2', output_format, str(tmp_path))
+
+    table = read_runs(str(tmp_path), output_format).sort_by('run_id')
+    assert table.column('run_id').to_pylist() == ['run-1', 'run-2']
+    assert table.column('skill_python').to_pylist() == [True, True]
+    assert table.column('skill_go').to_pylist() == [None, True]
+
+
+def test_read_runs_names_the_directory_when_it_has_no_runs(tmp_path):
+    ColumnarExporter(criteria('Python')).export([], 'run-1', 'arrow', str(tmp_path))
+
+    with pytest.raises(FileNotFoundError, match=str(tmp_path)):
+        read_runs(str(tmp_path), 'parquet')
@@ -0,0 +1,40 @@
+import pytest
+
+from src.utils.criteria import CompiledCriteria
+
+CONFIG = {'skills': {
+    'required': ['Python', 'Machine Learning', 'Git'],
+    # Spelled differently from the required entry: the same skill, counted as required only
+    'preferred': ['Docker', 'AWS', ' python '],
+    'bonus': ['GraphQL'],
+}}
+
+
+def test_empty_skills_score_a_float_zero():
+    criteria = CompiledCriteria(CONFIG)
+    for skills in ([], (), None):
+        score = criteria.score_skills(skills)
+        assert score == 0.0 and isinstance(score, float)
+
+
+@pytest.mark.parametrize('skills', [
+    ['Python', 'Machine Learning', 'Git', 'Docker'],
+    ['python', 'MACHINE LEARNING', 'git', 'docker'],
+    ['  Python', 'Machine Learning  ', '\tGit\n', ' Docker '],
+    ['PYTHON', 'python', ' Python ', 'machine learning', 'Git', 'DOCKER'],
+])
+def test_case_whitespace_and_spellings_match_configured_skills(skills):
+    criteria = CompiledCriteria(CONFIG)
+
+    assert criteria.score_skills(skills) == pytest.approx(60 + 30 / 2)
+
+
+def test_differently_spelled_config_entries_are_one_skill():
+    criteria = CompiledCriteria(CONFIG)
+
+    assert criteria.preferred == {'docker', 'aws'}
+    assert criteria.category_of('PYTHON') == 'required'
+    assert criteria.canonical_name(' python ') == 'Python'
+    assert criteria.find_in_text('Shipped PYTHON services on aws') == ['AWS', 'Python']
+    assert criteria.score_skills(['Python']) == pytest.approx(20)
+    assert criteria.score_skills([' aws ', 'GraphQL', 'Rust']) == pytest.approx(15 + 5)
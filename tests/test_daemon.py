@@ -0,0 +1,75 @@
+import tomllib
+from pathlib import Path
+
+from src.agents.email_agent import EmailAgent
+
+CRITERIA = tomllib.loads((Path(__file__).parents[1] / 'src' / 'config' / 'criteria.toml').read_text())
+
+
+class FakeGmail:
+    """Just enough of the Gmail client to list message IDs in pages, newest first."""
+
+    def __init__(self, message_ids, page_size):
+        self.message_ids = message_ids
+        self.page_size = page_size
+        self.requests = []
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def list(self, userId, q, maxResults, pageToken=None):
+        self.requests.append(pageToken)
+        return self
+
+    def execute(self):
+        start = int(self.requests[-1] or 0)
+        end = start + self.page_size
+        result = {'messages': [{'id': message_id} for message_id in self.message_ids[start:end]]}
+        if end < len(self.message_ids):
+            result['nextPageToken'] = str(end)
+        return result
+
+
+def email_agent(gmail):
+    config = {'gmail': {'max_results': 2, 'query_source': 'static', 'query': 'has:attachment'},
+              'blob_store': {'enabled': False}}
+    return EmailAgent(gmail, config)
+
+
+def test_list_message_ids_follows_pages_until_one_was_all_seen():
+    gmail = FakeGmail([f"m{i}" for i in range(7)], page_size=2)
+    agent = email_agent(gmail)
+
+    assert agent.list_message_ids() == ['m0', 'm1']
+    assert agent.list_message_ids(seen={'m3', 'm4', 'm5'}.__contains__) == ['m0', 'm1', 'm2', 'm3', 'm4', 'm5']
+    assert agent.list_message_ids(seen=lambda message_id: False) == [f"m{i}" for i in range(7)]
+
+
+def test_failed_message_is_retried_on_the_next_poll(tmp_path):
+    from daemon import EvaluationDaemon
+    from utils.metrics import PipelineMetrics
+
+    class Inbox:
+        def __init__(self):
+            self.fail = {'m1'}
+
+        def list_message_ids(self, seen=None):
+            return ['m2', 'm1']
+
+        def fetch_message(self, message_id):
+            if message_id in self.fail:
+                self.fail.discard(message_id)
+                raise TimeoutError('Gmail timed out')
+            return []
+
+    daemon = EvaluationDaemon(CRITERIA, Inbox(), None, None, None, None, PipelineMetrics(),
+                              state_path=str(tmp_path / 'candidates.json.gz'),
+                              processed_path=str(tmp_path / 'processed.json'))
+    assert daemon.poll_once() == 1
+    assert 'm1' not in daemon.processed and daemon.failed == {'m1'}
+    assert daemon.poll_once() == 1
+    assert 'm1' in daemon.processed and not daemon.failed
+    assert daemon.poll_once() == 0
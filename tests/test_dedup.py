@@ -0,0 +1,169 @@
+import tomllib
+from pathlib import Path
+
+from src.utils.dedup import CandidateDeduplicator, IdentityIndex, MinHasher, normalize_email
+from src.utils.job_queue import SQLiteJobQueue
+
+CRITERIA = tomllib.loads((Path(__file__).parents[1] / 'src' / 'config' / 'criteria.toml').read_text())
+RESUME = ("Senior backend engineer with eight years of Python and Go experience building payment "
+          "platforms, data pipelines and internal developer tooling at two fintech companies")
+
+
+def candidate(filename, text=RESUME, **fields):
+    return {'filename': filename, 'message_id': f"msg-{filename}", 'text': text, 'skills': [],
+            'experience_years': 0, 'education': '', 'email': None, 'github_username': None, **fields}
+
+
+def test_normalize_email():
+    assert normalize_email(' Jane.Doe+jobs@GoogleMail.com ') == 'janedoe@gmail.com'
+    assert normalize_email('jane.doe+jobs@example.com') == 'jane.doe@example.com'
+    assert normalize_email('not an address') is None
+    assert normalize_email(None) is None
+
+
+def test_minhash_similarity():
+    hasher = MinHasher()
+    edited = RESUME.replace('two fintech companies', 'two fintech startups')
+    assert MinHasher.similarity(hasher.signature(RESUME), hasher.signature(RESUME)) == 1.0
+    assert MinHasher.similarity(hasher.signature(RESUME), hasher.signature(edited)) > 0.6
+    assert MinHasher.similarity(hasher.signature(RESUME), hasher.signature('frontend designer portfolio')) < 0.2
+    assert hasher.signature('') is None
+
+
+def test_deduplicate_links_email_github_and_text():
+    candidates = [
+        candidate('a.pdf', text='first resume about databases', email='jane@example.com', skills=['SQL']),
+        candidate('b.pdf', text='second resume about kubernetes', email='JANE+2@example.com',
+                  github_username='JaneDoe', skills=['Go']),
+        candidate('c.pdf', text='third resume about compilers', github_username='janedoe', experience_years=6),
+        candidate('d.pdf', email='sam@example.com'),
+        candidate('e.pdf', email='other@example.com'),
+        candidate('f.pdf', error='could not parse'),
+    ]
+    merged, decisions = CandidateDeduplicator({}).deduplicate(candidates)
+
+    assert sorted(c['filename'] for c in merged) == ['b.pdf', 'd.pdf', 'f.pdf']
+    jane = next(c for c in merged if c['filename'] == 'b.pdf')
+    assert [m['filename'] for m in jane['merged_from']] == ['a.pdf', 'c.pdf']
+    assert jane['skills'] == ['Go', 'SQL'] and jane['experience_years'] == 6
+    assert len(decisions) == 2
+
+
+def test_identity_index_merges_across_calls_and_keeps_matching_enrichment():
+    deduplicator = CandidateDeduplicator({})
+    first, _ = deduplicator.deduplicate([
+        candidate('a.pdf', text='short', email='jane@example.com', github_username='janedoe',
+                  github_data={'repos': 3}, verified_skills={'verification_score': 1})
+    ])
+    index = IdentityIndex(first)
+
+    later = candidate('b.pdf', text='a much longer resume from the same person', email='Jane@Example.com',
+                      github_username='janedoe')
+    known, reason = index.find(later)
+    assert known is first[0] and reason == 'same email: jane@example.com'
+    merged, _ = deduplicator.merge([known, later], [reason])
+    assert merged['filename'] == 'b.pdf'
+    assert merged['github_data'] == {'repos': 3}
+    assert merged['verified_skills'] == {'verification_score': 1}
+
+    relinked = candidate('c.pdf', email='jane@example.com', github_username='jane-new')
+    again, _ = deduplicator.merge([merged, relinked], ['same email'])
+    assert again['github_username'] == 'jane-new' and 'github_data' not in again
+    assert [m['filename'] for m in again['merged_from']] == ['a.pdf', 'b.pdf']
+    assert index.find(candidate('d.pdf', email='sam@example.com')) is None
+
+
+class Task:
+    """Stand-in pipeline task returning canned results, then its input."""
+
+    def __init__(self, results=None):
+        self.results, self.calls = results, []
+
+    def execute(self, candidates):
+        self.calls.append([c['filename'] for c in candidates])
+        return self.results.pop(0) if self.results else candidates
+
+
+def make_daemon(tmp_path, parsed):
+    from daemon import EvaluationDaemon
+    from utils.metrics import PipelineMetrics
+
+    return EvaluationDaemon(CRITERIA, None, Task([[c] for c in parsed]), Task(), Task(), Task(), PipelineMetrics(),
+                            state_path=str(tmp_path / 'candidates.json.gz'),
+                            processed_path=str(tmp_path / 'processed.json'))
+
+
+def evaluate(daemon, *filenames):
+    for filename in filenames:
+        daemon.candidates.extend(daemon.evaluate_attachments([{'filename': filename, 'message_id': filename}]))
+
+
+def test_daemon_merges_a_later_application_without_enriching_it_again(tmp_path):
+    daemon = make_daemon(tmp_path, [candidate('a.pdf', email='jane@example.com', skills=['Python']),
+                                    candidate('b.pdf', email='jane+again@example.com', skills=['Go'])])
+    evaluate(daemon, 'a.pdf', 'b.pdf')
+
+    assert daemon.analyze_task.calls == [['a.pdf']]
+    [jane] = daemon.candidates
+    assert jane['skills'] == ['Python', 'Go']
+    assert [m['filename'] for m in jane['merged_from']] == ['b.pdf']
+    assert 'needs_enrichment' not in jane
+
+
+def test_daemon_merges_three_applications_one_after_another(tmp_path):
+    daemon = make_daemon(tmp_path, [
+        candidate('a.pdf', text='short', email='jane@old.example', github_username='janedoe'),
+        # Longer resume with a new address: the merged candidate carries this email, not a.pdf's
+        candidate('b.pdf', text='a much longer resume from jane', email='jane@new.example',
+                  github_username='janedoe'),
+        candidate('c.pdf', text='third', email='jane@old.example'),
+    ])
+    evaluate(daemon, 'a.pdf', 'b.pdf', 'c.pdf')
+
+    [jane] = daemon.candidates
+    assert jane['email'] == 'jane@new.example'
+    assert sorted(m['filename'] for m in jane['merged_from']) == ['a.pdf', 'c.pdf']
+    assert daemon.identities.find(candidate('d.pdf', email='jane@old.example'))[0] is jane
+
+
+def test_daemon_matches_by_email_after_restart(tmp_path):
+    from utils.candidate_store import save_candidates
+
+    daemon = make_daemon(tmp_path, [candidate('a.pdf', email='jane@example.com')])
+    evaluate(daemon, 'a.pdf')
+    save_candidates(daemon.candidates, daemon.state_path)
+
+    # Saved candidates have no text, so only email and GitHub username match after a restart
+    restarted = make_daemon(tmp_path, [candidate('b.pdf', email='Jane@example.com'),
+                                       candidate('c.pdf', email='someone@example.com')])
+    assert 'text' not in restarted.candidates[0]
+    evaluate(restarted, 'b.pdf', 'c.pdf')
+    assert sorted(c['filename'] for c in restarted.candidates) == ['b.pdf', 'c.pdf']
+    assert [m['filename'] for m in restarted.candidates[0]['merged_from']] == ['a.pdf']
+    assert restarted.analyze_task.calls == [['c.pdf']]
+
+
+def test_queue_identity_claim_and_fold_duplicates(tmp_path):
+    from worker import fold_duplicates
+
+    queue = SQLiteJobQueue(str(tmp_path / 'jobs.sqlite3'))
+    assert queue.claim_identity(['email:jane@example.com'], 'm1:a.pdf') == 'm1:a.pdf'
+    assert queue.claim_identity(['github:janedoe', 'email:jane@example.com'], 'm2:b.pdf') == 'm1:a.pdf'
+    assert queue.claim_identity(['github:janedoe'], 'm3:c.pdf') == 'm1:a.pdf'
+    assert queue.claim_identity(['email:jane@example.com'], 'm1:a.pdf') == 'm1:a.pdf'
+
+    owner = candidate('a.pdf', message_id='m1', email='jane@example.com', skills=['Python'],
+                      github_data={'repos': 3})
+    duplicate = candidate('b.pdf', message_id='m2', text='short', email='jane@example.com',
+                          github_username='janedoe', skills=['Go'], duplicate_of='m1:a.pdf')
+    orphan = candidate('c.pdf', message_id='m3', email='sam@example.com', duplicate_of='m9:x.pdf')
+    queue.enqueue('score', {})
+    queue.complete(queue.claim('w1'), results={'m1:a.pdf': owner, 'm2:b.pdf': duplicate, 'm3:c.pdf': orphan})
+
+    folded = list(fold_duplicates(queue, CRITERIA))
+    assert [c['filename'] for c in folded] == ['a.pdf', 'c.pdf']
+    jane = folded[0]
+    assert jane['skills'] == ['Python', 'Go'] and jane['github_username'] == 'janedoe'
+    assert jane['needs_enrichment'] and 'duplicate_of' not in jane
+    assert jane['merge_reasons'] == ['a.pdf ~ b.pdf: same email: jane@example.com']
+    assert 'total_score' in jane
@@ -0,0 +1,111 @@
+import io
+import zipfile
+
+import pytest
+
+from src.utils.docx_text import DocxFormatError, extract_docx_text
+from src.utils.parsers import ResumeParser
+from src.utils.profiling import ParseProfiler
+from src.utils.attachment_store import StoredAttachment
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+HYPERLINK = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink'
+
+BODY = (
+    '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Jane Doe</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t xml:space="preserve">Email: </w:t></w:r><w:r><w:t>jane@example.com</w:t></w:r></w:p>'
+    '<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>Skills</w:t></w:r></w:p>'
+    '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc>'
+    '<w:tc><w:p><w:r><w:t>5 years</w:t></w:r></w:p><w:p><w:r><w:t>lead</w:t></w:r></w:p></w:tc></w:tr>'
+    '<w:tr><w:tc><w:p><w:r><w:t>Go</w:t></w:r></w:p></w:tc><w:tc><w:p/></w:tc></w:tr></w:tbl>'
+    '<w:p><w:hyperlink r:id="rId10"><w:r><w:t>github.com/janedoe</w:t></w:r></w:hyperlink></w:p>'
+    '<w:p><w:r><w:t>Experience</w:t><w:tab/><w:t>2019</w:t><w:br/><w:t>Acme</w:t></w:r></w:p>'
+)
+RELS = (f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId10" Type="{HYPERLINK}" Target="https://github.com/janedoe" TargetMode="External"/>'
+        f'</Relationships>')
+
+
+def make_docx(body=BODY):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml',
+                         f'<w:document xmlns:w="{W}" xmlns:r="{R}"><w:body>{body}</w:body></w:document>')
+        archive.writestr('word/_rels/document.xml.rels', RELS)
+    buffer.seek(0)
+    return buffer
+
+
+def test_streams_paragraphs_tables_headings_and_links_in_document_order():
+    headings, links = set(), []
+    text = extract_docx_text(make_docx(), headings=headings, links=links)
+    assert text == (
+        "Jane Doe\n"
+        "Email: jane@example.com\n"
+        "Skills\n"
+        "Python | 5 years\nlead\n"
+        "Go | \n"
+        "github.com/janedoe\n"
+        "Experience\t2019\nAcme\n"
+    )
+    assert headings == {'Jane Doe', 'Skills'}
+    assert links == ['https://github.com/janedoe']
+
+
+def test_max_chars_stops_after_the_paragraph_that_reaches_it():
+    assert extract_docx_text(make_docx(), max_chars=10) == "Jane Doe\nEmail: jane@example.com\n"
+    assert extract_docx_text(make_docx(), max_chars=45) == (
+        "Jane Doe\nEmail: jane@example.com\nSkills\nPython | 5 years\nlead\n"
+    )
+
+
+def test_not_a_docx():
+    with pytest.raises(DocxFormatError):
+        extract_docx_text(io.BytesIO(b'%PDF-1.7'))
+
+
+def test_output_matches_python_docx_fallback():
+    docx = pytest.importorskip('docx')
+    from docx.opc.constants import RELATIONSHIP_TYPE
+    from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement
+
+    document = docx.Document()
+    document.add_heading('Jane Doe', level=1)
+    document.add_paragraph('Email: jane@example.com')
+    document.add_heading('Experience', level=2)
+    document.add_paragraph('Backend engineer at Acme. ' * 40)
+    paragraph = document.add_paragraph()
+    link = OxmlElement('w:hyperlink')
+    link.set(qn('r:id'), document.part.relate_to('https://github.com/janedoe', RELATIONSHIP_TYPE.HYPERLINK,
+                                                 is_external=True))
+    run = OxmlElement('w:r')
+    text = OxmlElement('w:t')
+    text.text = 'github.com/janedoe'
+    run.append(text)
+    link.append(run)
+    paragraph._p.append(link)
+    # Tables last: the fallback appends table text after all paragraphs
+    table = document.add_table(rows=2, cols=2)
+    for row, cells in zip(table.rows, (('Python', '5 years'), ('Go', '2 years'))):
+        for cell, value in zip(row.cells, cells):
+            cell.text = value
+    buffer = io.BytesIO()
+    document.save(buffer)
+    content = StoredAttachment(buffer.getvalue())
+
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False), config={})
+    stream_headings, stream_links = set(), []
+    stream_text, error = parser.extract_from_docx(content, stream_headings, stream_links)
+    fallback_headings, fallback_links = set(), []
+    fallback_text, fallback_error = parser.extract_from_docx_document(content, fallback_headings, fallback_links)
+
+    assert error is None and fallback_error is None
+    assert stream_text == fallback_text
+    assert stream_headings == fallback_headings == {'Jane Doe', 'Experience'}
+    assert stream_links == fallback_links == ['https://github.com/janedoe']
+
+    # Parsing stops once the limit is reached; everything before it is the same text
+    limited = extract_docx_text(io.BytesIO(buffer.getvalue()), max_chars=100)
+    assert fallback_text.startswith(limited) and len(limited) < len(fallback_text)
@@ -0,0 +1,49 @@
+import pytest
+
+from src.utils.gmail_query import build_gmail_query, resolve_gmail_query, resolve_max_results
+
+
+def test_query_from_representative_config():
+    query = build_gmail_query({
+        'subject_keywords': ['Resume', 'CV', 'Job Application'],
+        'exclude_keywords': ['newsletter', 'Out of office'],
+        'attachment_types': ['pdf', '.DOCX', 'doc', 'txt'],
+        'search_timeframe': '30D',
+        'min_attachment_size': 1024,
+        'max_attachment_size': 3 * 1024 * 1024,
+    })
+    assert query == (
+        '{subject:Resume subject:CV subject:"Job Application"} -subject:newsletter -subject:"Out of office" '
+        'has:attachment {filename:pdf filename:docx} newer_than:30d larger:1024 smaller:4259840'
+    )
+
+
+def test_single_terms_are_not_grouped_and_empty_settings_are_skipped():
+    assert build_gmail_query({'subject_keywords': ['Resume', ' '], 'attachment_types': ['pdf']}) == \
+        'subject:Resume has:attachment filename:pdf'
+    assert build_gmail_query({}) == 'has:attachment {filename:pdf filename:docx}'
+    assert build_gmail_query({'attachment_types': ['txt']}) == 'has:attachment'
+
+
+def test_max_attachment_size_allows_for_base64_and_headers():
+    # 4/3 of 3000 bytes plus 64KB of headers and MIME boundaries
+    assert build_gmail_query({'max_attachment_size': 3000}).endswith('smaller:69536')
+    assert build_gmail_query({'max_attachment_size': 1000}).endswith('smaller:66870')
+
+
+def test_invalid_timeframe_is_rejected():
+    with pytest.raises(ValueError, match='search_timeframe'):
+        build_gmail_query({'search_timeframe': '30 days'})
+
+
+def test_query_source_and_max_results():
+    recruiter = {'email_search': {'subject_keywords': ['CV'], 'max_results': 50}}
+    config = {'gmail': {'query': 'label:jobs', 'max_results': 10}, 'recruiter': recruiter}
+    assert resolve_gmail_query(config) == 'subject:CV has:attachment {filename:pdf filename:docx}'
+    assert resolve_max_results(config) == 50
+
+    config['gmail']['query_source'] = 'static'
+    assert resolve_gmail_query(config) == 'label:jobs'
+    assert resolve_max_results(config) == 10
+
+    assert resolve_max_results({'gmail': {'max_results': 10}, 'recruiter': {'email_search': {}}}) == 10
@@ -0,0 +1,93 @@
+import time
+
+from src.utils.job_queue import SQLiteJobQueue
+
+
+def make_queue(tmp_path, **options):
+    return SQLiteJobQueue(str(tmp_path / 'jobs.sqlite3'), **options)
+
+
+def test_claims_highest_priority_first_and_only_once(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.enqueue('fetch', {'message_id': 'a'}, priority=0)
+    queue.enqueue('score', {'message_id': 'b'}, priority=3)
+
+    job = queue.claim('w1')
+    assert (job.kind, job.payload, job.attempts) == ('score', {'message_id': 'b'}, 1)
+    assert queue.claim('w2', kinds=['score']) is None
+    assert queue.claim('w2').kind == 'fetch'
+    assert queue.claim('w3') is None
+
+
+def test_dedupe_key_ignores_repeated_jobs(tmp_path):
+    queue = make_queue(tmp_path)
+    assert queue.enqueue('fetch', {'message_id': 'a'}, dedupe_key='fetch:a') is not None
+    assert queue.enqueue('fetch', {'message_id': 'a'}, dedupe_key='fetch:a') is None
+
+    job = queue.claim('w1')
+    assert queue.complete(job, [('parse', {'n': 1}, 'parse:a', 1), ('parse', {'n': 2}, 'parse:a', 1)])
+    assert queue.stats() == {'fetch': {'done': 1}, 'parse': {'pending': 1}}
+
+
+def test_expired_lease_is_claimed_again_and_old_owner_cannot_complete(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05)
+    queue.enqueue('parse', {'n': 1})
+    first = queue.claim('w1')
+    assert queue.claim('w2') is None
+
+    time.sleep(0.1)
+    second = queue.claim('w2')
+    assert second.id == first.id and second.attempts == 2
+    assert not queue.extend_lease(first)
+    assert not queue.complete(first, results={'k': {'owner': 'w1'}})
+    assert queue.complete(second, results={'k': {'owner': 'w2'}})
+    assert list(queue.iter_results()) == [{'owner': 'w2'}]
+
+
+def test_extend_lease_keeps_job_from_other_workers(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.2)
+    queue.enqueue('enrich', {'n': 1})
+    job = queue.claim('w1')
+
+    for _ in range(3):
+        time.sleep(0.1)
+        assert queue.extend_lease(job)
+    assert queue.claim('w2') is None
+    assert queue.complete(job)
+
+
+def test_failed_job_is_retried_after_backoff_then_given_up(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2, retry_backoff=0.05)
+    queue.enqueue('parse', {'n': 1})
+
+    job = queue.claim('w1')
+    assert queue.fail(job, 'RuntimeError: first')
+    assert queue.claim('w1') is None
+    time.sleep(0.1)
+    job = queue.claim('w1')
+    assert job.attempts == 2
+    assert not queue.fail(job, 'RuntimeError: second')
+    time.sleep(0.15)
+    assert queue.claim('w1') is None
+    assert queue.failed_jobs() == [{'id': job.id, 'kind': 'parse', 'attempts': 2, 'error': 'RuntimeError: second'}]
+
+
+def test_worker_renews_lease_while_handler_runs(tmp_path):
+    from utils.metrics import PipelineMetrics
+    from worker import PipelineWorker
+
+    queue = make_queue(tmp_path, lease_seconds=0.15)
+    queue.enqueue('parse', {'n': 1})
+    worker = PipelineWorker(queue, {}, None, None, None, None, None, PipelineMetrics(), worker_id='w1')
+    claimed_by_others = []
+
+    def slow_parse(payload):
+        for _ in range(4):
+            time.sleep(0.1)
+            claimed_by_others.append(queue.claim('w2'))
+        return [], {'k': payload}
+
+    worker.handlers['parse'] = slow_parse
+    assert worker.run_one()
+    assert claimed_by_others == [None] * 4
+    assert list(queue.iter_results()) == [{'n': 1}]
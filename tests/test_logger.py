@@ -0,0 +1,19 @@
+import json
+
+from src.utils.logger import StructuredLogger, shutdown_log_writers
+
+
+def test_records_logged_after_shutdown_are_written_synchronously(tmp_path):
+    performance_log = tmp_path / 'performance.log'
+    logger = StructuredLogger('test-shutdown', {
+        'main_log': str(tmp_path / 'app.log'),
+        'error_log': str(tmp_path / 'errors.log'),
+        'performance_log': str(performance_log),
+    })
+    logger.log_performance('before', 0.5)
+    shutdown_log_writers()
+    logger.log_performance('after', 0.25)
+
+    operations = [json.loads(line)['operation'] for line in performance_log.read_text().splitlines()]
+    assert operations == ['before', 'after']
+    assert logger._performance_writer.flush()
@@ -0,0 +1,80 @@
+import sys
+
+import pytest
+
+from src.utils.attachment_store import StoredAttachment
+from src.utils.ocr import PageOCR
+from src.utils.parsers import ResumeParser
+from src.utils.profiling import ParseProfiler
+
+
+class Recorder:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message, *args):
+        self.warnings.append(message % args)
+
+
+def test_enabled_but_unavailable_ocr_warns_once(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pytesseract', None)
+    ocr = PageOCR({'ocr': {'enabled': True}})
+    ocr.logger = Recorder()
+
+    assert not ocr.available() and not ocr.available()
+    assert len(ocr.logger.warnings) == 1
+
+    disabled = PageOCR({'ocr': {'enabled': False}})
+    disabled.logger = Recorder()
+    assert not disabled.available() and not disabled.logger.warnings
+
+
+class FakeOCR:
+    def __init__(self, available=True):
+        self.is_available = available
+        self.calls = []
+
+    def available(self):
+        return self.is_available
+
+    def recognize(self, doc, page_numbers):
+        self.calls.append(list(page_numbers))
+        return {number: f"Scanned page {number + 1}\n" for number in page_numbers}
+
+
+def make_pdf(*pages):
+    """PDF with one page per argument; None makes a page without a text layer."""
+    fitz = pytest.importorskip('fitz')
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return StoredAttachment(data)
+
+
+@pytest.mark.parametrize('available', [True, False])
+def test_only_textless_pages_fall_back_to_ocr(available):
+    content = make_pdf('Jane Doe, Python developer', None, 'Education: Master', None)
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False), config={})
+    parser.ocr = FakeOCR(available)
+
+    text, error = parser.extract_from_pdf(content, set(), [])
+
+    assert error is None
+    assert 'Jane Doe, Python developer' in text and 'Education: Master' in text
+    if available:
+        assert parser.ocr.calls == [[1, 3]]
+        assert 'Scanned page 2' in text and 'Scanned page 4' in text
+        assert text.index('Scanned page 2') < text.index('Education: Master')
+    else:
+        assert parser.ocr.calls == [] and 'Scanned' not in text
+
+
+def test_scanned_pdf_without_ocr_has_no_text():
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False), config={})
+    parser.ocr = FakeOCR(available=False)
+
+    assert parser.extract_from_pdf(make_pdf(None), set(), []) == ("", "No text extracted from PDF")
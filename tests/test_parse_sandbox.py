@@ -0,0 +1,45 @@
+import multiprocessing
+
+from src.utils.parse_sandbox import SandboxedParser
+from test_profile_links import make_docx
+
+
+def parse_without_closing():
+    parser = SandboxedParser({})
+    result = parser.parse_resume('jane.docx', make_docx(['jane@example.com']))
+    assert result['email'] == 'jane@example.com'
+
+
+def test_parses_in_worker_process():
+    parser = SandboxedParser({})
+    try:
+        result = parser.parse_resume('jane.docx', make_docx(['jane@example.com', 'Skills', 'Python']))
+    finally:
+        parser.close()
+    assert result['error'] is None
+    assert result['skills'] == ['Python']
+
+
+def test_timeout_returns_parse_error_and_restarts_worker():
+    parser = SandboxedParser({'parsing': {'timeout': 0.001}})
+    try:
+        # Starting the worker alone takes longer than the budget
+        result = parser.parse_resume('slow.docx', make_docx(['jane@example.com']))
+        assert result['parse_error']['type'] == 'timeout'
+        assert 'timed out' in result['error']
+        parser.timeout = 30
+        assert parser.parse_resume('jane.docx', make_docx(['jane@example.com']))['email'] == 'jane@example.com'
+    finally:
+        parser.close()
+
+
+def test_multiprocessing_child_exits_without_close():
+    # A non-daemon parser process must not keep a multiprocessing child (queue worker) alive
+    process = multiprocessing.get_context('spawn').Process(target=parse_without_closing)
+    process.start()
+    process.join(30)
+    alive = process.is_alive()
+    if alive:
+        process.kill()
+    assert not alive
+    assert process.exitcode == 0
@@ -0,0 +1,14 @@
+from src.utils.parsers import parser_version
+
+
+def test_parser_version_ignores_skills_unless_screening_reads_them():
+    config = {'parsing': {'max_pages': 5}, 'skills': {'required': ['Python'], 'preferred': ['Go']}}
+    version = parser_version(config)
+
+    assert parser_version({**config, 'skills': {'required': ['Rust'], 'bonus': ['Go']}}) == version
+    assert parser_version({**config, 'parsing': {'max_pages': 6}}) != version
+
+    screened = {**config, 'screening': {'enabled': True}}
+    assert parser_version({**screened, 'skills': {'required': ['Python'], 'bonus': ['Go']}}) == \
+        parser_version(screened)
+    assert parser_version({**screened, 'skills': {'required': ['Rust']}}) != parser_version(screened)
@@ -0,0 +1,87 @@
+import io
+import zipfile
+
+from src.utils.parsers import ResumeParser
+from src.utils.profiling import ParseProfiler
+from src.utils.profile_links import classify_links, text_urls
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+HYPERLINK = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink'
+
+
+def make_docx(paragraphs, hyperlinks=()):
+    """DOCX whose paragraphs are plain text, followed by one paragraph per hyperlink target."""
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    body += ''.join(
+        f'<w:p><w:hyperlink r:id="rId{i}"><w:r><w:t>link</w:t></w:r></w:hyperlink></w:p>'
+        for i, _ in enumerate(hyperlinks, start=10)
+    )
+    rels = ''.join(
+        f'<Relationship Id="rId{i}" Type="{HYPERLINK}" Target="{target}" TargetMode="External"/>'
+        for i, target in enumerate(hyperlinks, start=10)
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml',
+                         f'<w:document xmlns:w="{W}" xmlns:r="{R}"><w:body>{body}</w:body></w:document>')
+        archive.writestr('word/_rels/document.xml.rels',
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         f'{rels}</Relationships>')
+    return buffer.getvalue()
+
+
+def parse(filename, content):
+    return ResumeParser(profiler=ParseProfiler(enabled=False), config={}).parse_resume(filename, content)
+
+
+def test_text_urls_are_classified():
+    text = ("Code: github.com/octocat, profile www.linkedin.com/in/Octo-Cat. "
+            "Site: https://octocat.github.io/blog. See also https://github.com/features")
+    assert classify_links(text_urls(text)) == {
+        'github_username': 'octocat',
+        'linkedin_url': 'https://www.linkedin.com/in/octo-cat',
+        'portfolio_url': 'https://octocat.github.io/blog',
+    }
+
+
+def test_non_profile_links_are_skipped():
+    links = ['mailto:jane@example.com', 'https://github.com/orgs/acme', 'https://twitter.com/jane',
+             'https://www.linkedin.com/company/acme', 'http://example.org/jane']
+    assert classify_links(links) == {
+        'github_username': None,
+        'linkedin_url': None,
+        'portfolio_url': 'http://example.org/jane',
+    }
+
+
+def test_malformed_urls_are_skipped():
+    assert classify_links(['http://[foo/bar']) == {
+        'github_username': None, 'linkedin_url': None, 'portfolio_url': None,
+    }
+    placeholder = text_urls('Portfolio: https://[your-site].com and github.com/jane')
+    assert classify_links(placeholder)['github_username'] == 'jane'
+
+
+def test_docx_hyperlinks_come_before_text_urls():
+    content = make_docx(
+        ['Jane Doe jane@example.com', 'Old profile: github.com/someone-else'],
+        hyperlinks=['https://www.linkedin.com/in/jane-doe/', 'https://github.com/JaneDoe', 'https://jane.dev'],
+    )
+    result = parse('jane.docx', content)
+    assert result['error'] is None
+    assert result['github_username'] == 'janedoe'
+    assert result['linkedin_url'] == 'https://www.linkedin.com/in/jane-doe'
+    assert result['portfolio_url'] == 'https://jane.dev'
+
+
+def test_malformed_document_link_does_not_fail_the_resume():
+    content = make_docx(
+        ['Jane Doe jane@example.com', 'Portfolio: https://[your-site].com'],
+        hyperlinks=['http://[foo/bar', 'https://github.com/janedoe'],
+    )
+    result = parse('jane.docx', content)
+    assert result['error'] is None
+    assert result['email'] == 'jane@example.com'
+    assert result['github_username'] == 'janedoe'
+    assert result['portfolio_url'] is None
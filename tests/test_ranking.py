@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.utils.ranking import CandidateRanker, rank_key
+
+
+def make_candidates(count, seed=7):
+    rng = random.Random(seed)
+    # Few distinct totals so ties on the primary score are common
+    return [
+        {'email': f"c{i:03d}@example.com", 'filename': f"c{i:03d}.pdf", 'total_score': rng.choice([50, 60, 70]),
+         'skills_score': rng.choice([1, 2]), 'github_score': rng.random()}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize('top_k', [5, 40, 100])
+def test_top_equals_full_sort(top_k):
+    candidates = make_candidates(40)
+    ranker = CandidateRanker(top_k=top_k, keep_all=False)
+    ranker.add_all(candidates)
+
+    assert ranker.top() == sorted(candidates, key=rank_key)[:top_k]
+    assert len(ranker) == 40
+
+
+def test_ties_break_on_secondary_scores_then_email_then_filename():
+    candidates = [
+        {'email': 'b@example.com', 'filename': 'b2.pdf', 'total_score': 80, 'skills_score': 10},
+        {'email': 'b@example.com', 'filename': 'b1.pdf', 'total_score': 80, 'skills_score': 10},
+        {'email': 'a@example.com', 'filename': 'z.pdf', 'total_score': 80, 'skills_score': 10},
+        {'email': 'z@example.com', 'filename': 'a.pdf', 'total_score': 80, 'skills_score': 20},
+        {'email': 'y@example.com', 'filename': 'y.pdf', 'total_score': 80, 'skills_score': 10,
+         'github_score': 5},
+        {'email': 'x@example.com', 'filename': 'x.pdf', 'total_score': 90},
+    ]
+    expected = ['x.pdf', 'a.pdf', 'y.pdf', 'z.pdf', 'b1.pdf', 'b2.pdf']
+    for order in (candidates, candidates[::-1]):
+        ranker = CandidateRanker(top_k=4)
+        ranker.add_all(order)
+        assert [c['filename'] for c in ranker.top()] == expected[:4]
+        assert [c['filename'] for c in ranker.ranked()] == expected
+
+
+def test_keep_all_ranks_every_candidate():
+    candidates = make_candidates(25)
+    ranker = CandidateRanker(top_k=3)
+    ranker.add_all(candidates[:20])
+    assert ranker.ranked() == sorted(candidates[:20], key=rank_key)
+
+    ranker.add_all(candidates[20:])
+    assert ranker.ranked() == sorted(candidates, key=rank_key)
+    assert ranker.top() == ranker.ranked()[:3]
+
+
+def test_ranked_requires_keep_all_and_top_k_zero_keeps_no_heap():
+    ranker = CandidateRanker(top_k=0, keep_all=False)
+    ranker.add_all(make_candidates(3))
+    assert ranker.top() == []
+    with pytest.raises(ValueError):
+        ranker.ranked()
@@ -0,0 +1,95 @@
+import io
+import zipfile
+
+from src.utils.parsers import ResumeParser
+from src.utils.profiling import ParseProfiler
+from src.utils.sections import (
+    EDUCATION_SECTIONS, EXPERIENCE_SECTIONS, SKILL_SECTIONS, heading_section, segment_text, select
+)
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+RESUME = """Jane Doe
+jane@example.com
+SUMMARY
+Backend engineer who mentors Bachelor students in Java.
+EDUCATION
+Master of Science, 2 years experience as a research assistant
+Work Experience
+5 years of experience building Python services
+TECHNICAL SKILLS:
+Python, Go, PostgreSQL
+"""
+
+
+def make_docx(lines):
+    body = ''.join(f'<w:p><w:r><w:t>{line}</w:t></w:r></w:p>' for line in lines)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+    return buffer.getvalue()
+
+
+def parse(lines):
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False), config={})
+    return parser.parse_resume('resume.docx', make_docx(lines))
+
+
+def test_heading_section():
+    assert heading_section('TECHNICAL SKILLS:') == 'skills'
+    assert heading_section('E D U C A T I O N') == 'education'
+    assert heading_section('Experience & Leadership') is None
+    assert heading_section('Experience & Leadership', set_apart=True) == 'experience'
+    assert heading_section('5 years of experience building Python services', set_apart=True) is None
+
+
+def test_segment_text_splits_on_headings():
+    sections = segment_text(RESUME)
+
+    assert sections['header'] == 'Jane Doe\njane@example.com'
+    assert sections['education'] == 'Master of Science, 2 years experience as a research assistant'
+    assert sections['experience'] == '5 years of experience building Python services'
+    assert sections['skills'] == 'Python, Go, PostgreSQL'
+    assert select(sections, SKILL_SECTIONS) == 'Python, Go, PostgreSQL'
+    assert select(sections, EXPERIENCE_SECTIONS).splitlines() == [
+        'Jane Doe', 'jane@example.com', 'Backend engineer who mentors Bachelor students in Java.',
+        '5 years of experience building Python services',
+    ]
+
+
+def test_segment_text_without_headings_keeps_everything_in_the_header():
+    text = 'Jane Doe\nPython and Go developer with 4 years experience\nBachelor of Engineering'
+    sections = segment_text(text)
+
+    assert sections == {'header': text}
+    assert select(sections, SKILL_SECTIONS) == '' and select(sections, EDUCATION_SECTIONS) == ''
+
+
+def test_parse_reads_each_field_from_its_section():
+    resume = parse(RESUME.splitlines())
+
+    # Java and Bachelor only appear outside the skills and education sections
+    assert resume['skills'] == ['Python', 'Go', 'SQL', 'PostgreSQL']
+    assert resume['education'] == 'Master'
+    # The education section's "2 years experience" comes first but is not read for experience
+    assert resume['experience_years'] == 5
+    assert resume['email'] == 'jane@example.com'
+
+
+def test_parse_falls_back_to_the_whole_text_without_headings():
+    resume = parse(['Jane Doe', 'Python and Java developer with 4 years experience', 'Bachelor of Engineering'])
+
+    assert resume['skills'] == ['Python', 'Java']
+    assert resume['experience_years'] == 4
+    assert resume['education'] == 'Bachelor'
+
+
+def test_experience_number_must_be_near_experience():
+    parser = ResumeParser(profiler=ParseProfiler(enabled=False), config={})
+
+    assert parser.extract_experience('Experience: nearly 7 years at Acme') == 7
+    assert parser.extract_experience(
+        'Experience\nAcme Corp, where I led the platform team and shipped billing over 3 years'
+    ) == 0
+    # A heading is not paired with a number several lines further down
+    assert parser.extract_experience('EXPERIENCE\nAcme Corp, Berlin, since 2015\nVolunteered 2 years abroad') == 0